@@ -0,0 +1,265 @@
+"""Controle d'admission des calculs de triangulation (delestage).
+
+Chaque calcul a un cout estime (nombre de points). Le controleur borne la
+somme des couts en cours; au-dela, les requetes attendent dans une file
+courte. File pleine ou attente trop longue: la requete est refusee avec
+une estimation du delai avant nouvel essai (Retry-After).
+
+La file est equitable entre clients (weighted fair queueing): chaque
+requete recoit une etiquette de fin virtuelle, debut + cout / poids, ou
+debut est le plus tard entre le temps virtuel courant et la fin de la
+requete precedente du meme client. La plus petite etiquette passe en
+premier: une petite requete d'un client peu actif double l'arriere d'un
+client qui soumet de gros calculs, qui utilise le reste de la capacite.
+Pour un client unique, l'ordre reste celui d'arrivee.
+
+Configuration:
+- TRIANGULATOR_ADMISSION_BUDGET: cout total simultane en points
+  (defaut: 4000000, 0 = pas de controle)
+- TRIANGULATOR_ADMISSION_QUEUE: requetes en attente au plus (defaut: 32)
+- TRIANGULATOR_ADMISSION_CLIENT_QUEUE: requetes en attente au plus pour
+  un meme client (defaut: TRIANGULATOR_ADMISSION_QUEUE)
+- TRIANGULATOR_ADMISSION_TIMEOUT: attente maximale en secondes (defaut: 2)
+- TRIANGULATOR_CLIENT_WEIGHTS: poids par client, "client=poids,..."
+  (defaut: 1 pour tous)
+"""
+
+import heapq
+import itertools
+import math
+import os
+import struct
+import threading
+import time
+
+
+class Overloaded(Exception):
+    """Budget epuise: la requete est refusee."""
+
+    def __init__(self, reason: str, retry_after: int) -> None:
+        """Record why the request was shed.
+
+        Args:
+            reason: "queue_full" ou "timeout"
+            retry_after: Delai conseille avant nouvel essai (secondes)
+
+        """
+        super().__init__(f"Service surcharge ({reason}), reessayer dans {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def estimate_cost(raw) -> int:
+    """Cout d'un PointSet binaire: son nombre de points (lu dans l'en-tete)."""
+    if len(raw) < 4:
+        return 1
+    return max(1, struct.unpack_from("<I", raw, 0)[0])
+
+
+class AdmissionController:
+    """Budget de cout borne avec file d'attente courte, equitable par client."""
+
+    # Au-dela, les fins virtuelles depassees sont oubliees
+    _MAX_TRACKED_CLIENTS = 1024
+
+    def __init__(
+        self,
+        budget: int,
+        max_queue: int = 32,
+        timeout: float = 2.0,
+        clock=time.monotonic,
+        weights: dict | None = None,
+        max_queue_per_client: int | None = None,
+    ) -> None:
+        """Configure the controller.
+
+        Args:
+            budget: Somme maximale des couts en cours
+            max_queue: Nombre maximal de requetes en attente
+            timeout: Attente maximale d'une requete (secondes)
+            clock: Horloge monotone (injectable pour les tests)
+            weights: Poids par client (defaut: 1)
+            max_queue_per_client: Requetes en attente au plus par client
+                (defaut: max_queue)
+
+        """
+        self.budget = budget
+        self.max_queue = max_queue
+        self.max_queue_per_client = (
+            max_queue if max_queue_per_client is None else max_queue_per_client
+        )
+        self.timeout = timeout
+        self.weights = dict(weights or {})
+        self._clock = clock
+        self._cond = threading.Condition()
+        # Tas de [fin virtuelle, rang d'arrivee, debut virtuel, client]
+        self._waiting: list = []
+        self._queued: dict = {}
+        self._order = itertools.count()
+        self._vtime = 0.0
+        self._finish: dict = {}
+        self._inflight = 0
+        # Moyenne glissante du temps de service par unite de cout
+        self._seconds_per_unit = 0.0
+        self.admitted = 0
+        self.rejected = 0
+
+    def acquire(self, cost: int, client: str = "") -> tuple:
+        """Reserver cost unites de budget, en attendant si necessaire.
+
+        Un cout superieur au budget est ramene au budget: la requete passe
+        seule plutot que jamais.
+
+        Args:
+            cost: Cout estime du calcul
+            client: Identifiant du client (file equitable)
+
+        Returns:
+            Jeton a passer a release()
+
+        Raises:
+            Overloaded: Si la file est pleine ou l'attente trop longue
+
+        """
+        cost = min(max(1, cost), self.budget)
+        with self._cond:
+            start, finish = self._tag(client, cost)
+            if not self._waiting and self._inflight + cost <= self.budget:
+                return self._admit(cost, start)
+            if (
+                len(self._waiting) >= self.max_queue
+                or self._queued.get(client, 0) >= self.max_queue_per_client
+            ):
+                self._refund(client, start, finish)
+                self.rejected += 1
+                raise Overloaded("queue_full", self._retry_after(cost))
+            entry = [finish, next(self._order), start, client]
+            heapq.heappush(self._waiting, entry)
+            self._queued[client] = self._queued.get(client, 0) + 1
+            deadline = self._clock() + self.timeout
+            admitted = False
+            try:
+                while not (
+                    self._waiting[0] is entry
+                    and self._inflight + cost <= self.budget
+                ):
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        self.rejected += 1
+                        raise Overloaded("timeout", self._retry_after(cost))
+                    self._cond.wait(remaining)
+                admitted = True
+            finally:
+                self._dequeue(entry)
+                if not admitted:
+                    self._refund(client, start, finish)
+                # La tete de file a change: reveiller les suivants
+                self._cond.notify_all()
+            return self._admit(cost, start)
+
+    def _tag(self, client: str, cost: int) -> tuple[float, float]:
+        """Etiquettes virtuelles (debut, fin) d'une requete (verrou tenu)."""
+        if len(self._finish) > self._MAX_TRACKED_CLIENTS:
+            self._finish = {
+                c: f for c, f in self._finish.items() if f > self._vtime
+            }
+        start = max(self._vtime, self._finish.get(client, 0.0))
+        finish = start + cost / self.weights.get(client, 1.0)
+        self._finish[client] = finish
+        return start, finish
+
+    def _refund(self, client: str, start: float, finish: float) -> None:
+        """Annuler l'etiquette d'une requete refusee (verrou tenu)."""
+        if self._finish.get(client) == finish:
+            self._finish[client] = start
+
+    def _dequeue(self, entry: list) -> None:
+        """Retirer une requete de la file (verrou tenu)."""
+        if self._waiting[0] is entry:
+            heapq.heappop(self._waiting)
+        else:
+            self._waiting.remove(entry)
+            heapq.heapify(self._waiting)
+        client = entry[3]
+        self._queued[client] -= 1
+        if not self._queued[client]:
+            del self._queued[client]
+
+    def _admit(self, cost: int, start: float) -> tuple:
+        """Comptabiliser une admission (verrou tenu)."""
+        self._vtime = max(self._vtime, start)
+        self._inflight += cost
+        self.admitted += 1
+        return cost, self._clock()
+
+    def release(self, token: tuple) -> None:
+        """Rendre le budget d'un calcul termine et mettre a jour l'estimation."""
+        cost, started = token
+        elapsed = self._clock() - started
+        with self._cond:
+            self._inflight -= cost
+            sample = elapsed / cost
+            if self._seconds_per_unit == 0.0:
+                self._seconds_per_unit = sample
+            else:
+                self._seconds_per_unit += 0.2 * (sample - self._seconds_per_unit)
+            self._cond.notify_all()
+
+    def _retry_after(self, cost: int) -> int:
+        """Delai estime pour ecouler le travail en cours (verrou tenu)."""
+        queued = len(self._waiting) * cost
+        seconds = (self._inflight + queued) * self._seconds_per_unit
+        return max(1, math.ceil(seconds))
+
+    def stats(self) -> dict:
+        """Etat courant: budget, cout en cours, file, compteurs."""
+        with self._cond:
+            return {
+                "budget": self.budget,
+                "inflight": self._inflight,
+                "queued": len(self._waiting),
+                "queued_clients": len(self._queued),
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+            }
+
+
+def parse_weights(text: str) -> dict:
+    """Parser des poids "client=poids,..." en dictionnaire.
+
+    Raises:
+        ValueError: Si un element est mal forme ou un poids non positif
+
+    """
+    weights = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        client, sep, weight = item.rpartition("=")
+        if not sep or not client or float(weight) <= 0:
+            raise ValueError(f"Poids de client invalide: {item}")
+        weights[client] = float(weight)
+    return weights
+
+
+def admission_from_env() -> AdmissionController | None:
+    """Construire le controleur depuis l'environnement (None si desactive)."""
+    budget = int(os.environ.get("TRIANGULATOR_ADMISSION_BUDGET", "4000000"))
+    if budget <= 0:
+        return None
+    max_queue = int(os.environ.get("TRIANGULATOR_ADMISSION_QUEUE", "32"))
+    per_client = os.environ.get("TRIANGULATOR_ADMISSION_CLIENT_QUEUE")
+    return AdmissionController(
+        budget,
+        max_queue=max_queue,
+        timeout=float(os.environ.get("TRIANGULATOR_ADMISSION_TIMEOUT", "2")),
+        weights=parse_weights(os.environ.get("TRIANGULATOR_CLIENT_WEIGHTS", "")),
+        max_queue_per_client=int(per_client) if per_client else None,
+    )
+
+
+__all__ = [
+    "AdmissionController",
+    "Overloaded",
+    "admission_from_env",
+    "estimate_cost",
+    "parse_weights",
+]
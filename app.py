@@ -3,57 +3,262 @@
 Endpoints:
 - POST /pointset: enregistrer un ensemble de points (binaire) -> retourne PointSetID
 - GET /triangulation/{pointSetId}: calculer triangulation -> retourne binaire
+  (format standard ou compact selon Accept, compresse selon Accept-Encoding)
+- GET /triangulation/{pointSetId}/delta?base={id}: delta depuis la
+  triangulation d'un autre PointSet deja detenue par le client
 - GET /healthz: verification de sante
+- GET /store/stats: occupation et compteurs du stockage
+- GET /metrics: metriques au format texte Prometheus
+- GET /debug/memory: octets du tas par sous-systeme et pics d'allocation
+  par requete et par etape (TRIANGULATOR_MEMORY_TRACKING=1, voir
+  memory_accounting.py)
+
+Point d'entree: create_app() construit l'application Flask. L'import du
+module ne la construit pas; `from app import app` (ou gunicorn "app:app")
+la cree au premier acces. L'etat (store, metriques, admission) est celui
+du module, partage par les applications d'un meme processus.
+
+Configuration du demarrage:
+- TRIANGULATOR_WARMUP_DIR: repertoire d'un store disque recopie en tache
+  de fond dans le store du service (PointSets et resultats deja calcules)
+- TRIANGULATOR_SNAPSHOT_PATH: snapshot du store en memoire, restaure au
+  demarrage (mmap, lecture a la demande) et reecrit periodiquement et a
+  l'arret (voir snapshot.py)
+- TRIANGULATOR_SNAPSHOT_INTERVAL: periode d'ecriture du snapshot (defaut:
+  300 secondes, 0 = a l'arret seulement)
+
+Partage equitable du calcul (voir admission.py):
+- TRIANGULATOR_CLIENT_HEADER: en-tete identifiant le client (defaut:
+  X-Client-Id; adresse IP de la connexion si absent)
+
+Mode ?algorithm=auto (voir cost_model.py):
+- TRIANGULATOR_POOL_WORKERS: processus du pool de calcul (defaut: 0 =
+  toujours dans le thread de la requete)
+- TRIANGULATOR_POOL_MIN_SECONDS: duree predite minimale d'un calcul
+  envoye au pool (defaut: 0.05)
+- TRIANGULATOR_BENCH_BASELINE: reference de triangulator_bench contenant
+  le modele de cout calibre (defaut: .benchmarks/baseline.json)
 
 Tous les commentaires et messages en francais.
 """
 
+import atexit
+import hashlib
 import logging
-import struct
+import math
+import os
+import threading
+import time
 import uuid as _uuid
+from contextlib import contextmanager
 
-from flask import Flask, Response, jsonify, request
+from flask import Blueprint, Flask, Response, g, jsonify, request, send_file
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
 
-from triangulator_core import compute_triangulation, serialize_triangulation
+import metrics
+from admission import Overloaded, admission_from_env, estimate_cost
+from compression import ENCODINGS, compress, compression_min_bytes
+from cost_model import CostModel, load_cost_model
+from memory_accounting import memory_tracker_from_env
+from pointset_store import DiskStore, create_store
+from profiling import sampler_from_env
+from psm_client import PointSetManagerError, psm_client_from_env
+from snapshot import SnapshotStore, SnapshotWriter, load_snapshot
+from triangulator_core import (
+    ALGORITHM_VERSION,
+    ALGORITHMS,
+    LOD_OVERSAMPLE,
+    MIN_SNAP_TOLERANCE,
+    SnapToleranceError,
+    adjacency_section,
+    compute_triangulation,
+    decimate_pointset,
+    parse_pointset,
+    select_lod_level,
+    serialize_triangulation,
+    snap_points,
+    to_compact,
+    triangulate_binary,
+    triangulation_delta,
+    vertex_map_section,
+)
 
-app = Flask(__name__)
+# Routes et hooks du service, enregistres par create_app()
+routes = Blueprint("triangulator", __name__)
 logger = logging.getLogger(__name__)
 
-# Stockage en memoire des PointSets (cle = PointSetID string)
-_POINTSETS: dict = {}
+# Stockage des PointSets et des resultats (cle = PointSetID string)
+# Backend choisi par TRIANGULATOR_STORE / TRIANGULATOR_STORE_DIR
+_POINTSETS = create_store()
 
+MIMETYPE_TRIANGLES = "application/octet-stream"
+MIMETYPE_COMPACT = "application/vnd.triangulator.compact"
+MIMETYPE_COMPACT_Q16 = "application/vnd.triangulator.compact-q16"
+MIMETYPE_DELTA = "application/vnd.triangulator.delta"
 
-def _parse_pointset_binary(data: bytes) -> list[tuple[float, float]]:
-    """Parser le format binaire d'un PointSet.
+# Formats negociables (Accept) -> suffixe de la cle de cache du resultat
+_REPRESENTATIONS = {
+    MIMETYPE_TRIANGLES: "",
+    MIMETYPE_COMPACT: "compact",
+    MIMETYPE_COMPACT_Q16: "compact-q16",
+}
 
-    Format:
-    - 4 bytes (uint32 LE): N = nombre de points
-    - N x 8 bytes: (float32 x, float32 y) pour chaque point
+# Metriques exposees par GET /metrics
+_METRICS = metrics.Registry()
+_REQUESTS = _METRICS.register(metrics.Counter(
+    "triangulator_http_requests_total",
+    "Requetes HTTP par endpoint, methode et statut.",
+    ("endpoint", "method", "status"),
+))
+_REQUEST_SECONDS = _METRICS.register(metrics.Histogram(
+    "triangulator_http_request_seconds",
+    "Duree totale des requetes HTTP par endpoint.",
+    ("endpoint",),
+))
+_STAGE_SECONDS = _METRICS.register(metrics.Histogram(
+    "triangulator_stage_seconds",
+    "Duree des etapes de GET /triangulation.",
+    ("stage",),
+))
+_PAYLOAD_BYTES = _METRICS.register(metrics.Histogram(
+    "triangulator_payload_bytes",
+    "Taille des corps de requete (in) et de reponse (out).",
+    ("endpoint", "direction"),
+    buckets=metrics.SIZE_BUCKETS,
+))
+_METRICS.register(metrics.Gauge(
+    "triangulator_store_bytes",
+    "Octets occupes par le stockage.",
+    lambda: _POINTSETS.stats()["bytes"],
+))
+_METRICS.register(metrics.Gauge(
+    "triangulator_store_pointsets",
+    "Nombre de PointSets stockes.",
+    lambda: _POINTSETS.stats()["pointsets"],
+))
 
-    Args:
-        data: Bytes du PointSet
 
-    Returns:
-        Liste de tuples (x, y)
+# PointSetManager consulte pour les PointSetID inconnus (TRIANGULATOR_PSM_URL)
+_PSM = psm_client_from_env()
 
-    Raises:
-        ValueError: Si format invalide
+# Budget de calcul simultane, partage equitablement (voir admission.py)
+_ADMISSION = admission_from_env()
+_CLIENT_HEADER = os.environ.get("TRIANGULATOR_CLIENT_HEADER", "X-Client-Id")
+_SHED = _METRICS.register(metrics.Counter(
+    "triangulator_admission_rejected_total",
+    "Calculs refuses par le controle d'admission.",
+    ("reason",),
+))
+_METRICS.register(metrics.Gauge(
+    "triangulator_admission_inflight_cost",
+    "Cout (points) des calculs en cours.",
+    lambda: _ADMISSION.stats()["inflight"] if _ADMISSION is not None else 0,
+))
+
+# Mode auto: modele de cout (charge au premier usage) et pool de processus
+_COST_MODEL: CostModel | None = None
+_POOL = None
+_POOL_WORKERS = int(os.environ.get("TRIANGULATOR_POOL_WORKERS", "0"))
+_POOL_LOCK = threading.Lock()
+_AUTO_DISPATCH = _METRICS.register(metrics.Counter(
+    "triangulator_auto_dispatch_total",
+    "Calculs du mode auto par execution (inline ou pool).",
+    ("execution",),
+))
 
+# Capture des requetes lentes (opt-in, voir profiling.py)
+_SAMPLER = sampler_from_env()
+
+# Comptabilite memoire par sous-systeme (opt-in, voir memory_accounting.py)
+_MEMORY = memory_tracker_from_env()
+_REQUEST_PEAK_BYTES = _METRICS.register(metrics.Histogram(
+    "triangulator_request_peak_bytes",
+    "Pic d'allocation Python par requete (TRIANGULATOR_MEMORY_TRACKING).",
+    ("endpoint",),
+    buckets=metrics.SIZE_BUCKETS,
+))
+
+# Ecriture periodique du snapshot du store (TRIANGULATOR_SNAPSHOT_PATH)
+_SNAPSHOTS: SnapshotWriter | None = None
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+@contextmanager
+def _stage(name: str):
+    """Chronometrer une etape du traitement.
+
+    La duree alimente l'histogramme par etape et l'en-tete Server-Timing
+    de la reponse courante; le pic d'allocation est enregistre si la
+    comptabilite memoire est active.
     """
-    if len(data) < 4:
-        raise ValueError("Binaire trop court: nombre de points manquant")
-    offset = 0
-    n_points = struct.unpack_from("<I", data, offset)[0]
-    offset += 4
-    attendu = n_points * 8
-    if len(data) != offset + attendu:
-        raise ValueError("Longueur binaire invalide pour les points")
-    points = []
-    for _ in range(n_points):
-        x, y = struct.unpack_from("<ff", data, offset)
-        points.append((float(x), float(y)))
-        offset += 8
-    return points
+    span = _MEMORY.begin() if _MEMORY is not None else None
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if span is not None:
+            _MEMORY.end(span, "stage", name)
+        _STAGE_SECONDS.observe(elapsed, stage=name)
+        timings = g.setdefault("stage_timings", {})
+        timings[name] = timings.get(name, 0.0) + elapsed
+
+
+def _server_timing(timings: dict, total: float) -> str:
+    """Construire la valeur de l'en-tete Server-Timing (durees en ms)."""
+    parts = [f"{name};dur={seconds * 1000:.3f}" for name, seconds in timings.items()]
+    parts.append(f"total;dur={total * 1000:.3f}")
+    return ", ".join(parts)
+
+
+def _endpoint_label() -> str:
+    """Route de la requete courante (gabarit, pas l'URL: cardinalite bornee)."""
+    rule = request.url_rule
+    return rule.rule if rule is not None else "unmatched"
+
+
+@routes.before_app_request
+def _start_timer() -> None:
+    """Noter l'instant de debut de la requete (et demarrer le profilage)."""
+    g.request_start = time.perf_counter()
+    if _SAMPLER is not None:
+        g.profile_token = _SAMPLER.start()
+    if _MEMORY is not None:
+        g.memory_span = _MEMORY.begin()
+
+
+@routes.after_app_request
+def _record_request(response: Response) -> Response:
+    """Compter la requete, enregistrer duree et tailles, ajouter Server-Timing."""
+    endpoint = _endpoint_label()
+    _REQUESTS.inc(
+        endpoint=endpoint, method=request.method, status=response.status_code
+    )
+    start = g.get("request_start")
+    if start is not None:
+        elapsed = time.perf_counter() - start
+        _REQUEST_SECONDS.observe(elapsed, endpoint=endpoint)
+        response.headers["Server-Timing"] = _server_timing(
+            g.get("stage_timings", {}), elapsed
+        )
+        if _SAMPLER is not None:
+            _SAMPLER.finish(
+                g.get("profile_token"), elapsed, f"{request.method} {endpoint}"
+            )
+    span = g.get("memory_span")
+    if _MEMORY is not None and span is not None:
+        _REQUEST_PEAK_BYTES.observe(
+            _MEMORY.end(span, "request", endpoint), endpoint=endpoint
+        )
+    if request.content_length:
+        _PAYLOAD_BYTES.observe(
+            request.content_length, endpoint=endpoint, direction="in"
+        )
+    if response.content_length is not None:
+        _PAYLOAD_BYTES.observe(
+            response.content_length, endpoint=endpoint, direction="out"
+        )
+    return response
 
 
 def _validate_uuid(text: str) -> _uuid.UUID:
@@ -72,7 +277,358 @@ def _validate_uuid(text: str) -> _uuid.UUID:
     return _uuid.UUID(text)
 
 
-@app.get("/healthz")
+def _not_found() -> tuple:
+    """Reponse 404 standard pour un PointSetID inconnu."""
+    return jsonify({
+        "code": "NOT_FOUND",
+        "message": "PointSetID introuvable",
+    }), 404
+
+
+def _negotiate_mimetype() -> str:
+    """Choisir le format Triangles selon Accept (standard par defaut)."""
+    return request.accept_mimetypes.best_match(
+        list(_REPRESENTATIONS), default=MIMETYPE_TRIANGLES
+    )
+
+
+def _negotiate_encoding() -> str | None:
+    """Choisir gzip / deflate selon Accept-Encoding (None = identity)."""
+    return request.accept_encodings.best_match(list(ENCODINGS))
+
+
+def _lookup_result(key: str) -> str | bytes | None:
+    """Chercher un resultat en cache: chemin de fichier, bytes ou None."""
+    path = _POINTSETS.result_path(key)
+    if path is not None:
+        return path
+    binary = _POINTSETS.get_result(key)
+    return bytes(binary) if binary is not None else None
+
+
+def _result_bytes(key: str, cached: str | bytes):
+    """Contenu d'un resultat en cache (relu via le stockage si c'est un chemin)."""
+    if not isinstance(cached, str):
+        return cached
+    data = _POINTSETS.get_result(key)
+    if data is None:
+        raise RuntimeError(f"Resultat {key} evince pendant la requete")
+    return data
+
+
+def _cache_result(key: str, data: bytes) -> str | bytes:
+    """Stocker un resultat et retourner sa forme servable (chemin ou bytes)."""
+    with _stage("store_write"):
+        _POINTSETS.put_result(key, data)
+        return _lookup_result(key) or data
+
+
+def _content_tag(pointset_id: str) -> str | None:
+    """Empreinte du contenu du PointSet et de la version d'algorithme.
+
+    Calculee une fois puis stockee comme resultat "<id>.etag": un PointSet
+    est immuable, l'empreinte ne change donc jamais.
+
+    Returns:
+        Empreinte hexadecimale, ou None si le PointSet n'est plus stocke
+
+    """
+    key = f"{pointset_id}.etag"
+    cached = _POINTSETS.get_result(key)
+    if cached is not None:
+        return bytes(cached).decode("ascii")
+    raw = _POINTSETS.get_pointset(pointset_id)
+    if raw is None:
+        return None
+    digest = hashlib.sha256(ALGORITHM_VERSION.encode("ascii"))
+    digest.update(raw)
+    tag = digest.hexdigest()[:32]
+    _POINTSETS.put_result(key, tag.encode("ascii"))
+    return tag
+
+
+def _entity_tag(tag: str, *parts: str | None) -> str:
+    """ETag fort d'une representation (contenu, detail, format, encodage)."""
+    return ".".join(part for part in (tag, *parts) if part)
+
+
+def _requested_lod() -> int | None:
+    """Niveau de detail demande par ?lod=<vertices> (None = complet).
+
+    Raises:
+        ValueError: Si la valeur n'est pas un entier ou est trop petite
+
+    """
+    value = request.args.get("lod")
+    if value is None:
+        return None
+    return select_lod_level(int(value))
+
+
+def _requested_algorithm() -> str:
+    """Algorithme demande par ?algorithm=<nom> (defaut: le premier).
+
+    Raises:
+        ValueError: Si l'algorithme est inconnu
+
+    """
+    value = request.args.get("algorithm", ALGORITHMS[0])
+    if value not in ALGORITHMS:
+        raise ValueError(f"algorithm attendu parmi {', '.join(ALGORITHMS)}: {value}")
+    return value
+
+
+def _requested_snap() -> float | None:
+    """Tolerance de fusion demandee par ?snap=<distance> (None = aucune).
+
+    Raises:
+        ValueError: Si la valeur n'est pas un reel fini, nul ou au moins
+            MIN_SNAP_TOLERANCE
+
+    """
+    value = request.args.get("snap")
+    if value is None:
+        return None
+    tolerance = float(value)
+    if not (tolerance >= 0 and math.isfinite(tolerance)):
+        raise ValueError(f"snap attendu reel >= 0: {value}")
+    if 0 < tolerance < MIN_SNAP_TOLERANCE:
+        raise ValueError(f"snap attendu 0 ou >= {MIN_SNAP_TOLERANCE:.3g}: {value}")
+    return tolerance
+
+
+def _requested_adjacency() -> bool:
+    """Section d'adjacence demandee par ?adjacency=1.
+
+    Raises:
+        ValueError: Si la valeur n'est pas un booleen reconnu
+
+    """
+    value = request.args.get("adjacency", "0").lower()
+    if value not in ("0", "1", "false", "true"):
+        raise ValueError(f"adjacency attendu 0 ou 1: {value}")
+    return value in ("1", "true")
+
+
+def _ensure_pointset(pointset_id: str) -> bool:
+    """Ensure a PointSet is stored locally (fetched from the PointSetManager).
+
+    Returns:
+        True si le PointSet est disponible localement
+
+    Raises:
+        PointSetManagerError: Si le PointSetManager est injoignable
+        ValueError: Si le PointSetManager renvoie un binaire invalide
+
+    """
+    with _stage("store_lookup"):
+        # PointSet inconnu, evince ou expire
+        known = pointset_id in _POINTSETS
+    if not known and _PSM is not None:
+        with _stage("psm_fetch"):
+            raw = _PSM.get_pointset(pointset_id)
+        if raw is not None:
+            parse_pointset(raw)
+            _POINTSETS.put_pointset(pointset_id, raw)
+            known = True
+    return known
+
+
+def _full_result(pointset_id: str):
+    """Triangulation complete au format standard (calculee si absente).
+
+    Returns:
+        Bytes (ou mmap) du resultat, None si le PointSet n'est plus stocke
+
+    Raises:
+        Overloaded: Si le budget de calcul est epuise
+
+    """
+    with _stage("store_lookup"):
+        cached = _lookup_result(pointset_id)
+    if cached is None:
+        with _stage("store_lookup"):
+            raw = _POINTSETS.get_pointset(pointset_id)
+        if raw is None:
+            return None
+        cached = _cache_result(pointset_id, _admitted_triangulate(raw))
+    return _result_bytes(pointset_id, cached)
+
+
+def _not_modified(etag: str) -> Response:
+    """Reponse 304 (le client a deja cette representation)."""
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.vary.update(("Accept", "Accept-Encoding"))
+    return response
+
+
+def _binary_response(
+    cached: str | bytes,
+    mimetype: str = MIMETYPE_TRIANGLES,
+    encoding: str | None = None,
+    etag: str | None = None,
+) -> Response:
+    """Construire la reponse binaire (fichier envoye sans copie si possible).
+
+    Avec un ETag, la reponse est conditionnelle: If-None-Match -> 304,
+    Range (et If-Range) -> 206 sur une partie du contenu.
+
+    Args:
+        cached: Chemin du fichier resultat ou bytes
+        mimetype: Format Triangles du contenu
+        encoding: Content-Encoding du contenu (None = identity)
+        etag: ETag fort de la representation
+
+    Returns:
+        Response binaire
+
+    """
+    if isinstance(cached, str):
+        response = send_file(cached, mimetype=mimetype, etag=False, conditional=False)
+        length = os.path.getsize(cached)
+    else:
+        response = Response(cached, mimetype=mimetype, status=200)
+        length = len(cached)
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.update(("Accept", "Accept-Encoding"))
+    if etag is not None:
+        response.set_etag(etag)
+        try:
+            response.make_conditional(
+                request, accept_ranges=True, complete_length=length
+            )
+        except RequestedRangeNotSatisfiable as e:
+            return e.get_response()
+    return response
+
+
+def _client_id() -> str:
+    """Client de la requete courante (file de calcul equitable)."""
+    return request.headers.get(_CLIENT_HEADER) or request.remote_addr or ""
+
+
+def _admitted_triangulate(
+    raw,
+    level: int | None = None,
+    algorithm: str = ALGORITHMS[0],
+    tolerance: float | None = None,
+) -> bytes:
+    """Trianguler sous controle d'admission (cout = points traites).
+
+    Args:
+        raw: PointSet binaire
+        level: Niveau de detail (None = tous les points)
+        algorithm: Algorithme de triangulation (voir ALGORITHMS)
+        tolerance: Distance de fusion des quasi-doublons (None = aucune)
+
+    Raises:
+        Overloaded: Si le budget de calcul est epuise
+
+    """
+    cost = estimate_cost(raw)
+    if level is not None:
+        cost = min(cost, level * LOD_OVERSAMPLE)
+    if _ADMISSION is None:
+        return _triangulate(raw, level, algorithm, tolerance)
+    with _stage("admission"):
+        try:
+            token = _ADMISSION.acquire(cost, _client_id())
+        except Overloaded as e:
+            _SHED.inc(reason=e.reason)
+            raise
+    try:
+        return _triangulate(raw, level, algorithm, tolerance)
+    finally:
+        _ADMISSION.release(token)
+
+
+def _cost_model() -> CostModel:
+    """Modele de cout du mode auto, calibre pour cette machine si possible."""
+    global _COST_MODEL
+    if _COST_MODEL is None:
+        _COST_MODEL = load_cost_model(
+            os.environ.get("TRIANGULATOR_BENCH_BASELINE"),
+            min_offload_seconds=float(
+                os.environ.get("TRIANGULATOR_POOL_MIN_SECONDS", "0.05")
+            ),
+        )
+    return _COST_MODEL
+
+
+def _pool():
+    """Pool de processus du mode auto (None si TRIANGULATOR_POOL_WORKERS = 0).
+
+    Cree au premier usage; processus "spawn": ils n'importent que
+    triangulator_core, sans heriter des threads du serveur.
+    """
+    global _POOL
+    if _POOL is None and _POOL_WORKERS > 0:
+        with _POOL_LOCK:
+            if _POOL is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                _POOL = ProcessPoolExecutor(
+                    max_workers=_POOL_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _POOL
+
+
+def _triangulate(
+    raw,
+    level: int | None = None,
+    algorithm: str = ALGORITHMS[0],
+    tolerance: float | None = None,
+) -> bytes:
+    """Parser un PointSet, le trianguler et serialiser le resultat.
+
+    Avec un niveau de detail, seul un sous-echantillon stratifie d'au plus
+    level points est triangule (apercu). Avec une tolerance, les points
+    proches sont fusionnes avant le calcul et la correspondance points
+    d'entree -> vertices est ajoutee (section SECTION_VERTEX_MAP).
+
+    En mode auto, les calculs longs sont envoyes au pool de processus si
+    le modele de cout le juge rentable (voir cost_model.py).
+    """
+    if algorithm == "auto" and level is None:
+        pool = _pool()
+        execution = _cost_model().execution(
+            estimate_cost(raw), pool=pool is not None
+        )
+        _AUTO_DISPATCH.inc(execution=execution)
+        if execution == "pool":
+            with _stage("pool"):
+                return pool.submit(
+                    triangulate_binary, bytes(raw), algorithm, tolerance
+                ).result()
+    mapping = None
+    if level is not None:
+        with _stage("decimate"):
+            points_dicts = decimate_pointset(raw, level)
+    elif tolerance is not None:
+        with _stage("parse"):
+            points = parse_pointset(raw)
+        with _stage("snap"):
+            points_dicts, mapping = snap_points(points, tolerance, min_vertices=3)
+    else:
+        # Conversion des points au format attendu par compute_triangulation
+        with _stage("parse"):
+            points = parse_pointset(raw)
+        with _stage("convert"):
+            points_dicts = [{"x": x, "y": y} for (x, y) in points]
+    with _stage("compute"):
+        vertices, triangles = compute_triangulation(points_dicts, algorithm)
+    with _stage("serialize"):
+        binary = serialize_triangulation(vertices, triangles)
+        if mapping is not None:
+            binary += vertex_map_section(mapping)
+        return binary
+
+
+@routes.get("/healthz")
 def healthz() -> Response:
     """Endpoint de sante pour supervision.
 
@@ -83,7 +639,45 @@ def healthz() -> Response:
     return Response("ok", mimetype="text/plain", status=200)
 
 
-@app.post("/pointset")
+@routes.get("/store/stats")
+def store_stats() -> tuple:
+    """Occupation et compteurs du stockage (octets, evictions, expirations).
+
+    Returns:
+        Tuple (JSON response, status code).
+
+    """
+    return jsonify(_POINTSETS.stats()), 200
+
+
+@routes.get("/metrics")
+def metrics_endpoint() -> Response:
+    """Metriques du service au format texte Prometheus.
+
+    Returns:
+        Response text/plain (format d'exposition 0.0.4).
+
+    """
+    return Response(_METRICS.render(), content_type=metrics.CONTENT_TYPE)
+
+
+@routes.get("/debug/memory")
+def memory_diagnostics() -> tuple:
+    """Memoire du service: tas par sous-systeme, pics par requete et etape.
+
+    Sans TRIANGULATOR_MEMORY_TRACKING, seule l'occupation declaree par le
+    store est donnee ("tracing": false).
+
+    Returns:
+        Tuple (JSON response, status code).
+
+    """
+    report = _MEMORY.report() if _MEMORY is not None else {"tracing": False}
+    report["store"] = _POINTSETS.stats()
+    return jsonify(report), 200
+
+
+@routes.post("/pointset")
 def register_pointset() -> tuple:
     """Enregistrer un PointSet depuis un flux binaire.
 
@@ -112,9 +706,12 @@ def register_pointset() -> tuple:
                 400,
             )
         raw = request.get_data(cache=False)
-        points = _parse_pointset_binary(raw)
+        # Validation du format avant stockage (le binaire est stocke tel quel)
+        with _stage("parse"):
+            parse_pointset(raw)
         pointset_id = str(_uuid.uuid4())
-        _POINTSETS[pointset_id] = points
+        with _stage("store_write"):
+            _POINTSETS.put_pointset(pointset_id, raw)
         return jsonify({"pointSetId": pointset_id}), 200
     except ValueError as e:
         return jsonify({"code": "BAD_REQUEST", "message": str(e)}), 400
@@ -123,15 +720,43 @@ def register_pointset() -> tuple:
         return jsonify({"code": "INTERNAL_ERROR", "message": str(e)}), 500
 
 
-@app.get("/triangulation/<pointSetId>")
+@routes.get("/triangulation/<pointSetId>")
 def get_triangulation(pointSetId: str) -> tuple | Response:  # noqa: N803
     """Compute triangulation for a PointSet.
 
     Etapes:
-    1. Valider le format UUID
-    2. Verifier l'existence du PointSet
+    1. Valider le format UUID et les parametres de requete
+    2. Verifier l'existence du PointSet (stockage local, puis
+       PointSetManager si TRIANGULATOR_PSM_URL est defini)
     3. Calculer la triangulation via triangulator_core
-    4. Retourner le binaire (vertices + triangles)
+    4. Retourner le binaire (vertices + triangles) au format demande par
+       Accept, compresse en gzip ou deflate si Accept-Encoding le permet
+       (chaque variante est mise en cache)
+
+    ?lod=<vertices> demande un apercu: triangulation d'un sous-echantillon
+    spatialement stratifie, au plus grand niveau de LOD_LEVELS ne depassant
+    pas ce budget (chaque niveau est mis en cache par PointSet).
+
+    ?adjacency=1 ajoute apres les triangles une section SECTION_ADJACENCY
+    (voisins par triangle et aretes uniques, voir triangulator_core).
+
+    ?snap=<distance> fusionne les points distants d'au plus cette distance
+    avant le calcul (grille de hachage, O(n) attendu) et ajoute apres les
+    triangles une section SECTION_VERTEX_MAP: vertex de chaque point du
+    PointSet (snap=0: doublons exacts seulement). Incompatible avec lod;
+    une tolerance qui laisse moins de 3 vertices est refusee (400).
+
+    ?algorithm=sweep demande une triangulation valide de l'enveloppe
+    convexe quel que soit l'ordre des points (balayage, O(n log n)); par
+    defaut, eventail depuis le premier point (voir ALGORITHMS).
+    ?algorithm=auto choisit le moteur (eventail si les points forment un
+    polygone convexe dans l'ordre, balayage sinon) et l'execution (thread
+    de la requete ou pool de processus, selon le modele de cout). Chaque
+    algorithme a ses propres cles de cache et ETag.
+
+    Chaque representation porte un ETag fort (contenu du PointSet, version
+    d'algorithme, format, encodage): If-None-Match -> 304 sans calcul,
+    Range -> 206 pour reprendre un telechargement.
 
     Args:
         pointSetId: Identifiant UUID du PointSet.
@@ -140,14 +765,19 @@ def get_triangulation(pointSetId: str) -> tuple | Response:  # noqa: N803
         Response binaire ou tuple (JSON, status).
 
     Reponse (200):
-    - Content-Type: application/octet-stream
+    - Content-Type: application/octet-stream (format Triangles standard),
+      application/vnd.triangulator.compact (indices etroits / delta) ou
+      application/vnd.triangulator.compact-q16 (coordonnees quantifiees)
     - Corps: Format binaire Triangles
 
     Erreurs (JSON avec champs {code, message}):
-    - 400: UUID invalide
+    - 400: UUID invalide, parametre lod / adjacency / algorithm / snap
+      invalide, lod et snap combines, ou snap laissant moins de 3 vertices
     - 404: PointSetID introuvable
+    - 416: Range hors du contenu
     - 500: Erreur interne
-    - 503: Service indisponible
+    - 503: Service indisponible (PointSetManager injoignable, ou budget
+      de calcul epuise: en-tete Retry-After)
 
     """
     try:
@@ -160,29 +790,143 @@ def get_triangulation(pointSetId: str) -> tuple | Response:  # noqa: N803
                 "message": "Service temporairement indisponible",
             }), 503
 
-        # Validation du format UUID
+        # Validation du format UUID (forme canonique = cle de stockage)
         try:
-            _validate_uuid(pointSetId)
+            pointset_id = str(_validate_uuid(pointSetId))
         except ValueError:
             return jsonify({
                 "code": "BAD_REQUEST",
                 "message": "UUID invalide",
             }), 400
 
-        # Recuperation du PointSet
-        points = _POINTSETS.get(pointSetId)
-        if points is None:
+        # Parametres valides avant tout acces au PointSet (recuperation
+        # distante et parse evites pour une requete refusee)
+        try:
+            level = _requested_lod()
+            adjacency = "adj" if _requested_adjacency() else ""
+            algorithm = _requested_algorithm()
+            tolerance = _requested_snap()
+            if level is not None and tolerance is not None:
+                raise ValueError("snap et lod ne se combinent pas")
+        except ValueError as e:
             return jsonify({
-                "code": "NOT_FOUND",
-                "message": "PointSetID introuvable",
-            }), 404
+                "code": "BAD_REQUEST",
+                "message": f"Parametre invalide: {e}",
+            }), 400
 
-        # Conversion des points au format attendu par compute_triangulation
-        points_dicts = [{"x": x, "y": y} for (x, y) in points]
-        vertices, triangles = compute_triangulation(points_dicts)
-        binary = serialize_triangulation(vertices, triangles)
-        return Response(binary, mimetype="application/octet-stream", status=200)
+        if not _ensure_pointset(pointset_id):
+            return _not_found()
+
+        mimetype = _negotiate_mimetype()
+        variant = _REPRESENTATIONS[mimetype]
+        encoding = _negotiate_encoding()
+
+        # Representation deja detenue par le client: ni calcul ni envoi
+        with _stage("etag"):
+            tag = _content_tag(pointset_id)
+        if tag is None:
+            return _not_found()
 
+        # Apercu: inutile si le PointSet tient deja dans le niveau demande
+        detail = ""
+        if level is not None:
+            with _stage("store_lookup"):
+                raw = _POINTSETS.get_pointset(pointset_id)
+            if raw is None:
+                return _not_found()
+            if estimate_cost(raw) > level:
+                detail = f"lod{level}"
+            else:
+                level = None
+        # Algorithme par defaut, sans fusion: cles et ETag inchanges
+        if tolerance is not None:
+            # repr: cle unique par tolerance ("+" exclu des cles du store disque)
+            detail = "snap" + repr(tolerance).replace("+", "")
+        if algorithm != ALGORITHMS[0]:
+            detail = ".".join(part for part in (detail, algorithm) if part)
+        base = ".".join(part for part in (pointset_id, detail) if part)
+        key = ".".join(
+            part for part in (base, adjacency, variant, encoding) if part
+        )
+        etag = _entity_tag(tag, detail, adjacency, variant, encoding)
+        if request.if_none_match.contains_weak(etag):
+            return _not_modified(etag)
+
+        # Variante (detail, format, compression) deja en cache
+        if key != base:
+            with _stage("store_lookup"):
+                cached = _lookup_result(key)
+            if cached is not None:
+                return _binary_response(cached, mimetype, encoding, etag)
+
+        # Resultat deja calcule: envoi direct du fichier si possible
+        with _stage("store_lookup"):
+            cached = _lookup_result(base)
+        if cached is None:
+            with _stage("store_lookup"):
+                raw = _POINTSETS.get_pointset(pointset_id)
+            if raw is None:
+                return _not_found()
+            cached = _cache_result(
+                base, _admitted_triangulate(raw, level, algorithm, tolerance)
+            )
+
+        # Section d'adjacence ajoutee au resultat standard
+        source_key = base
+        if adjacency:
+            source_key = f"{base}.{adjacency}"
+            with _stage("store_lookup"):
+                extended = _lookup_result(source_key)
+            if extended is None:
+                plain = _result_bytes(base, cached)
+                with _stage("adjacency"):
+                    extended = bytes(plain) + adjacency_section(plain)
+                extended = _cache_result(source_key, extended)
+            cached = extended
+
+        # Format compact derive du resultat standard
+        if variant:
+            compact_key = f"{source_key}.{variant}"
+            with _stage("store_lookup"):
+                compact = _lookup_result(compact_key)
+            if compact is None:
+                with _stage("encode"):
+                    compact = to_compact(
+                        _result_bytes(source_key, cached),
+                        quantize=mimetype == MIMETYPE_COMPACT_Q16,
+                    )
+                compact = _cache_result(compact_key, compact)
+            cached, source_key = compact, compact_key
+
+        if encoding is not None:
+            plain = _result_bytes(source_key, cached)
+            if len(plain) >= compression_min_bytes():
+                with _stage("compress"):
+                    packed = compress(plain, encoding)
+                return _binary_response(
+                    _cache_result(key, packed), mimetype, encoding, etag
+                )
+        return _binary_response(
+            cached, mimetype, etag=_entity_tag(tag, detail, adjacency, variant)
+        )
+
+    except Overloaded as e:
+        return jsonify({
+            "code": "SERVICE_UNAVAILABLE",
+            "message": str(e),
+        }), 503, {"Retry-After": str(e.retry_after)}
+    except SnapToleranceError as e:
+        # ?snap= fusionne trop de points: erreur du client
+        return jsonify({
+            "code": "BAD_REQUEST",
+            "message": f"Parametre invalide: {e}",
+        }), 400
+    except PointSetManagerError as e:
+        logger.warning("PointSetManager indisponible: %s", e)
+        return jsonify({
+            "code": "SERVICE_UNAVAILABLE",
+            "message": str(e),
+        }), 503
     except RuntimeError as e:
         logger.exception("Erreur interne")
         return jsonify({
@@ -197,6 +941,222 @@ def get_triangulation(pointSetId: str) -> tuple | Response:  # noqa: N803
         }), 500
 
 
+@routes.get("/triangulation/<pointSetId>/delta")
+def get_triangulation_delta(pointSetId: str) -> tuple | Response:  # noqa: N803
+    """Delta entre la triangulation d'un PointSet de base et celle-ci.
+
+    Le client detient deja la triangulation du PointSet ?base=<id> (par
+    exemple avant une petite modification envoyee comme nouveau PointSet):
+    seuls les vertices et triangles ajoutes et les segments conserves sont
+    transmis. triangulator_core.apply_triangulation_delta reconstruit la
+    triangulation complete.
+
+    Args:
+        pointSetId: Identifiant UUID du PointSet cible.
+
+    Returns:
+        Response binaire ou tuple (JSON, status).
+
+    Reponse (200):
+    - Content-Type: application/vnd.triangulator.delta
+    - Corps: delta binaire (voir triangulator_core.DELTA_MAGIC), compresse
+      selon Accept-Encoding
+
+    Erreurs (JSON avec champs {code, message}):
+    - 400: UUID invalide ou parametre base absent
+    - 404: PointSetID (cible ou base) introuvable
+    - 500: Erreur interne
+    - 503: Service indisponible (PointSetManager injoignable, ou budget
+      de calcul epuise: en-tete Retry-After)
+
+    """
+    try:
+        try:
+            pointset_id = str(_validate_uuid(pointSetId))
+            base_id = str(_validate_uuid(request.args.get("base", "")))
+        except ValueError:
+            return jsonify({
+                "code": "BAD_REQUEST",
+                "message": "UUID invalide (cible ou parametre base)",
+            }), 400
+        if not (_ensure_pointset(pointset_id) and _ensure_pointset(base_id)):
+            return _not_found()
+
+        encoding = _negotiate_encoding()
+        with _stage("etag"):
+            tag = _content_tag(pointset_id)
+            base_tag = _content_tag(base_id)
+        if tag is None or base_tag is None:
+            return _not_found()
+        variant = f"delta-{base_id}"
+        etag = _entity_tag(tag, f"delta-{base_tag}", encoding)
+        if request.if_none_match.contains_weak(etag):
+            return _not_modified(etag)
+
+        key = ".".join(part for part in (pointset_id, variant, encoding) if part)
+        with _stage("store_lookup"):
+            cached = _lookup_result(key)
+        if cached is not None:
+            return _binary_response(cached, MIMETYPE_DELTA, encoding, etag)
+
+        plain_key = f"{pointset_id}.{variant}"
+        with _stage("store_lookup"):
+            cached = _lookup_result(plain_key)
+        if cached is None:
+            base = _full_result(base_id)
+            target = _full_result(pointset_id)
+            if base is None or target is None:
+                return _not_found()
+            with _stage("delta"):
+                delta = triangulation_delta(base, target)
+            cached = _cache_result(plain_key, delta)
+
+        if encoding is not None:
+            plain = _result_bytes(plain_key, cached)
+            if len(plain) >= compression_min_bytes():
+                with _stage("compress"):
+                    packed = compress(plain, encoding)
+                return _binary_response(
+                    _cache_result(key, packed), MIMETYPE_DELTA, encoding, etag
+                )
+        return _binary_response(
+            cached, MIMETYPE_DELTA, etag=_entity_tag(tag, f"delta-{base_tag}")
+        )
+
+    except Overloaded as e:
+        return jsonify({
+            "code": "SERVICE_UNAVAILABLE",
+            "message": str(e),
+        }), 503, {"Retry-After": str(e.retry_after)}
+    except PointSetManagerError as e:
+        logger.warning("PointSetManager indisponible: %s", e)
+        return jsonify({
+            "code": "SERVICE_UNAVAILABLE",
+            "message": str(e),
+        }), 503
+    except Exception as e:
+        logger.exception("Erreur inattendue")
+        return jsonify({
+            "code": "INTERNAL_ERROR",
+            "message": str(e),
+        }), 500
+
+
+def warm_up(source_dir: str) -> int:
+    """Recopier un store disque dans le store du service (tache de fond).
+
+    Les entrees sont copiees des plus anciennes aux plus recentes: si le
+    store du service est borne, ce sont les plus recentes qui restent. Les
+    imports differes (client du PointSetManager) sont faits au passage.
+
+    Args:
+        source_dir: Racine d'un DiskStore (voir pointset_store.DiskStore)
+
+    Returns:
+        Nombre d'entrees copiees
+
+    """
+    if _PSM is not None:
+        import urllib.request  # noqa: F401
+    store = _POINTSETS
+    if isinstance(store, DiskStore) and store.root == os.path.abspath(source_dir):
+        return 0
+    source = DiskStore(source_dir)
+    copied = 0
+    for kind, key in source.entries():
+        read, write = (
+            (source.get_pointset, store.put_pointset)
+            if kind == "pointset"
+            else (source.get_result, store.put_result)
+        )
+        data = read(key)
+        if data is None:
+            continue
+        try:
+            write(key, bytes(data))
+            copied += 1
+        except ValueError:
+            # Entree plus grosse que le budget du store: ignoree
+            continue
+        finally:
+            if hasattr(data, "close"):
+                data.close()
+    logger.info("Prechauffage: %d entrees recopiees depuis %s", copied, source_dir)
+    return copied
+
+
+def _start_snapshots(path: str, interval: float) -> None:
+    """Restaurer le snapshot du store puis lancer son ecriture periodique.
+
+    Une seule fois par processus. Seuls les stores en memoire sont
+    concernes (le store disque persiste deja ses entrees).
+    """
+    global _POINTSETS, _SNAPSHOTS
+    with _SNAPSHOT_LOCK:
+        if _SNAPSHOTS is not None:
+            return
+        if not hasattr(_POINTSETS, "items"):
+            logger.warning("Snapshot ignore: store %s", _POINTSETS.stats()["backend"])
+            return
+        snapshot = load_snapshot(path, getattr(_POINTSETS, "ttl_seconds", None))
+        if snapshot is not None:
+            _POINTSETS = SnapshotStore(_POINTSETS, snapshot)
+            logger.info("Snapshot restaure: %d entrees (%s)", len(snapshot), path)
+        _SNAPSHOTS = SnapshotWriter(lambda: _POINTSETS, path, interval)
+        _SNAPSHOTS.start()
+        atexit.register(_SNAPSHOTS.stop)
+
+
+def create_app(
+    warmup_dir: str | None = None, snapshot_path: str | None = None
+) -> Flask:
+    """Build the Flask application of the service.
+
+    Args:
+        warmup_dir: Store disque a recopier en tache de fond (defaut:
+            TRIANGULATOR_WARMUP_DIR, aucun si absent)
+        snapshot_path: Snapshot du store a restaurer puis entretenir
+            (defaut: TRIANGULATOR_SNAPSHOT_PATH, aucun si absent)
+
+    Returns:
+        Application Flask; le thread de prechauffage eventuel est dans
+        app.extensions["triangulator_warmup"]
+
+    """
+    application = Flask(__name__)
+    application.register_blueprint(routes)
+    if snapshot_path is None:
+        snapshot_path = os.environ.get("TRIANGULATOR_SNAPSHOT_PATH")
+    if snapshot_path:
+        _start_snapshots(
+            snapshot_path,
+            float(os.environ.get("TRIANGULATOR_SNAPSHOT_INTERVAL", "300")),
+        )
+    if warmup_dir is None:
+        warmup_dir = os.environ.get("TRIANGULATOR_WARMUP_DIR")
+    if warmup_dir:
+        thread = threading.Thread(
+            target=warm_up, args=(warmup_dir,), name="triangulator-warmup",
+            daemon=True,
+        )
+        thread.start()
+        application.extensions["triangulator_warmup"] = thread
+    return application
+
+
+_APP_LOCK = threading.Lock()
+
+
+def __getattr__(name: str) -> Flask:
+    """Construire l'application par defaut au premier acces a `app`."""
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _APP_LOCK:
+        if "app" not in globals():
+            globals()["app"] = create_app()
+    return globals()["app"]
+
+
 if __name__ == "__main__":
     # Lancer le serveur sur localhost:8000 comme attendu par les tests
-    app.run(host="0.0.0.0", port=8000, debug=False)
+    create_app().run(host="0.0.0.0", port=8000, debug=False)
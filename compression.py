@@ -0,0 +1,73 @@
+"""Compression HTTP des reponses binaires (gzip / deflate, stdlib zlib).
+
+Configuration:
+- TRIANGULATOR_COMPRESSION_LEVEL: niveau zlib 0..9 (defaut: 6)
+- TRIANGULATOR_COMPRESSION_MIN_BYTES: taille minimale compressee (defaut: 256)
+"""
+
+import os
+import zlib
+
+# Content-Encoding -> wbits zlib ("deflate" HTTP = format zlib, RFC 1950)
+ENCODINGS = {"gzip": 31, "deflate": 15}
+
+# Taille des blocs passes au compresseur
+CHUNK_SIZE = 256 * 1024
+
+
+def compression_level() -> int:
+    """Niveau de compression configure (0..9)."""
+    level = int(os.environ.get("TRIANGULATOR_COMPRESSION_LEVEL", "6"))
+    return min(9, max(0, level))
+
+
+def compression_min_bytes() -> int:
+    """Taille en dessous de laquelle une reponse n'est pas compressee."""
+    return int(os.environ.get("TRIANGULATOR_COMPRESSION_MIN_BYTES", "256"))
+
+
+def compress(data, encoding: str, level: int | None = None) -> bytes:
+    """Compresser un binaire par blocs (compresseur en flux).
+
+    La source est lue par tranches de CHUNK_SIZE: un mmap n'est jamais
+    recopie en entier en memoire.
+
+    Args:
+        data: Bytes, memoryview ou mmap a compresser
+        encoding: "gzip" ou "deflate"
+        level: Niveau zlib (defaut: compression_level())
+
+    Returns:
+        Bytes compresses
+
+    Raises:
+        ValueError: Si l'encodage est inconnu
+
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Encodage inconnu: {encoding}")
+    if level is None:
+        level = compression_level()
+    compressor = zlib.compressobj(level, zlib.DEFLATED, ENCODINGS[encoding])
+    view = memoryview(data)
+    out = bytearray()
+    for start in range(0, len(view), CHUNK_SIZE):
+        out += compressor.compress(view[start : start + CHUNK_SIZE])
+    out += compressor.flush()
+    return bytes(out)
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """Decompresser un binaire gzip / deflate (utilitaire client et tests)."""
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Encodage inconnu: {encoding}")
+    return zlib.decompress(data, ENCODINGS[encoding])
+
+
+__all__ = [
+    "ENCODINGS",
+    "compress",
+    "compression_level",
+    "compression_min_bytes",
+    "decompress",
+]
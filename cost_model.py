@@ -0,0 +1,215 @@
+"""Modele de cout des moteurs de triangulation (mode "auto").
+
+Predit la duree d'une triangulation de bout en bout (parse, calcul,
+serialisation) selon le nombre de points et le moteur, ainsi que le
+surcout d'un passage par un pool de processus (latence fixe et
+aller-retour des binaires). Le mode "auto" s'en sert pour executer un
+calcul dans le pool plutot que dans le thread de la requete: seulement
+s'il est assez long pour bloquer les autres requetes (GIL) et si le
+transfert reste petit devant le calcul.
+
+Les coefficients sont calibres sur la machine locale par
+`python triangulator_bench.py --record` et enregistres avec la reference
+(TRIANGULATOR_BENCH_BASELINE, defaut .benchmarks/baseline.json). Sans
+calibration pour cette machine, DEFAULT_COEFFICIENTS s'applique.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import time
+
+# Secondes par point (parse, fan, serialize) ou par n log2 n (sweep), et
+# pool: latence fixe (s) et cout par octet transfere
+DEFAULT_COEFFICIENTS = {
+    "parse": 5e-7,
+    "fan": 1.3e-6,
+    "sweep": 2.3e-7,
+    "serialize": 6e-7,
+    "pool_fixed": 3e-4,
+    "pool_per_byte": 2.5e-9,
+}
+
+# Reference de triangulator_bench (mesures et modele calibre)
+DEFAULT_BASELINE = os.path.join(".benchmarks", "baseline.json")
+# Format des references: a incrementer quand la mesure ou les etapes changent
+BASELINE_VERSION = 2
+
+# Coefficient -> etape mesuree par triangulator_bench
+CALIBRATED_STAGES = {
+    "parse": "parse",
+    "fan": "compute",
+    "sweep": "sweep",
+    "serialize": "serialize",
+}
+
+
+def machine_id() -> dict:
+    """Describe the machine and interpreter (scope of a baseline)."""
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+
+
+def _work(coefficient: str, n: int) -> float:
+    """Quantite de travail d'une etape pour n points (n ou n log2 n)."""
+    if coefficient == "sweep":
+        return n * math.log2(max(n, 2))
+    return float(n)
+
+
+class CostModel:
+    """Durees predites des moteurs et choix de l'execution (inline ou pool)."""
+
+    def __init__(
+        self,
+        coefficients: dict | None = None,
+        min_offload_seconds: float = 0.05,
+        max_overhead_ratio: float = 0.25,
+    ) -> None:
+        """Configure the model.
+
+        Args:
+            coefficients: Coefficients calibres (defaut: DEFAULT_COEFFICIENTS,
+                completes par ceux-ci pour les cles absentes)
+            min_offload_seconds: Duree predite minimale pour passer au pool
+            max_overhead_ratio: Surcout du pool maximal, relatif au calcul
+
+        """
+        self.coefficients = {**DEFAULT_COEFFICIENTS, **(coefficients or {})}
+        self.min_offload_seconds = min_offload_seconds
+        self.max_overhead_ratio = max_overhead_ratio
+
+    def predict(self, n: int, engine: str = "sweep") -> float:
+        """Duree predite (secondes) de parse + calcul + serialisation."""
+        c = self.coefficients
+        return (
+            (c["parse"] + c["serialize"]) * n + c[engine] * _work(engine, n)
+        )
+
+    def pool_overhead(self, n: int) -> float:
+        """Surcout predit d'un calcul dans le pool (secondes).
+
+        Transfert du PointSet (8 octets par point) et du resultat (au plus
+        ~2n triangles de 12 octets et n vertices de 8 octets).
+        """
+        c = self.coefficients
+        transferred = (4 + 8 * n) + (8 + 32 * n)
+        return c["pool_fixed"] + c["pool_per_byte"] * transferred
+
+    def execution(self, n: int, engine: str = "sweep", pool: bool = True) -> str:
+        """Choisir "pool" ou "inline" pour un calcul de n points.
+
+        Args:
+            n: Nombre de points
+            engine: Moteur prevu ("sweep": borne haute du mode auto)
+            pool: Un pool de processus est disponible
+
+        """
+        if not pool:
+            return "inline"
+        seconds = self.predict(n, engine)
+        if (
+            seconds >= self.min_offload_seconds
+            and self.pool_overhead(n) <= self.max_overhead_ratio * seconds
+        ):
+            return "pool"
+        return "inline"
+
+
+def calibrate(results: dict, pool: dict | None = None) -> dict:
+    """Ajuster les coefficients sur les mesures de triangulator_bench.
+
+    Moindres carres sans constante (duree = coefficient x travail) sur les
+    medianes de chaque taille.
+
+    Args:
+        results: Resultats de triangulator_bench.run_suite
+        pool: Coefficients du pool (voir measure_pool_overhead)
+
+    Returns:
+        Coefficients calibres (etapes absentes de results omises)
+
+    """
+    coefficients = {}
+    for name, stage in CALIBRATED_STAGES.items():
+        if stage not in results:
+            continue
+        work = [_work(name, n) for n in results[stage]["sizes"]]
+        seconds = results[stage]["median"]
+        coefficients[name] = sum(
+            w * t for w, t in zip(work, seconds, strict=True)
+        ) / sum(w * w for w in work)
+    coefficients.update(pool or {})
+    return coefficients
+
+
+def measure_pool_overhead(
+    pool, payload_bytes: int = 4_000_000, repeats: int = 5
+) -> dict:
+    """Mesurer la latence et le cout par octet d'un pool de processus.
+
+    Args:
+        pool: concurrent.futures.Executor (processus)
+        payload_bytes: Taille du binaire envoye et recu
+        repeats: Mesures par taille (mediane)
+
+    Returns:
+        Dict {"pool_fixed", "pool_per_byte"}
+
+    """
+    def round_trip(data: bytes) -> float:
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            pool.submit(bytes, data).result()
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples)
+
+    round_trip(b"")
+    fixed = round_trip(b"\0")
+    per_byte = max(0.0, round_trip(bytes(payload_bytes)) - fixed) / (
+        2 * payload_bytes
+    )
+    return {"pool_fixed": fixed, "pool_per_byte": per_byte}
+
+
+def load_cost_model(path: str | None = None, **options) -> CostModel:
+    """Modele calibre pour cette machine, ou par defaut.
+
+    Une reference d'une autre version de format (calibree avant l'ajout
+    d'une etape, par exemple sweep) donne le modele par defaut.
+
+    Args:
+        path: Fichier de reference de triangulator_bench
+        **options: Parametres de CostModel (seuils de passage au pool)
+
+    """
+    try:
+        with open(path or DEFAULT_BASELINE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return CostModel(**options)
+    if (
+        data.get("version") != BASELINE_VERSION
+        or data.get("machine") != machine_id()
+    ):
+        return CostModel(**options)
+    return CostModel(data.get("cost_model"), **options)
+
+
+__all__ = [
+    "BASELINE_VERSION",
+    "DEFAULT_BASELINE",
+    "DEFAULT_COEFFICIENTS",
+    "CostModel",
+    "calibrate",
+    "load_cost_model",
+    "machine_id",
+    "measure_pool_overhead",
+]
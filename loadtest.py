@@ -0,0 +1,326 @@
+"""Banc de charge HTTP concurrent du Triangulator.
+
+Demarre (sauf --target) le service et un PointSetManager local de
+substitution, puis execute une charge mixte:
+- upload: POST /pointset d'un PointSet aleatoire sur le PointSetManager
+- triangulate: GET /triangulation/{id} d'un PointSet deja envoye sur le
+  service, qui va le chercher sur le PointSetManager au premier appel
+
+La taille des PointSets suit une distribution ponderee (--sizes
+"100:0.7,1000:0.25,10000:0.05"). Le rapport donne le debit et les
+latences p50/p95/p99 par type d'operation.
+
+Usage:
+    python loadtest.py --concurrency 16 --requests 2000
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import struct
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+from werkzeug.wrappers import Request, Response
+
+from triangulator_core import parse_pointset
+
+
+class PointSetManagerStub:
+    """PointSetManager en memoire (POST /pointset, GET /pointset/{id})."""
+
+    def __init__(self) -> None:
+        """Create an empty stand-in."""
+        self._lock = threading.Lock()
+        self._pointsets: dict = {}
+
+    def __call__(self, environ, start_response):
+        """Application WSGI conforme a TP/point_set_manager.yml."""
+        request = Request(environ)
+        path = request.path.rstrip("/")
+        if request.method == "POST" and path == "/pointset":
+            data = request.get_data()
+            try:
+                parse_pointset(data)
+            except ValueError as e:
+                response = _json_response(
+                    {"code": "BAD_REQUEST", "message": str(e)}, 400
+                )
+            else:
+                pointset_id = str(uuid.uuid4())
+                with self._lock:
+                    self._pointsets[pointset_id] = data
+                response = _json_response({"pointSetId": pointset_id}, 201)
+        elif request.method == "GET" and path.startswith("/pointset/"):
+            data = self._pointsets.get(path[len("/pointset/") :])
+            if data is None:
+                response = _json_response(
+                    {"code": "NOT_FOUND", "message": "PointSetID introuvable"}, 404
+                )
+            else:
+                response = Response(data, mimetype="application/octet-stream")
+        else:
+            response = _json_response({"code": "NOT_FOUND", "message": path}, 404)
+        return response(environ, start_response)
+
+
+def _json_response(body: dict, status: int) -> Response:
+    """Reponse JSON d'erreur ou de creation."""
+    return Response(json.dumps(body), status=status, mimetype="application/json")
+
+
+class _QuietHandler(WSGIRequestHandler):
+    """Gestionnaire de requetes sans journal d'acces (bruit sous charge)."""
+
+    def log_request(self, *args, **kwargs) -> None:
+        """Ne rien journaliser."""
+
+
+class BackgroundServer:
+    """Serveur WSGI multi-thread dans un thread de fond (port libre)."""
+
+    def __init__(self, wsgi_app, host: str = "127.0.0.1") -> None:
+        """Start serving wsgi_app on an ephemeral port.
+
+        Args:
+            wsgi_app: Application WSGI
+            host: Adresse d'ecoute
+
+        """
+        self._server = make_server(
+            host, 0, wsgi_app, threaded=True, request_handler=_QuietHandler
+        )
+        self.url = f"http://{host}:{self._server.server_port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Arreter le serveur et attendre la fin du thread."""
+        self._server.shutdown()
+        self._thread.join()
+
+
+def parse_sizes(text: str) -> list[tuple[int, float]]:
+    """Parser une distribution "taille:poids,..." en liste de couples.
+
+    Raises:
+        ValueError: Si la distribution est vide ou mal formee
+
+    """
+    dist = []
+    for item in text.split(","):
+        size, _, weight = item.partition(":")
+        dist.append((int(size), float(weight or 1.0)))
+    if not dist or any(n < 3 or w <= 0 for n, w in dist):
+        raise ValueError(f"Distribution de tailles invalide: {text}")
+    return dist
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Percentile par rang le plus proche (valeurs deja triees)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(q / 100.0 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+def _random_pointset(n: int, rng: random.Random) -> bytes:
+    """Generer un PointSet binaire de n points aleatoires."""
+    coords = [rng.uniform(-100.0, 100.0) for _ in range(2 * n)]
+    return struct.pack(f"<I{2 * n}f", n, *coords)
+
+
+def _request(
+    url: str,
+    data: bytes | None = None,
+    timeout: float = 60.0,
+    headers: dict | None = None,
+):
+    """Send an HTTP request and return (status, body)."""
+    req = urllib.request.Request(
+        url, data=data, method="POST" if data else "GET", headers=headers or {}
+    )
+    if data is not None:
+        req.add_header("Content-Type", "application/octet-stream")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+    except OSError:
+        return 0, b""
+
+
+def run_load(
+    service_url: str,
+    psm_url: str,
+    requests: int = 1000,
+    concurrency: int = 8,
+    upload_ratio: float = 0.2,
+    sizes: list[tuple[int, float]] | None = None,
+    seed: int = 0,
+) -> dict:
+    """Run the mixed workload and return the report.
+
+    Args:
+        service_url: URL du Triangulator
+        psm_url: URL du PointSetManager
+        requests: Nombre total d'operations
+        concurrency: Nombre de clients simultanes
+        upload_ratio: Part des operations d'upload (0..1)
+        sizes: Distribution [(nombre de points, poids)]
+        seed: Graine du generateur aleatoire
+
+    Returns:
+        Rapport (voir summarize)
+
+    """
+    sizes = sizes or [(100, 0.7), (1000, 0.25), (10000, 0.05)]
+    rng = random.Random(seed)
+    counts, weights = zip(*sizes, strict=True)
+    lock = threading.Lock()
+    ids: list = []
+    # Au moins un PointSet disponible avant de trianguler
+    plan = ["upload"] + [
+        "upload" if rng.random() < upload_ratio else "triangulate"
+        for _ in range(requests - 1)
+    ]
+    payloads = {n: _random_pointset(n, rng) for n in counts}
+
+    def one(op: str, op_seed: int) -> tuple:
+        local = random.Random(op_seed)
+        start = time.perf_counter()
+        if op == "upload":
+            n = local.choices(counts, weights)[0]
+            status, body = _request(f"{psm_url}/pointset", payloads[n])
+            if status == 201:
+                with lock:
+                    ids.append(json.loads(body)["pointSetId"])
+        else:
+            with lock:
+                pid = local.choice(ids) if ids else None
+            if pid is None:
+                return op, 0.0, 0
+            status, _ = _request(f"{service_url}/triangulation/{pid}")
+        return op, time.perf_counter() - start, status
+
+    started = time.perf_counter()
+    # Le premier upload est fait avant d'ouvrir la concurrence
+    samples = [one(plan[0], seed)]
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples += list(pool.map(one, plan[1:], range(seed + 1, seed + requests)))
+    elapsed = time.perf_counter() - started
+    return summarize(samples, elapsed, concurrency)
+
+
+def summarize(samples: list[tuple], elapsed: float, concurrency: int) -> dict:
+    """Agreger les mesures (op, duree, statut) en rapport.
+
+    Returns:
+        Dict {elapsed_s, concurrency, throughput_rps, ops: {op: {...}}}
+
+    """
+    report = {
+        "elapsed_s": elapsed,
+        "concurrency": concurrency,
+        "throughput_rps": len(samples) / elapsed if elapsed > 0 else 0.0,
+        "ops": {},
+    }
+    for op in sorted({s[0] for s in samples} | {"all"}):
+        subset = samples if op == "all" else [s for s in samples if s[0] == op]
+        latencies = sorted(s[1] for s in subset)
+        statuses: dict = {}
+        for s in subset:
+            statuses[str(s[2])] = statuses.get(str(s[2]), 0) + 1
+        report["ops"][op] = {
+            "count": len(subset),
+            "errors": sum(1 for s in subset if not 200 <= s[2] < 300),
+            "statuses": statuses,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+        }
+    return report
+
+
+def start_local_stack() -> tuple:
+    """Demarrer le PointSetManager de substitution puis le service.
+
+    Le service est configure (TRIANGULATOR_PSM_URL) pour interroger ce
+    PointSetManager, puis importe et servi dans ce processus.
+
+    Returns:
+        Tuple (serveur service, serveur PointSetManager)
+
+    """
+    psm = BackgroundServer(PointSetManagerStub())
+    os.environ["TRIANGULATOR_PSM_URL"] = psm.url
+    from app import create_app
+
+    return BackgroundServer(create_app()), psm
+
+
+def format_report(report: dict) -> str:
+    """Rendu texte du rapport."""
+    lines = [
+        f"{report['throughput_rps']:.1f} req/s sur {report['elapsed_s']:.2f}s "
+        f"({report['concurrency']} clients)",
+        f"{'op':<12}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'max ms':>10}",
+    ]
+    for op, r in report["ops"].items():
+        lines.append(
+            f"{op:<12}{r['count']:>7}{r['errors']:>8}{r['p50_ms']:>10.1f}"
+            f"{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['max_ms']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entree: demarrer la pile locale si besoin, charger, afficher.
+
+    Returns:
+        0 si aucune operation n'a echoue, 1 sinon
+
+    """
+    parser = argparse.ArgumentParser(description="Banc de charge du Triangulator.")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--upload-ratio", type=float, default=0.2)
+    parser.add_argument("--sizes", default="100:0.7,1000:0.25,10000:0.05")
+    parser.add_argument("--target", help="URL d'un service deja demarre")
+    parser.add_argument("--psm", help="URL du PointSetManager utilise par --target")
+    parser.add_argument("--json", action="store_true", help="rapport JSON")
+    args = parser.parse_args(argv)
+
+    servers = []
+    if args.target:
+        if not args.psm:
+            parser.error("--psm est requis avec --target")
+        service_url, psm_url = args.target, args.psm
+    else:
+        servers = list(start_local_stack())
+        service_url, psm_url = servers[0].url, servers[1].url
+    try:
+        report = run_load(
+            service_url, psm_url, args.requests, args.concurrency,
+            args.upload_ratio, parse_sizes(args.sizes),
+        )
+    finally:
+        for server in servers:
+            server.stop()
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 1 if report["ops"]["all"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
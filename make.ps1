@@ -11,6 +11,11 @@ function Show-Help {
     Write-Host "  .\make.ps1 test       - Lancer tous les tests" -ForegroundColor Green
     Write-Host "  .\make.ps1 unit_test  - Lancer tests unitaires + integration" -ForegroundColor Green
     Write-Host "  .\make.ps1 perf_test  - Lancer tests de performance" -ForegroundColor Green
+    Write-Host "  .\make.ps1 bench      - Benchmark d'echelle du coeur" -ForegroundColor Green
+    Write-Host "  .\make.ps1 bench_record - Enregistrer la reference du benchmark" -ForegroundColor Green
+    Write-Host "  .\make.ps1 load_test  - Charge HTTP concurrente" -ForegroundColor Green
+    Write-Host "  .\make.ps1 store_bench - Debit des stores sous contention" -ForegroundColor Green
+    Write-Host "  .\make.ps1 startup_bench - Demarrage d'un worker" -ForegroundColor Green
     Write-Host "  .\make.ps1 coverage   - Generer rapport de couverture" -ForegroundColor Green
     Write-Host "  .\make.ps1 lint       - Verifier qualite du code" -ForegroundColor Green
     Write-Host "  .\make.ps1 doc        - Generer documentation HTML" -ForegroundColor Green
@@ -32,6 +37,31 @@ function Run-PerfTest {
     pytest tests/performance/ -v -m performance
 }
 
+function Run-Bench {
+    Write-Host "Benchmark d'echelle de triangulator_core..." -ForegroundColor Yellow
+    python triangulator_bench.py
+}
+
+function Run-BenchRecord {
+    Write-Host "Enregistrement de la reference du benchmark..." -ForegroundColor Yellow
+    python triangulator_bench.py --record
+}
+
+function Run-LoadTest {
+    Write-Host "Charge HTTP concurrente..." -ForegroundColor Yellow
+    python loadtest.py --requests 2000 --concurrency 16
+}
+
+function Run-StoreBench {
+    Write-Host "Debit des stores memoire sous contention..." -ForegroundColor Yellow
+    python store_bench.py --threads 1,2,4,8
+}
+
+function Run-StartupBench {
+    Write-Host "Demarrage d'un worker (import, create_app, premiere requete)..." -ForegroundColor Yellow
+    python startup_bench.py --runs 5
+}
+
 function Run-Coverage {
     Write-Host "Generation du rapport de couverture..." -ForegroundColor Yellow
     coverage run -m pytest tests/unit/ tests/integration/
@@ -64,6 +94,11 @@ switch ($Command.ToLower()) {
     "test" { Run-Test }
     "unit_test" { Run-UnitTest }
     "perf_test" { Run-PerfTest }
+    "bench" { Run-Bench }
+    "bench_record" { Run-BenchRecord }
+    "load_test" { Run-LoadTest }
+    "store_bench" { Run-StoreBench }
+    "startup_bench" { Run-StartupBench }
     "coverage" { Run-Coverage }
     "lint" { Run-Lint }
     "doc" { Run-Doc }
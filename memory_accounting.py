@@ -0,0 +1,175 @@
+"""Comptabilite memoire du service (tracemalloc), opt-in.
+
+Deux vues:
+- occupation: octets vivants du tas Python, regroupes par sous-systeme
+  selon le site d'allocation (frame la plus recente dans un module du
+  service: api, core, store, compression, metrics, admission; sinon http
+  pour Flask/Werkzeug, ou other)
+- pics: allocation maximale au-dela de l'occupation de depart, par
+  requete (endpoint) et par etape (parse, convert, compute, serialize...)
+
+Les pics s'appuient sur tracemalloc.reset_peak(), global au processus:
+avec des requetes simultanees, un pic peut etre attribue a une requete
+voisine ou manque. Les valeurs sont exactes en sequentiel, indicatives
+sous charge.
+
+Configuration (voir app.py):
+- TRIANGULATOR_MEMORY_TRACKING: "1" pour activer (defaut: desactive,
+  tracemalloc ralentit chaque allocation)
+- TRIANGULATOR_MEMORY_FRAMES: profondeur des traces (defaut: 16)
+"""
+
+import os
+import threading
+import tracemalloc
+
+# Module du service (nom de fichier) -> sous-systeme
+SUBSYSTEMS = {
+    "app.py": "api",
+    "triangulator_core.py": "core",
+    "cost_model.py": "core",
+    "pointset_store.py": "store",
+    "snapshot.py": "store",
+    "compression.py": "compression",
+    "metrics.py": "metrics",
+    "admission.py": "admission",
+    "memory_accounting.py": "diagnostics",
+}
+_HTTP_PACKAGES = ("werkzeug", "flask")
+
+
+def subsystem_of(traceback: tracemalloc.Traceback) -> str:
+    """Sous-systeme responsable d'une allocation (voir SUBSYSTEMS)."""
+    http = False
+    for frame in reversed(traceback):
+        name = os.path.basename(frame.filename)
+        if name in SUBSYSTEMS:
+            return SUBSYSTEMS[name]
+        http = http or any(p in frame.filename for p in _HTTP_PACKAGES)
+    return "http" if http else "other"
+
+
+class MemoryTracker:
+    """Occupation par sous-systeme et pics d'allocation par requete/etape."""
+
+    def __init__(self, frames: int = 16) -> None:
+        """Start tracemalloc if it is not already tracing.
+
+        Args:
+            frames: Profondeur des traces (attribution aux sous-systemes)
+
+        """
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start(frames)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # (type, nom) -> [nombre, dernier pic, pic max, somme des pics]
+        self._peaks: dict = {}
+
+    def _open_spans(self) -> list:
+        """Pile des mesures ouvertes du thread courant."""
+        spans = getattr(self._local, "spans", None)
+        if spans is None:
+            spans = self._local.spans = []
+        return spans
+
+    def _fold(self, spans: list) -> None:
+        """Fold the current peak into the open spans."""
+        peak = tracemalloc.get_traced_memory()[1]
+        for span in spans:
+            span[1] = max(span[1], peak - span[0])
+
+    def begin(self) -> list:
+        """Ouvrir une mesure de pic (imbricable: requete, puis etapes).
+
+        Returns:
+            Jeton a passer a end()
+
+        """
+        spans = self._open_spans()
+        self._fold(spans)
+        tracemalloc.reset_peak()
+        span = [tracemalloc.get_traced_memory()[0], 0]
+        spans.append(span)
+        return span
+
+    def end(self, span: list, kind: str, name: str) -> int:
+        """Fermer une mesure et l'enregistrer sous (kind, name).
+
+        Args:
+            span: Jeton retourne par begin()
+            kind: "request" ou "stage"
+            name: Endpoint ou nom de l'etape
+
+        Returns:
+            Pic d'allocation de la mesure (octets)
+
+        """
+        spans = self._open_spans()
+        self._fold(spans)
+        for i in range(len(spans) - 1, -1, -1):
+            if spans[i] is span:
+                del spans[i]
+                break
+        peak = max(0, span[1])
+        with self._lock:
+            entry = self._peaks.setdefault((kind, name), [0, 0, 0, 0])
+            entry[0] += 1
+            entry[1] = peak
+            entry[2] = max(entry[2], peak)
+            entry[3] += peak
+        return peak
+
+    def usage(self) -> dict:
+        """Octets vivants par sous-systeme (instantane tracemalloc)."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        usage: dict = {}
+        for stat in snapshot.statistics("traceback"):
+            name = subsystem_of(stat.traceback)
+            usage[name] = usage.get(name, 0) + stat.size
+        return dict(sorted(usage.items(), key=lambda item: -item[1]))
+
+    def report(self) -> dict:
+        """Rapport complet: tas trace, occupation et pics par requete/etape."""
+        current, _ = tracemalloc.get_traced_memory()
+        with self._lock:
+            peaks = {key: list(entry) for key, entry in self._peaks.items()}
+        sections: dict = {"request": {}, "stage": {}}
+        for (kind, name), (count, last, high, total) in sorted(peaks.items()):
+            sections.setdefault(kind, {})[name] = {
+                "count": count,
+                "last_peak_bytes": last,
+                "max_peak_bytes": high,
+                "mean_peak_bytes": total // count,
+            }
+        return {
+            "tracing": True,
+            "traced_bytes": current,
+            "subsystems": self.usage(),
+            "requests": sections["request"],
+            "stages": sections["stage"],
+        }
+
+    def stop(self) -> None:
+        """Arreter tracemalloc s'il a ete demarre par ce tracker."""
+        if self._started and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started = False
+
+
+def memory_tracker_from_env() -> MemoryTracker | None:
+    """Construire le tracker depuis l'environnement (None si desactive)."""
+    if os.environ.get("TRIANGULATOR_MEMORY_TRACKING", "") not in ("1", "true"):
+        return None
+    return MemoryTracker(int(os.environ.get("TRIANGULATOR_MEMORY_FRAMES", "16")))
+
+
+__all__ = [
+    "SUBSYSTEMS",
+    "MemoryTracker",
+    "memory_tracker_from_env",
+    "subsystem_of",
+]
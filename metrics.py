@@ -0,0 +1,243 @@
+"""Metriques du service au format texte Prometheus.
+
+Sans dependance externe: compteurs, jauges et histogrammes minimalistes,
+suffisants pour GET /metrics.
+
+- Counter: valeur croissante (ex: requetes par statut)
+- Gauge: valeur lue a la demande via une fonction (ex: octets du store)
+- Histogram: distribution par buckets cumulatifs (ex: latence par etape)
+
+Chaque metrique peut avoir des labels; les series sont creees a la
+premiere utilisation d'une combinaison de valeurs.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+# Buckets de latence (secondes), de 100 us a 30 s
+LATENCY_BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Buckets de taille (octets), de 64 o a 256 Mo
+SIZE_BUCKETS = tuple(64 * 4**i for i in range(12))
+
+
+def _format_value(value: float) -> str:
+    """Format a number for the text exposition."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    """Format labels as {a="x",b="y"} (empty if none)."""
+    parts = []
+    for name, value in zip(names, values, strict=True):
+        escaped = (
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        parts.append(f'{name}="{escaped}"')
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    """Base commune: nom, aide, labels et series."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()) -> None:
+        """Declare a metric.
+
+        Args:
+            name: Nom Prometheus
+            documentation: Texte d'aide (# HELP)
+            labelnames: Noms des labels
+
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: dict = {}
+
+    def _key(self, labels: dict) -> tuple:
+        """Valeurs des labels dans l'ordre declare.
+
+        Raises:
+            ValueError: Si les labels ne correspondent pas a la declaration
+
+        """
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Labels attendus pour {self.name}: {self.labelnames}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _samples(self) -> list[str]:
+        """Lignes d'echantillons (a definir par les sous-classes)."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Exposition texte de la metrique (HELP, TYPE, echantillons)."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Compteur croissant."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        """Incrementer la serie correspondant aux labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        """Valeur courante d'une serie (0 si jamais incrementee)."""
+        return self._series.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        """Une ligne par serie."""
+        with self._lock:
+            items = sorted(self._series.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}"
+            for k, v in items
+        ]
+
+
+class Gauge(_Metric):
+    """Jauge sans label dont la valeur est lue a chaque exposition."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, read) -> None:
+        """Declare a gauge backed by a callable.
+
+        Args:
+            name: Nom Prometheus
+            documentation: Texte d'aide
+            read: Fonction sans argument retournant la valeur courante
+
+        """
+        super().__init__(name, documentation)
+        self._read = read
+
+    def _samples(self) -> list[str]:
+        """Une seule ligne, valeur lue a l'instant."""
+        return [f"{self.name} {_format_value(self._read())}"]
+
+
+class Histogram(_Metric):
+    """Histogramme a buckets cumulatifs."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = LATENCY_BUCKETS,
+    ) -> None:
+        """Declare a histogram.
+
+        Args:
+            name: Nom Prometheus
+            documentation: Texte d'aide
+            labelnames: Noms des labels
+            buckets: Bornes superieures des buckets (croissantes)
+
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        """Enregistrer une observation."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # [compte par bucket..., somme, total]
+                series = [0] * len(self.buckets) + [0.0, 0]
+                self._series[key] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, **labels) -> int:
+        """Nombre d'observations d'une serie."""
+        series = self._series.get(self._key(labels))
+        return series[-1] if series else 0
+
+    @contextmanager
+    def time(self, **labels):
+        """Mesurer la duree d'un bloc (secondes)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self) -> list[str]:
+        """Buckets cumulatifs, somme et total pour chaque serie."""
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        lines = []
+        for key, series in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, series, strict=False):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                labels = _format_labels(self.labelnames, key, le)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {series[-1]}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class Registry:
+    """Ensemble de metriques exposees ensemble."""
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._metrics: list = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Ajouter une metrique et la retourner."""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Exposition texte Prometheus de toutes les metriques."""
+        return "\n".join(m.render() for m in self._metrics) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "CONTENT_TYPE",
+    "LATENCY_BUCKETS",
+    "SIZE_BUCKETS",
+]
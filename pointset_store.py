@@ -0,0 +1,1201 @@
+"""Stockage des PointSets et des triangulations calculees.
+
+Quatre implementations partagent la meme interface:
+- MemoryStore: dictionnaires en memoire du processus (LRU exact, un verrou)
+- ShardedMemoryStore: memoire du processus repartie en shards, lectures
+  sans verrou (backend memoire par defaut)
+- DiskStore: un fichier par entree, au format binaire du contrat
+  (PointSet / Triangles), relu via mmap
+- SharedMemoryStore: un segment multiprocessing.shared_memory par entree,
+  visible par tous les workers d'une meme machine
+
+Les cles sont des chaines generees par le service (UUID, cle de resultat).
+Les valeurs sont toujours des bytes au format binaire: le store ne connait
+pas la structure des points.
+"""
+
+import contextlib
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+# Cles autorisees pour un nom de fichier (UUID, suffixes d'algorithme, ...)
+_SAFE_KEY = re.compile(r"^[A-Za-z0-9_.:-]+$")
+
+# Type d'entree des stores memoire -> nom expose par items() / entries()
+_KINDS = {"p": "pointset", "r": "result"}
+
+
+class MemoryStore:
+    """Stockage en memoire du processus, borne en octets et en duree.
+
+    PointSets et resultats partagent un meme budget:
+    - max_bytes: taille totale des binaires conserves (None = illimite)
+    - ttl_seconds: duree de vie d'une entree apres ecriture (None = infinie)
+
+    Quand le budget est depasse, les entrees les moins recemment utilisees
+    (lecture ou ecriture) sont evincees. Une entree expiree se comporte
+    comme une entree inconnue: elle est supprimee a sa prochaine lecture,
+    ou par la premiere ecriture qui suit son expiration si elle n'est
+    jamais relue.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        clock=time.monotonic,
+    ) -> None:
+        """Create an empty store.
+
+        Args:
+            max_bytes: Budget total en octets (None = illimite)
+            ttl_seconds: Duree de vie des entrees (None = infinie)
+            clock: Horloge monotone (injectable pour les tests)
+
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (type, cle) -> (binaire, instant d'expiration ou None), ordre LRU
+        self._entries: OrderedDict = OrderedDict()
+        # (instant d'expiration, (type, cle)) par ordre d'ecriture, donc
+        # d'expiration (duree de vie unique)
+        self._expiry: deque = deque()
+        self._n_pointsets = 0
+        self._bytes = 0
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def _remove(self, entry_key: tuple) -> None:
+        """Supprimer une entree (verrou deja pris)."""
+        data, _ = self._entries.pop(entry_key)
+        self._bytes -= len(data)
+        if entry_key[0] == "p":
+            self._n_pointsets -= 1
+
+    def _put(self, entry_key: tuple, data: bytes) -> bool:
+        """Inserer une entree puis evincer selon le budget.
+
+        Returns:
+            False si l'entree depasse a elle seule le budget
+
+        """
+        data = bytes(data)
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return False
+        now = self._clock()
+        expires = None
+        if self.ttl_seconds is not None:
+            expires = now + self.ttl_seconds
+        with self._lock:
+            if entry_key in self._entries:
+                self._remove(entry_key)
+            self._entries[entry_key] = (data, expires)
+            self._bytes += len(data)
+            if entry_key[0] == "p":
+                self._n_pointsets += 1
+            if expires is not None:
+                self._expiry.append((expires, entry_key))
+                self._expire(now)
+            if self.max_bytes is not None:
+                while self._bytes > self.max_bytes:
+                    oldest = next(iter(self._entries))
+                    self._remove(oldest)
+                    self._counters["evictions"] += 1
+        return True
+
+    def _expire(self, now: float) -> None:
+        """Supprimer les entrees expirees, jamais relues (verrou deja pris)."""
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, entry_key = self._expiry.popleft()
+            item = self._entries.get(entry_key)
+            # Entree deja supprimee ou reecrite depuis: rien a faire
+            if item is not None and item[1] == expires:
+                self._remove(entry_key)
+                self._counters["expirations"] += 1
+
+    def _get(self, entry_key: tuple) -> bytes | None:
+        """Lire une entree et la marquer comme recemment utilisee."""
+        with self._lock:
+            item = self._entries.get(entry_key)
+            if item is None:
+                self._counters["misses"] += 1
+                return None
+            data, expires = item
+            if expires is not None and self._clock() >= expires:
+                self._remove(entry_key)
+                self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(entry_key)
+            self._counters["hits"] += 1
+            return data
+
+    def put_pointset(self, pointset_id: str, data: bytes) -> None:
+        """Enregistrer le binaire d'un PointSet.
+
+        Args:
+            pointset_id: Identifiant du PointSet
+            data: Bytes au format PointSet
+
+        Raises:
+            ValueError: Si le PointSet depasse a lui seul le budget du store
+
+        """
+        if not self._put(("p", pointset_id), data):
+            raise ValueError("PointSet trop volumineux pour le stockage")
+
+    def get_pointset(self, pointset_id: str) -> bytes | None:
+        """Retourner le binaire d'un PointSet ou None s'il est inconnu.
+
+        Args:
+            pointset_id: Identifiant du PointSet
+
+        Returns:
+            Bytes au format PointSet, ou None (inconnu, evince ou expire)
+
+        """
+        return self._get(("p", pointset_id))
+
+    def put_result(self, key: str, data: bytes) -> None:
+        """Mettre en cache une triangulation serialisee.
+
+        Un resultat plus gros que le budget n'est simplement pas conserve.
+
+        Args:
+            key: Cle du resultat
+            data: Bytes au format Triangles
+
+        """
+        self._put(("r", key), data)
+
+    def get_result(self, key: str) -> bytes | None:
+        """Retourner une triangulation en cache ou None.
+
+        Args:
+            key: Cle du resultat
+
+        Returns:
+            Bytes au format Triangles, ou None
+
+        """
+        return self._get(("r", key))
+
+    def result_path(self, key: str) -> str | None:
+        """Chemin du fichier d'un resultat (aucun en memoire).
+
+        Args:
+            key: Cle du resultat
+
+        Returns:
+            Toujours None
+
+        """
+        return None
+
+    def items(self) -> list[tuple[str, str, bytes, float | None]]:
+        """Entrees non expirees, des moins aux plus recemment utilisees.
+
+        Ne modifie ni l'ordre LRU ni les compteurs (voir snapshot.py).
+
+        Returns:
+            Liste de ("pointset" ou "result", cle, binaire, duree de vie
+            restante en secondes ou None)
+
+        """
+        now = self._clock()
+        with self._lock:
+            return [
+                (_KINDS[kind], key, data, None if expires is None else expires - now)
+                for (kind, key), (data, expires) in self._entries.items()
+                if expires is None or now < expires
+            ]
+
+    def stats(self) -> dict:
+        """Compteurs d'utilisation du store.
+
+        Returns:
+            Dict {backend, pointsets, entries, bytes, max_bytes, ttl_seconds,
+            hits, misses, evictions, expirations}
+
+        """
+        with self._lock:
+            return {
+                "backend": "memory",
+                "pointsets": self._n_pointsets,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                **self._counters,
+            }
+
+    def __contains__(self, pointset_id: object) -> bool:
+        """Indiquer si un PointSet est present (et le marquer comme utilise)."""
+        return self._get(("p", pointset_id)) is not None
+
+    def __len__(self) -> int:
+        """Nombre de PointSets enregistres."""
+        return self._n_pointsets
+
+
+class _Shard:
+    """Partie d'un ShardedMemoryStore: entrees, anneau CLOCK et verrou."""
+
+    def __init__(self) -> None:
+        """Create an empty shard."""
+        self.lock = threading.Lock()
+        # (type, cle) -> [binaire, expiration ou None, bit de reference]
+        self.entries: dict = {}
+        # Ordre d'insertion des cles pour l'algorithme CLOCK
+        self.ring: deque = deque()
+
+
+class ShardedMemoryStore:
+    """Stockage en memoire reparti en shards, un verrou par shard.
+
+    Les binaires stockes sont immuables: une lecture est un dict.get sans
+    verrou, suivi de la mise a 1 d'un bit de reference. Ecritures,
+    expirations et evictions ne prennent que le verrou du shard concerne
+    (et un verrou de comptabilite tres court), donc des requetes sur des
+    cles differentes ne se bloquent pas.
+
+    Le budget max_bytes reste global. L'eviction suit l'algorithme CLOCK
+    (seconde chance), approximation de LRU: une aiguille parcourt les
+    shards, une entree lue depuis son dernier passage est epargnee une
+    fois, une entree expiree est retiree en priorite, l'entree en cours
+    d'ecriture n'est jamais evincee. Avec une duree de vie, chaque
+    ecriture fait aussi avancer l'anneau de son shard de EXPIRE_STEPS
+    entrees en retirant les expirees: l'anneau est parcouru plus vite
+    qu'il ne grandit, une entree jamais relue ne reste pas en memoire. Une cle n'est
+    jamais retiree puis reinseree: un lecteur concurrent ne voit pas de
+    trou. Les compteurs hits / misses sont incrementes sans verrou
+    (valeurs indicatives sous forte concurrence).
+    """
+
+    # Entrees examinees par ecriture pour retirer les expirees
+    EXPIRE_STEPS = 2
+
+    def __init__(
+        self,
+        shards: int = 16,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        clock=time.monotonic,
+    ) -> None:
+        """Create an empty store.
+
+        Args:
+            shards: Nombre de shards (>= 1)
+            max_bytes: Budget total en octets (None = illimite)
+            ttl_seconds: Duree de vie des entrees (None = infinie)
+            clock: Horloge monotone (injectable pour les tests)
+
+        Raises:
+            ValueError: Si shards < 1
+
+        """
+        if shards < 1:
+            raise ValueError("Au moins un shard est requis")
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._shards = [_Shard() for _ in range(shards)]
+        self._accounting = threading.Lock()
+        self._hand = 0
+        self._n_pointsets = 0
+        self._bytes = 0
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def _shard(self, entry_key: tuple) -> _Shard:
+        """Shard responsable d'une cle."""
+        return self._shards[hash(entry_key) % len(self._shards)]
+
+    def _account(self, entry_key: tuple, delta_bytes: int, delta_count: int) -> None:
+        """Mettre a jour les totaux globaux."""
+        with self._accounting:
+            self._bytes += delta_bytes
+            if entry_key[0] == "p":
+                self._n_pointsets += delta_count
+
+    def _put(self, entry_key: tuple, data: bytes) -> bool:
+        """Inserer une entree puis evincer selon le budget.
+
+        Returns:
+            False si l'entree depasse a elle seule le budget
+
+        """
+        data = bytes(data)
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return False
+        now = self._clock()
+        expires = None
+        if self.ttl_seconds is not None:
+            expires = now + self.ttl_seconds
+        shard = self._shard(entry_key)
+        expired = []
+        with shard.lock:
+            old = shard.entries.get(entry_key)
+            # Remplacement atomique: la cle reste visible des lecteurs
+            shard.entries[entry_key] = [data, expires, False]
+            if old is None:
+                shard.ring.append(entry_key)
+            if expires is not None:
+                expired = self._expire(shard, now)
+        old_size = len(old[0]) if old is not None else 0
+        self._account(entry_key, len(data) - old_size, 0 if old is not None else 1)
+        for key, entry in expired:
+            self._account(key, -len(entry[0]), -1)
+        if expired:
+            with self._accounting:
+                self._counters["expirations"] += len(expired)
+        if self.max_bytes is not None:
+            self._evict(entry_key)
+        return True
+
+    def _expire(self, shard: _Shard, now: float) -> list:
+        """Advance the shard ring, removing expired entries (lock held).
+
+        Returns:
+            Couples (cle, entree) retires
+
+        """
+        removed = []
+        for _ in range(min(self.EXPIRE_STEPS, len(shard.ring))):
+            entry_key = shard.ring.popleft()
+            entry = shard.entries.get(entry_key)
+            if entry is None:
+                continue
+            if entry[1] is not None and now >= entry[1]:
+                del shard.entries[entry_key]
+                removed.append((entry_key, entry))
+            else:
+                shard.ring.append(entry_key)
+        return removed
+
+    def _evict(self, protected: tuple) -> None:
+        """Avancer l'aiguille CLOCK jusqu'a revenir sous le budget.
+
+        Args:
+            protected: Cle qui vient d'etre ecrite (jamais evincee ici)
+
+        """
+        while True:
+            with self._accounting:
+                if self._bytes <= self.max_bytes:
+                    return
+                shard = self._shards[self._hand]
+                self._hand = (self._hand + 1) % len(self._shards)
+            with shard.lock:
+                victim = self._clock_step(shard, protected)
+            if victim is not None:
+                entry_key, entry, expired = victim
+                self._account(entry_key, -len(entry[0]), -1)
+                with self._accounting:
+                    self._counters["expirations" if expired else "evictions"] += 1
+
+    def _clock_step(self, shard: _Shard, protected: tuple) -> tuple | None:
+        """Advance the CLOCK hand by one entry (shard lock held).
+
+        Returns:
+            (cle, entree, expiree) evincee, ou None (shard vide ou seconde
+            chance)
+
+        """
+        now = self._clock()
+        while shard.ring:
+            entry_key = shard.ring.popleft()
+            entry = shard.entries.get(entry_key)
+            if entry is None:
+                # Cle deja supprimee (expiration): entree perimee de l'anneau
+                continue
+            if entry_key == protected:
+                shard.ring.append(entry_key)
+                return None
+            expired = entry[1] is not None and now >= entry[1]
+            if entry[2] and not expired:
+                entry[2] = False
+                shard.ring.append(entry_key)
+                return None
+            del shard.entries[entry_key]
+            return entry_key, entry, expired
+        return None
+
+    def _get(self, entry_key: tuple) -> bytes | None:
+        """Lire une entree sans verrou et la marquer comme referencee."""
+        shard = self._shard(entry_key)
+        entry = shard.entries.get(entry_key)
+        if entry is None:
+            self._counters["misses"] += 1
+            return None
+        if entry[1] is not None and self._clock() >= entry[1]:
+            with shard.lock:
+                expired = shard.entries.get(entry_key) is entry
+                if expired:
+                    del shard.entries[entry_key]
+            if expired:
+                self._account(entry_key, -len(entry[0]), -1)
+                with self._accounting:
+                    self._counters["expirations"] += 1
+            self._counters["misses"] += 1
+            return None
+        entry[2] = True
+        self._counters["hits"] += 1
+        return entry[0]
+
+    def put_pointset(self, pointset_id: str, data: bytes) -> None:
+        """Enregistrer le binaire d'un PointSet.
+
+        Args:
+            pointset_id: Identifiant du PointSet
+            data: Bytes au format PointSet
+
+        Raises:
+            ValueError: Si le PointSet depasse a lui seul le budget du store
+
+        """
+        if not self._put(("p", pointset_id), data):
+            raise ValueError("PointSet trop volumineux pour le stockage")
+
+    def get_pointset(self, pointset_id: str) -> bytes | None:
+        """Retourner le binaire d'un PointSet ou None s'il est inconnu.
+
+        Args:
+            pointset_id: Identifiant du PointSet
+
+        Returns:
+            Bytes au format PointSet, ou None (inconnu, evince ou expire)
+
+        """
+        return self._get(("p", pointset_id))
+
+    def put_result(self, key: str, data: bytes) -> None:
+        """Mettre en cache une triangulation serialisee.
+
+        Un resultat plus gros que le budget n'est simplement pas conserve.
+
+        Args:
+            key: Cle du resultat
+            data: Bytes au format Triangles
+
+        """
+        self._put(("r", key), data)
+
+    def get_result(self, key: str) -> bytes | None:
+        """Retourner une triangulation en cache ou None.
+
+        Args:
+            key: Cle du resultat
+
+        Returns:
+            Bytes au format Triangles, ou None
+
+        """
+        return self._get(("r", key))
+
+    def result_path(self, key: str) -> str | None:
+        """Chemin du fichier d'un resultat (aucun en memoire).
+
+        Args:
+            key: Cle du resultat
+
+        Returns:
+            Toujours None
+
+        """
+        return None
+
+    def items(self) -> list[tuple[str, str, bytes, float | None]]:
+        """Entrees non expirees, shard par shard, par ordre d'insertion.
+
+        Ne modifie ni les bits de reference ni les compteurs (voir
+        snapshot.py).
+
+        Returns:
+            Liste de ("pointset" ou "result", cle, binaire, duree de vie
+            restante en secondes ou None)
+
+        """
+        now = self._clock()
+        found = []
+        for shard in self._shards:
+            with shard.lock:
+                # L'anneau peut citer deux fois une cle expiree puis reecrite
+                for entry_key in dict.fromkeys(shard.ring):
+                    entry = shard.entries.get(entry_key)
+                    if entry is None or not (entry[1] is None or now < entry[1]):
+                        continue
+                    expires_in = None if entry[1] is None else entry[1] - now
+                    found.append(
+                        (_KINDS[entry_key[0]], entry_key[1], entry[0], expires_in)
+                    )
+        return found
+
+    def stats(self) -> dict:
+        """Compteurs d'utilisation du store.
+
+        Returns:
+            Dict {backend, shards, pointsets, entries, bytes, max_bytes,
+            ttl_seconds, hits, misses, evictions, expirations}
+
+        """
+        entries = sum(len(shard.entries) for shard in self._shards)
+        with self._accounting:
+            return {
+                "backend": "memory",
+                "shards": len(self._shards),
+                "pointsets": self._n_pointsets,
+                "entries": entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                **self._counters,
+            }
+
+    def __contains__(self, pointset_id: object) -> bool:
+        """Indiquer si un PointSet est present (et le marquer comme utilise)."""
+        return self._get(("p", pointset_id)) is not None
+
+    def __len__(self) -> int:
+        """Nombre de PointSets enregistres."""
+        return self._n_pointsets
+
+
+class DiskStore:
+    """Stockage sur disque, un fichier par PointSet / resultat.
+
+    Arborescence:
+    - <root>/pointsets/<id>.bin: binaire PointSet
+    - <root>/results/<key>.bin: binaire Triangles
+
+    Les ecritures passent par un fichier temporaire puis os.replace, donc un
+    lecteur ne voit jamais un fichier partiellement ecrit. Les lectures
+    utilisent mmap: le noyau gere le cache de pages et le volume stocke
+    n'est pas limite par la RAM du processus.
+    """
+
+    def __init__(self, root: str) -> None:
+        """Open the store in directory root (created if missing).
+
+        Args:
+            root: Repertoire racine du store
+
+        """
+        self.root = os.path.abspath(root)
+        self._pointsets_dir = os.path.join(self.root, "pointsets")
+        self._results_dir = os.path.join(self.root, "results")
+        os.makedirs(self._pointsets_dir, exist_ok=True)
+        os.makedirs(self._results_dir, exist_ok=True)
+
+    def _path(self, directory: str, key: str) -> str:
+        """Construire le chemin d'une entree en refusant les cles dangereuses.
+
+        Raises:
+            ValueError: Si la cle contient des caracteres non autorises
+
+        """
+        if not _SAFE_KEY.match(key) or key.startswith("."):
+            raise ValueError(f"Cle de stockage invalide: {key!r}")
+        return os.path.join(directory, key + ".bin")
+
+    def _write(self, path: str, data: bytes) -> None:
+        """Ecrire un fichier de maniere atomique."""
+        directory = os.path.dirname(path)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def _read(self, path: str) -> mmap.mmap | bytes | None:
+        """Projeter un fichier en memoire (lecture seule)."""
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return b""
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+    def put_pointset(self, pointset_id: str, data: bytes) -> None:
+        """Enregistrer le binaire d'un PointSet sur disque.
+
+        Args:
+            pointset_id: Identifiant du PointSet
+            data: Bytes au format PointSet
+
+        """
+        self._write(self._path(self._pointsets_dir, pointset_id), data)
+
+    def get_pointset(self, pointset_id: str) -> mmap.mmap | bytes | None:
+        """Retourner le PointSet projete en memoire, ou None.
+
+        Args:
+            pointset_id: Identifiant du PointSet
+
+        Returns:
+            mmap en lecture seule au format PointSet, ou None
+
+        """
+        return self._read(self._path(self._pointsets_dir, pointset_id))
+
+    def put_result(self, key: str, data: bytes) -> None:
+        """Ecrire une triangulation serialisee sur disque.
+
+        Args:
+            key: Cle du resultat
+            data: Bytes au format Triangles
+
+        """
+        self._write(self._path(self._results_dir, key), data)
+
+    def get_result(self, key: str) -> mmap.mmap | bytes | None:
+        """Retourner une triangulation projetee en memoire, ou None.
+
+        Args:
+            key: Cle du resultat
+
+        Returns:
+            mmap en lecture seule au format Triangles, ou None
+
+        """
+        return self._read(self._path(self._results_dir, key))
+
+    def result_path(self, key: str) -> str | None:
+        """Chemin du fichier d'un resultat s'il existe.
+
+        Permet a l'application d'envoyer le fichier sans le recopier
+        (wsgi.file_wrapper / sendfile).
+
+        Args:
+            key: Cle du resultat
+
+        Returns:
+            Chemin absolu du fichier, ou None
+
+        """
+        path = self._path(self._results_dir, key)
+        return path if os.path.exists(path) else None
+
+    def stats(self) -> dict:
+        """Compteurs d'utilisation du store (parcours du repertoire).
+
+        Returns:
+            Dict {backend, pointsets, entries, bytes}
+
+        """
+        n_pointsets = n_entries = n_bytes = 0
+        for directory in (self._pointsets_dir, self._results_dir):
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(".bin"):
+                        continue
+                    n_entries += 1
+                    n_bytes += entry.stat().st_size
+                    if directory == self._pointsets_dir:
+                        n_pointsets += 1
+        return {
+            "backend": "disk",
+            "pointsets": n_pointsets,
+            "entries": n_entries,
+            "bytes": n_bytes,
+        }
+
+    def entries(self) -> list[tuple[str, str]]:
+        """Entrees du store, des plus anciennes aux plus recentes.
+
+        Returns:
+            Liste de couples ("pointset" ou "result", cle)
+
+        """
+        found = []
+        for kind, directory in (
+            ("pointset", self._pointsets_dir),
+            ("result", self._results_dir),
+        ):
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".bin"):
+                        found.append(
+                            (entry.stat().st_mtime_ns, kind, entry.name[:-4])
+                        )
+        found.sort()
+        return [(kind, key) for _, kind, key in found]
+
+    def __contains__(self, pointset_id: object) -> bool:
+        """Indiquer si un PointSet est enregistre."""
+        if not isinstance(pointset_id, str):
+            return False
+        try:
+            return os.path.exists(self._path(self._pointsets_dir, pointset_id))
+        except ValueError:
+            return False
+
+    def __len__(self) -> int:
+        """Nombre de PointSets enregistres."""
+        return sum(
+            1 for name in os.listdir(self._pointsets_dir) if name.endswith(".bin")
+        )
+
+
+def _shared_memory():
+    """Import multiprocessing.shared_memory on first use.
+
+    L'import coute plusieurs dizaines de ms: il est evite au demarrage
+    des workers qui n'utilisent pas ce backend.
+    """
+    from multiprocessing import shared_memory
+
+    return shared_memory
+
+
+class SharedMemoryStore:
+    """Stockage en memoire partagee entre processus d'une meme machine.
+
+    Chaque entree est un segment nomme "<prefix>_p_<id>" (PointSet) ou
+    "<prefix>_r_<cle>" (resultat). L'espace de noms des segments du systeme
+    sert d'index partage: un worker retrouve une entree ecrite par un autre
+    a partir de sa seule cle, sans table commune a synchroniser.
+
+    Layout d'un segment:
+    - 8 bytes (uint64 LE): longueur L du contenu, ecrite en dernier
+    - L bytes: contenu (binaire PointSet ou Triangles)
+
+    Une longueur nulle signifie "en cours d'ecriture": l'entree est alors
+    consideree absente. Les entrees sont immuables, un segment deja present
+    n'est jamais reecrit.
+
+    Un segment attache tient un descripteur de fichier et un mmap. Un
+    contenu de moins de copy_below octets est donc recopie et le segment
+    detache aussitot; au-dela, la lecture retourne une vue sans copie et
+    le segment reste attache, dans une LRU de max_attached segments par
+    processus. Avec max_bytes, chaque processus tient une estimation du
+    volume du prefixe (dernier parcours de /dev/shm, plus ses propres
+    ecritures). Quand elle depasse le budget, /dev/shm est parcouru et les
+    segments les plus anciens (tous processus confondus, Linux) sont
+    supprimes jusqu'a EVICT_TARGET x max_bytes: une ecriture ne coute un
+    parcours qu'apres avoir consomme cette marge. Les ecritures des autres
+    processus depuis leur dernier parcours ne sont pas vues: le volume
+    peut depasser le budget d'au plus une marge par processus.
+    """
+
+    _HEADER = struct.Struct("<Q")
+
+    # Fraction du budget visee apres un parcours (marge avant le suivant)
+    EVICT_TARGET = 0.9
+
+    def __init__(
+        self,
+        prefix: str = "triangulator",
+        max_bytes: int | None = None,
+        max_attached: int = 64,
+        copy_below: int = 1 << 20,
+    ) -> None:
+        """Open the shared store identified by prefix.
+
+        Args:
+            prefix: Prefixe des noms de segments (un par deploiement)
+            max_bytes: Volume total des segments du prefixe (None = illimite)
+            max_attached: Segments gardes attaches par ce processus
+            copy_below: Taille en dessous de laquelle une lecture recopie
+                le contenu au lieu de garder le segment attache
+
+        """
+        if not _SAFE_KEY.match(prefix):
+            raise ValueError(f"Prefixe de segment invalide: {prefix!r}")
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_attached = max_attached
+        self.copy_below = copy_below
+        self._lock = threading.Lock()
+        # Segments attaches par ce processus, ordre LRU (les memoryview
+        # retournees en dependent)
+        self._attached: OrderedDict = OrderedDict()
+        # Segments sortis de la LRU dont une vue etait encore utilisee
+        self._closing: list = []
+        # Volume estime du prefixe (None = inconnu, parcours a la prochaine
+        # ecriture)
+        self._volume: int | None = None
+
+    def _name(self, kind: str, key: str) -> str:
+        """Nom du segment d'une entree.
+
+        Raises:
+            ValueError: Si la cle contient des caracteres non autorises
+
+        """
+        if not _SAFE_KEY.match(key):
+            raise ValueError(f"Cle de stockage invalide: {key!r}")
+        return f"{self.prefix}_{kind}_{key}"
+
+    @staticmethod
+    def _untrack(segment: "SharedMemory") -> None:
+        """Retirer le segment du resource_tracker.
+
+        Sinon le segment serait detruit a la sortie du processus qui l'a
+        ouvert, alors qu'il appartient a tous les workers.
+        """
+        if sys.version_info < (3, 13) and os.name == "posix":
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(segment._name, "shared_memory")
+
+    @staticmethod
+    def _unlink(name: str) -> None:
+        """Supprimer un segment par son nom, hors resource_tracker.
+
+        SharedMemory.unlink() desinscrit aussi le segment du tracker, qui
+        ne le suit plus (voir _untrack): il afficherait une KeyError.
+        """
+        if os.name != "posix":
+            return
+        import _posixshmem
+
+        with contextlib.suppress(FileNotFoundError):
+            _posixshmem.shm_unlink("/" + name)
+
+    @staticmethod
+    def _close(segment: "SharedMemory") -> bool:
+        """Detacher un segment (False si une vue est encore utilisee)."""
+        try:
+            segment.close()
+        except BufferError:
+            return False
+        return True
+
+    def _release(self) -> None:
+        """Ramener la LRU a max_attached segments (verrou deja pris)."""
+        self._closing = [s for s in self._closing if not self._close(s)]
+        while len(self._attached) > self.max_attached:
+            _, segment = self._attached.popitem(last=False)
+            if not self._close(segment):
+                self._closing.append(segment)
+
+    def _attach(self, name: str) -> "SharedMemory | None":
+        """Attacher un segment existant et complet, ou None."""
+        shared_memory = _shared_memory()
+        try:
+            if sys.version_info >= (3, 13):
+                segment = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                segment = shared_memory.SharedMemory(name=name)
+                self._untrack(segment)
+        except FileNotFoundError:
+            return None
+        if self._HEADER.unpack_from(segment.buf, 0)[0] == 0:
+            # Ecriture en cours dans un autre processus
+            segment.close()
+            return None
+        return segment
+
+    def _put(self, name: str, data: bytes) -> bool:
+        """Creer un segment et y copier data (no-op si deja present).
+
+        Returns:
+            False si l'entree depasse a elle seule le budget
+
+        """
+        size = len(data)
+        if self.max_bytes is not None and self._HEADER.size + size > self.max_bytes:
+            return False
+        shared_memory = _shared_memory()
+        try:
+            if sys.version_info >= (3, 13):
+                segment = shared_memory.SharedMemory(
+                    name=name, create=True, size=self._HEADER.size + size,
+                    track=False,
+                )
+            else:
+                segment = shared_memory.SharedMemory(
+                    name=name, create=True, size=self._HEADER.size + size
+                )
+                self._untrack(segment)
+        except FileExistsError:
+            return True
+        segment.buf[self._HEADER.size : self._HEADER.size + size] = data
+        # La longueur est publiee en dernier: le contenu est alors complet
+        self._HEADER.pack_into(segment.buf, 0, size)
+        segment.close()
+        if self.max_bytes is not None:
+            with self._lock:
+                over = (
+                    self._volume is None
+                    or self._volume + segment.size > self.max_bytes
+                )
+                if not over:
+                    self._volume += segment.size
+            if over:
+                self._evict(name)
+        return True
+
+    def _evict(self, protected: str) -> None:
+        """Parcourir /dev/shm et ramener le volume a EVICT_TARGET x max_bytes.
+
+        Args:
+            protected: Segment qui vient d'etre ecrit (jamais supprime ici)
+
+        """
+        segments = []
+        for name in self._segment_names():
+            try:
+                st = os.stat(os.path.join("/dev/shm", name))
+            except OSError:
+                continue
+            segments.append((st.st_mtime_ns, name, st.st_size))
+        total = sum(size for _, _, size in segments)
+        target = total
+        if total > self.max_bytes:
+            target = self.EVICT_TARGET * self.max_bytes
+        for _, name, size in sorted(segments):
+            if total <= target:
+                break
+            if name == protected:
+                continue
+            self._unlink(name)
+            total -= size
+            with self._lock:
+                segment = self._attached.pop(name, None)
+                if segment is not None and not self._close(segment):
+                    self._closing.append(segment)
+        with self._lock:
+            self._volume = total
+
+    def _get(self, name: str) -> memoryview | bytes | None:
+        """Retourner le contenu d'un segment (copie ou vue), ou None."""
+        with self._lock:
+            segment = self._attached.get(name)
+            if segment is not None:
+                self._attached.move_to_end(name)
+                size = self._HEADER.unpack_from(segment.buf, 0)[0]
+                return segment.buf[self._HEADER.size : self._HEADER.size + size]
+        segment = self._attach(name)
+        if segment is None:
+            return None
+        size = self._HEADER.unpack_from(segment.buf, 0)[0]
+        if size < self.copy_below:
+            with segment.buf[self._HEADER.size : self._HEADER.size + size] as view:
+                data = bytes(view)
+            segment.close()
+            return data
+        with self._lock:
+            if name in self._attached:
+                # Attache entre-temps par un autre thread
+                segment.close()
+                segment = self._attached[name]
+            else:
+                self._attached[name] = segment
+                self._release()
+            return segment.buf[self._HEADER.size : self._HEADER.size + size]
+
+    def put_pointset(self, pointset_id: str, data: bytes) -> None:
+        """Enregistrer le binaire d'un PointSet en memoire partagee.
+
+        Args:
+            pointset_id: Identifiant du PointSet
+            data: Bytes au format PointSet
+
+        Raises:
+            ValueError: Si le PointSet depasse a lui seul le budget du store
+
+        """
+        if not self._put(self._name("p", pointset_id), data):
+            raise ValueError("PointSet trop volumineux pour le stockage")
+
+    def get_pointset(self, pointset_id: str) -> memoryview | bytes | None:
+        """Retourner le PointSet partage (copie ou vue), ou None.
+
+        Args:
+            pointset_id: Identifiant du PointSet
+
+        Returns:
+            Bytes ou memoryview au format PointSet, ou None
+
+        """
+        return self._get(self._name("p", pointset_id))
+
+    def put_result(self, key: str, data: bytes) -> None:
+        """Publier une triangulation serialisee pour tous les workers.
+
+        Un resultat plus gros que le budget n'est simplement pas conserve.
+
+        Args:
+            key: Cle du resultat
+            data: Bytes au format Triangles
+
+        """
+        self._put(self._name("r", key), data)
+
+    def get_result(self, key: str) -> memoryview | bytes | None:
+        """Retourner une triangulation partagee (copie ou vue), ou None.
+
+        Args:
+            key: Cle du resultat
+
+        Returns:
+            Bytes ou memoryview au format Triangles, ou None
+
+        """
+        return self._get(self._name("r", key))
+
+    def result_path(self, key: str) -> str | None:
+        """Chemin du fichier d'un resultat (aucun en memoire partagee).
+
+        Args:
+            key: Cle du resultat
+
+        Returns:
+            Toujours None
+
+        """
+        return None
+
+    def _segment_names(self) -> list[str]:
+        """Lister les segments de ce store (Linux: via /dev/shm)."""
+        start = self.prefix + "_"
+        try:
+            return [n for n in os.listdir("/dev/shm") if n.startswith(start)]
+        except FileNotFoundError:
+            return list(self._attached)
+
+    def close(self) -> None:
+        """Detacher les segments ouverts par ce processus."""
+        with self._lock:
+            segments = [*self._attached.values(), *self._closing]
+            self._attached.clear()
+            # Une vue encore utilisee garde son segment attache
+            self._closing = [s for s in segments if not self._close(s)]
+
+    def destroy(self) -> None:
+        """Detruire tous les segments du store (tous processus confondus)."""
+        self.close()
+        with self._lock:
+            self._volume = None
+        for name in self._segment_names():
+            self._unlink(name)
+
+    def stats(self) -> dict:
+        """Compteurs d'utilisation du store (tous processus confondus).
+
+        Returns:
+            Dict {backend, pointsets, entries, bytes, max_bytes, attached}
+
+        """
+        names = self._segment_names()
+        n_bytes = 0
+        for name in names:
+            try:
+                n_bytes += os.stat(os.path.join("/dev/shm", name)).st_size
+            except OSError:
+                continue
+        start = self.prefix + "_p_"
+        with self._lock:
+            attached = len(self._attached) + len(self._closing)
+        return {
+            "backend": "shm",
+            "pointsets": sum(1 for n in names if n.startswith(start)),
+            "entries": len(names),
+            "bytes": n_bytes,
+            "max_bytes": self.max_bytes,
+            "attached": attached,
+        }
+
+    def __contains__(self, pointset_id: object) -> bool:
+        """Indiquer si un PointSet est enregistre."""
+        if not isinstance(pointset_id, str):
+            return False
+        try:
+            name = self._name("p", pointset_id)
+        except ValueError:
+            return False
+        with self._lock:
+            if name in self._attached:
+                return True
+        segment = self._attach(name)
+        if segment is None:
+            return False
+        segment.close()
+        return True
+
+    def __len__(self) -> int:
+        """Nombre de PointSets enregistres."""
+        start = self.prefix + "_p_"
+        return sum(1 for n in self._segment_names() if n.startswith(start))
+
+
+def create_store(
+    backend: str | None = None, root: str | None = None
+) -> MemoryStore | ShardedMemoryStore | DiskStore | SharedMemoryStore:
+    """Construire le store selon la configuration.
+
+    Sans argument, lit les variables d'environnement:
+    - TRIANGULATOR_STORE: "memory" (defaut), "disk" ou "shm"
+    - TRIANGULATOR_STORE_DIR: repertoire du store disque
+    - TRIANGULATOR_SHM_PREFIX: prefixe des segments partages
+    - TRIANGULATOR_STORE_MAX_BYTES: budget du store memoire ou partage
+      (octets)
+    - TRIANGULATOR_STORE_TTL: duree de vie des entrees en memoire (secondes)
+    - TRIANGULATOR_STORE_SHARDS: shards du store memoire (defaut: 16;
+      1 = MemoryStore, LRU exact sous un verrou unique)
+
+    Args:
+        backend: Nom du backend
+        root: Repertoire racine (backend disque)
+
+    Returns:
+        Instance de store
+
+    Raises:
+        ValueError: Si le backend est inconnu ou mal configure
+
+    """
+    if backend is None:
+        backend = os.environ.get("TRIANGULATOR_STORE", "memory")
+    if root is None:
+        root = os.environ.get("TRIANGULATOR_STORE_DIR")
+    if backend == "memory":
+        max_bytes = os.environ.get("TRIANGULATOR_STORE_MAX_BYTES")
+        ttl = os.environ.get("TRIANGULATOR_STORE_TTL")
+        shards = int(os.environ.get("TRIANGULATOR_STORE_SHARDS", "16"))
+        options = {
+            "max_bytes": int(max_bytes) if max_bytes else None,
+            "ttl_seconds": float(ttl) if ttl else None,
+        }
+        if shards <= 1:
+            return MemoryStore(**options)
+        return ShardedMemoryStore(shards, **options)
+    if backend == "disk":
+        if not root:
+            raise ValueError("TRIANGULATOR_STORE_DIR requis pour le store disque")
+        return DiskStore(root)
+    if backend == "shm":
+        max_bytes = os.environ.get("TRIANGULATOR_STORE_MAX_BYTES")
+        return SharedMemoryStore(
+            os.environ.get("TRIANGULATOR_SHM_PREFIX", "triangulator"),
+            max_bytes=int(max_bytes) if max_bytes else None,
+        )
+    raise ValueError(f"Backend de stockage inconnu: {backend}")
+
+
+__all__ = [
+    "MemoryStore",
+    "ShardedMemoryStore",
+    "DiskStore",
+    "SharedMemoryStore",
+    "create_store",
+]
@@ -0,0 +1,142 @@
+"""Echantillonnage des requetes lentes (cProfile ou tracemalloc).
+
+Desactive par defaut. Active si TRIANGULATOR_PROFILE_DIR est defini:
+- TRIANGULATOR_PROFILE_DIR: repertoire ou ecrire les captures
+- TRIANGULATOR_PROFILE_THRESHOLD_MS: seuil de latence (defaut: 1000)
+- TRIANGULATOR_PROFILE_MODE: "cprofile" (defaut) ou "tracemalloc"
+- TRIANGULATOR_PROFILE_RATE: fraction des requetes instrumentees (defaut: 1.0)
+- TRIANGULATOR_PROFILE_MAX_FILES: captures conservees (defaut: 100)
+
+Une requete echantillonnee est instrumentee du debut a la fin; la capture
+n'est ecrite que si sa duree depasse le seuil. Les captures se relisent
+avec pstats (.prof) ou tracemalloc.Snapshot.load (.tracemalloc).
+"""
+
+import cProfile
+import os
+import random
+import re
+import time
+import tracemalloc
+
+MODES = ("cprofile", "tracemalloc")
+
+
+class SlowRequestSampler:
+    """Capture un profil des requetes qui depassent un seuil de latence."""
+
+    def __init__(
+        self,
+        output_dir: str,
+        threshold_ms: float = 1000.0,
+        mode: str = "cprofile",
+        sample_rate: float = 1.0,
+        max_files: int = 100,
+    ) -> None:
+        """Configure the sampler.
+
+        Args:
+            output_dir: Repertoire des captures (cree si absent)
+            threshold_ms: Duree minimale pour conserver une capture
+            mode: "cprofile" ou "tracemalloc"
+            sample_rate: Fraction des requetes instrumentees (0..1)
+            max_files: Nombre maximal de captures conservees
+
+        Raises:
+            ValueError: Si le mode est inconnu
+
+        """
+        if mode not in MODES:
+            raise ValueError(f"Mode de profilage inconnu: {mode}")
+        self.output_dir = output_dir
+        self.threshold_ms = threshold_ms
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.max_files = max_files
+        os.makedirs(output_dir, exist_ok=True)
+        if mode == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def start(self) -> cProfile.Profile | bool | None:
+        """Demarrer l'instrumentation d'une requete si elle est echantillonnee.
+
+        Returns:
+            Jeton a passer a finish(), ou None si non echantillonnee
+
+        """
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+        if self.mode == "tracemalloc":
+            return True
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python >= 3.12: un seul profileur actif a la fois
+            return None
+        return profiler
+
+    def finish(self, token, elapsed_s: float, label: str) -> str | None:
+        """Terminer l'instrumentation et ecrire la capture si la requete est lente.
+
+        Args:
+            token: Valeur retournee par start()
+            elapsed_s: Duree de la requete (secondes)
+            label: Description courte (methode + route)
+
+        Returns:
+            Chemin de la capture ecrite, ou None
+
+        """
+        if token is None:
+            return None
+        if isinstance(token, cProfile.Profile):
+            token.disable()
+        elapsed_ms = elapsed_s * 1000.0
+        if elapsed_ms < self.threshold_ms:
+            return None
+        safe = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_") or "request"
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = f"{stamp}-{time.time_ns() % 10**9:09d}-{safe}-{elapsed_ms:.0f}ms"
+        if isinstance(token, cProfile.Profile):
+            path = os.path.join(self.output_dir, base + ".prof")
+            token.dump_stats(path)
+        else:
+            path = os.path.join(self.output_dir, base + ".tracemalloc")
+            tracemalloc.take_snapshot().dump(path)
+        self._prune()
+        return path
+
+    def _prune(self) -> None:
+        """Supprimer les captures les plus anciennes au-dela de max_files."""
+        names = sorted(
+            n for n in os.listdir(self.output_dir)
+            if n.endswith((".prof", ".tracemalloc"))
+        )
+        for name in names[: max(0, len(names) - self.max_files)]:
+            os.unlink(os.path.join(self.output_dir, name))
+
+
+def sampler_from_env() -> SlowRequestSampler | None:
+    """Construire le sampler depuis l'environnement (None si desactive).
+
+    Returns:
+        SlowRequestSampler, ou None si TRIANGULATOR_PROFILE_DIR est absent
+
+    """
+    output_dir = os.environ.get("TRIANGULATOR_PROFILE_DIR")
+    if not output_dir:
+        return None
+    return SlowRequestSampler(
+        output_dir,
+        threshold_ms=float(os.environ.get("TRIANGULATOR_PROFILE_THRESHOLD_MS", "1000")),
+        mode=os.environ.get("TRIANGULATOR_PROFILE_MODE", "cprofile"),
+        sample_rate=float(os.environ.get("TRIANGULATOR_PROFILE_RATE", "1.0")),
+        max_files=int(os.environ.get("TRIANGULATOR_PROFILE_MAX_FILES", "100")),
+    )
+
+
+__all__ = [
+    "SlowRequestSampler",
+    "sampler_from_env",
+]
@@ -0,0 +1,75 @@
+"""Client HTTP minimal du PointSetManager (stdlib uniquement).
+
+Utilise par le Triangulator quand TRIANGULATOR_PSM_URL est defini: un
+PointSetID inconnu localement est alors demande au PointSetManager
+(GET /pointset/{id}, voir TP/point_set_manager.yml).
+
+urllib.request est importe au premier appel: un worker sans
+PointSetManager ne paie pas son import au demarrage.
+"""
+
+import os
+
+
+class PointSetManagerError(Exception):
+    """Le PointSetManager est injoignable ou a repondu une erreur serveur."""
+
+
+class PointSetManagerClient:
+    """Acces en lecture aux PointSets du PointSetManager."""
+
+    def __init__(self, base_url: str, timeout: float = 5.0) -> None:
+        """Configure the client.
+
+        Args:
+            base_url: URL racine du PointSetManager (ex: http://psm:8000)
+            timeout: Delai maximal d'une requete (secondes)
+
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def get_pointset(self, pointset_id: str) -> bytes | None:
+        """Recuperer le binaire d'un PointSet.
+
+        Args:
+            pointset_id: Identifiant du PointSet
+
+        Returns:
+            Bytes au format PointSet, ou None si le PointSet n'existe pas
+
+        Raises:
+            PointSetManagerError: Si le service est injoignable ou en erreur
+
+        """
+        import urllib.error
+        import urllib.request
+
+        url = f"{self.base_url}/pointset/{pointset_id}"
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as resp:
+                return resp.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise PointSetManagerError(
+                f"PointSetManager a repondu {e.code}"
+            ) from e
+        except (urllib.error.URLError, OSError) as e:
+            raise PointSetManagerError(f"PointSetManager injoignable: {e}") from e
+
+
+def psm_client_from_env() -> PointSetManagerClient | None:
+    """Construire le client depuis TRIANGULATOR_PSM_URL (None si absent)."""
+    url = os.environ.get("TRIANGULATOR_PSM_URL")
+    if not url:
+        return None
+    timeout = float(os.environ.get("TRIANGULATOR_PSM_TIMEOUT", "5"))
+    return PointSetManagerClient(url, timeout)
+
+
+__all__ = [
+    "PointSetManagerClient",
+    "PointSetManagerError",
+    "psm_client_from_env",
+]
@@ -0,0 +1,359 @@
+"""Snapshot des stores en memoire (PointSets et resultats en cache).
+
+Un snapshot est un fichier unique:
+- en-tete de 24 octets: SNAPSHOT_MAGIC, uint8 version, 3 x uint8 0,
+  uint32 LE nombre d'entrees, uint32 LE taille de l'index, float64 LE
+  date d'ecriture (secondes depuis l'epoch)
+- les binaires stockes, tels quels (formats PointSet / Triangles du contrat)
+- l'index en fin de fichier: par entree, uint8 type (0 PointSet,
+  1 resultat), uint16 LE longueur de la cle, la cle (ASCII), uint64 LE
+  offset, uint64 LE longueur du binaire et float64 LE duree de vie
+  restante a l'ecriture (secondes, +inf si aucune)
+
+Les entrees restaurees gardent leur duree de vie: une entree expiree
+depuis l'ecriture du snapshot est absente, et n'est pas reecrite dans le
+snapshot suivant. Les snapshots de version 1 (sans dates) restent
+lisibles: leurs entrees prennent la duree de vie du store a partir de la
+date du fichier.
+
+Au demarrage, le fichier est projete en memoire (mmap) et seul l'index est
+lu: les binaires sont servis depuis le cache de pages du noyau a la
+demande, sans etre recopies. Ecriture atomique (fichier temporaire puis
+os.replace): un worker qui redemarre ne lit jamais un snapshot partiel.
+
+Configuration (voir app.py):
+- TRIANGULATOR_SNAPSHOT_PATH: fichier du snapshot (defaut: aucun)
+- TRIANGULATOR_SNAPSHOT_INTERVAL: periode d'ecriture en secondes
+  (defaut: 300, 0 = seulement a l'arret)
+"""
+
+import logging
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+SNAPSHOT_MAGIC = b"TRSN"
+SNAPSHOT_VERSION = 2
+_HEADER_V1 = struct.Struct("<4sBxxxII")
+_HEADER = struct.Struct("<4sBxxxIId")
+_ENTRY = struct.Struct("<BH")
+_LOCATION_V1 = struct.Struct("<QQ")
+_LOCATION = struct.Struct("<QQd")
+_KIND_CODES = {"pointset": 0, "result": 1}
+_KIND_NAMES = {code: kind for kind, code in _KIND_CODES.items()}
+
+logger = logging.getLogger(__name__)
+
+
+def write_snapshot(items: list, path: str, max_bytes: int | None = None) -> int:
+    """Ecrire des entrees dans un fichier snapshot (atomique).
+
+    Args:
+        items: Entrees ("pointset" ou "result", cle, binaire, duree de vie
+            restante en secondes ou None), des plus anciennes aux plus
+            recentes
+        path: Fichier de destination
+        max_bytes: Volume maximal des binaires: les entrees les plus
+            anciennes sont omises au-dela (None = tout ecrire)
+
+    Returns:
+        Nombre d'entrees ecrites
+
+    """
+    if max_bytes is not None:
+        total, first = 0, len(items)
+        while first > 0 and total + len(items[first - 1][2]) <= max_bytes:
+            first -= 1
+            total += len(items[first][2])
+        items = items[first:]
+    index = bytearray()
+    offset = _HEADER.size
+    for kind, key, data, expires_in in items:
+        encoded = key.encode("ascii")
+        index += _ENTRY.pack(_KIND_CODES[kind], len(encoded)) + encoded
+        index += _LOCATION.pack(
+            offset, len(data), math.inf if expires_in is None else expires_in
+        )
+        offset += len(data)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(items), len(index),
+                time.time(),
+            ))
+            for _, _, data, _ in items:
+                f.write(data)
+            f.write(index)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return len(items)
+
+
+class Snapshot:
+    """Snapshot en lecture seule, projete en memoire.
+
+    Une entree expiree (date d'ecriture du snapshot + duree de vie
+    restante depassee) est absente de get(), items(), len() et in.
+    """
+
+    def __init__(
+        self, path: str, ttl_seconds: float | None = None, clock=time.time
+    ) -> None:
+        """Map the file and read its index (entries are not read).
+
+        Args:
+            path: Fichier ecrit par write_snapshot
+            ttl_seconds: Duree de vie du store, appliquee a partir de la
+                date du snapshot aux entrees qui n'en ont pas (None = infinie)
+            clock: Horloge murale (injectable pour les tests)
+
+        Raises:
+            ValueError: Si le fichier n'est pas un snapshot valide
+
+        """
+        self.path = path
+        self._clock = clock
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size < _HEADER_V1.size:
+                raise ValueError("Snapshot invalide: en-tete manquant")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        size = st.st_size
+        magic, version, count, index_size = _HEADER_V1.unpack_from(self._map, 0)
+        if magic != SNAPSHOT_MAGIC or version not in (1, SNAPSHOT_VERSION):
+            raise ValueError("Snapshot invalide: format ou version inconnus")
+        if version == 1:
+            written_at, location = st.st_mtime, _LOCATION_V1
+        elif size < _HEADER.size:
+            raise ValueError("Snapshot invalide: en-tete manquant")
+        else:
+            written_at, location = _HEADER.unpack_from(self._map, 0)[4], _LOCATION
+        self.written_at = written_at
+        default_deadline = math.inf
+        if ttl_seconds is not None:
+            default_deadline = written_at + ttl_seconds
+        # (type, cle) -> (offset, longueur, date d'expiration murale)
+        self._entries: dict = {}
+        off = size - index_size
+        for _ in range(count):
+            if off + _ENTRY.size > size:
+                raise ValueError("Snapshot invalide: index tronque")
+            code, key_size = _ENTRY.unpack_from(self._map, off)
+            off += _ENTRY.size
+            key = bytes(self._map[off : off + key_size]).decode("ascii")
+            off += key_size
+            if off + location.size > size:
+                raise ValueError("Snapshot invalide: index tronque")
+            start, length, *expires_in = location.unpack_from(self._map, off)
+            off += location.size
+            if code not in _KIND_NAMES or start + length > size - index_size:
+                raise ValueError("Snapshot invalide: entree hors du fichier")
+            deadline = default_deadline
+            if expires_in and expires_in[0] != math.inf:
+                deadline = written_at + expires_in[0]
+            self._entries[(_KIND_NAMES[code], key)] = (start, length, deadline)
+        self.bytes = sum(length for _, length, _ in self._entries.values())
+
+    def get(self, kind: str, key: str) -> memoryview | None:
+        """Retourner une vue sur le binaire d'une entree, ou None (expiree)."""
+        location = self._entries.get((kind, key))
+        if location is None or self._clock() >= location[2]:
+            return None
+        start, length, _ = location
+        return memoryview(self._map)[start : start + length]
+
+    def items(self) -> list:
+        """Entrees non expirees, dans l'ordre du fichier.
+
+        Returns:
+            Liste de (type, cle, vue, duree de vie restante ou None)
+
+        """
+        now = self._clock()
+        return [
+            (
+                kind, key, memoryview(self._map)[start : start + length],
+                None if deadline == math.inf else deadline - now,
+            )
+            for (kind, key), (start, length, deadline) in self._entries.items()
+            if now < deadline
+        ]
+
+    def __contains__(self, entry: object) -> bool:
+        """Indiquer si une entree (type, cle) est presente et non expiree."""
+        location = self._entries.get(entry)
+        return location is not None and self._clock() < location[2]
+
+    def __len__(self) -> int:
+        """Nombre d'entrees non expirees."""
+        now = self._clock()
+        return sum(1 for _, _, deadline in self._entries.values() if now < deadline)
+
+
+class SnapshotStore:
+    """Store en memoire complete par un snapshot relu a la demande.
+
+    Les ecritures vont au store en memoire; une lecture absente de celui-ci
+    est servie par le snapshot (vue sur le mmap, sans copie), tant que sa
+    duree de vie d'origine n'est pas ecoulee. Les entrees du snapshot ne
+    comptent pas dans le budget du store en memoire; le snapshot suivant
+    les reecrit dans ce budget, apres les plus recentes.
+    """
+
+    def __init__(self, store, snapshot: Snapshot) -> None:
+        """Wrap store with the entries of snapshot.
+
+        Args:
+            store: Store en memoire (MemoryStore ou ShardedMemoryStore)
+            snapshot: Snapshot restaure au demarrage
+
+        """
+        self.store = store
+        self.snapshot = snapshot
+
+    def put_pointset(self, pointset_id: str, data: bytes) -> None:
+        """Enregistrer le binaire d'un PointSet dans le store en memoire."""
+        self.store.put_pointset(pointset_id, data)
+
+    def get_pointset(self, pointset_id: str):
+        """Retourner le binaire d'un PointSet (memoire, puis snapshot)."""
+        data = self.store.get_pointset(pointset_id)
+        if data is None:
+            data = self.snapshot.get("pointset", pointset_id)
+        return data
+
+    def put_result(self, key: str, data: bytes) -> None:
+        """Mettre en cache une triangulation dans le store en memoire."""
+        self.store.put_result(key, data)
+
+    def get_result(self, key: str):
+        """Retourner une triangulation en cache (memoire, puis snapshot)."""
+        data = self.store.get_result(key)
+        if data is None:
+            data = self.snapshot.get("result", key)
+        return data
+
+    def result_path(self, key: str) -> str | None:
+        """Chemin du fichier d'un resultat (aucun: memoire ou snapshot)."""
+        return None
+
+    def items(self) -> list:
+        """Entrees du snapshot non remplacees ni expirees, puis celles du store."""
+        current = self.store.items()
+        fresh = {(kind, key) for kind, key, _, _ in current}
+        restored = [item for item in self.snapshot.items() if item[:2] not in fresh]
+        return restored + current
+
+    def stats(self) -> dict:
+        """Compteurs du store en memoire et taille du snapshot."""
+        return {
+            **self.store.stats(),
+            "snapshot_entries": len(self.snapshot),
+            "snapshot_bytes": self.snapshot.bytes,
+        }
+
+    def __contains__(self, pointset_id: object) -> bool:
+        """Indiquer si un PointSet est present (memoire ou snapshot)."""
+        return pointset_id in self.store or ("pointset", pointset_id) in self.snapshot
+
+    def __len__(self) -> int:
+        """Nombre de PointSets (memoire et snapshot, sans doublon)."""
+        return sum(1 for kind, _, _, _ in self.items() if kind == "pointset")
+
+
+def load_snapshot(path: str, ttl_seconds: float | None = None) -> Snapshot | None:
+    """Restaurer un snapshot s'il existe et est valide (None sinon).
+
+    Args:
+        path: Fichier du snapshot
+        ttl_seconds: Duree de vie du store (voir Snapshot)
+
+    """
+    try:
+        return Snapshot(path, ttl_seconds)
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        logger.warning("Snapshot ignore (%s): %s", path, e)
+        return None
+
+
+class SnapshotWriter:
+    """Ecriture periodique du snapshot d'un store, en tache de fond."""
+
+    def __init__(self, get_store, path: str, interval: float = 300.0) -> None:
+        """Configure the writer.
+
+        Args:
+            get_store: Fonction retournant le store courant (items())
+            path: Fichier du snapshot
+            interval: Periode d'ecriture en secondes (0 = a l'arret seulement)
+
+        """
+        self._get_store = get_store
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def write(self) -> int:
+        """Ecrire un snapshot du store courant.
+
+        Le volume est borne par le budget du store (max_bytes): les
+        entrees les plus recentes sont conservees.
+
+        Returns:
+            Nombre d'entrees ecrites
+
+        """
+        store = self._get_store()
+        max_bytes = getattr(getattr(store, "store", store), "max_bytes", None)
+        with self._lock:
+            written = write_snapshot(store.items(), self.path, max_bytes)
+        logger.info("Snapshot ecrit: %d entrees dans %s", written, self.path)
+        return written
+
+    def _run(self) -> None:
+        """Boucle d'ecriture periodique."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except Exception:
+                logger.exception("Echec de l'ecriture du snapshot")
+
+    def start(self) -> None:
+        """Demarrer l'ecriture periodique (sans effet si interval <= 0)."""
+        if self.interval > 0 and self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="triangulator-snapshot", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Arreter l'ecriture periodique et ecrire un dernier snapshot."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.write()
+
+
+__all__ = [
+    "SNAPSHOT_MAGIC",
+    "Snapshot",
+    "SnapshotStore",
+    "SnapshotWriter",
+    "load_snapshot",
+    "write_snapshot",
+]
@@ -0,0 +1,114 @@
+"""Benchmark de demarrage d'un worker Triangulator.
+
+Chaque mesure tourne dans un interpreteur neuf (sous-processus) et donne:
+- import_ms: import du module app (dependances comprises)
+- create_ms: create_app()
+- first_request_ms: premier POST /pointset puis GET /triangulation
+  (client de test Flask, sans reseau)
+- modules: modules optionnels deja importes apres la premiere requete
+
+Le rapport donne la mediane de chaque duree sur --runs interpreteurs.
+
+Usage:
+    python startup_bench.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules dont l'import est differe jusqu'au premier usage
+OPTIONAL_MODULES = (
+    "urllib.request",
+    "multiprocessing.shared_memory",
+    "concurrent.futures.process",
+)
+
+_PROBE = """
+import json, struct, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+application = app.create_app()
+created = time.perf_counter()
+client = application.test_client()
+body = struct.pack("<I6f", 3, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0)
+resp = client.post("/pointset", data=body, content_type="application/octet-stream")
+resp = client.get("/triangulation/" + resp.get_json()["pointSetId"])
+assert resp.status_code == 200, resp.status_code
+done = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "create_ms": (created - imported) * 1000,
+    "first_request_ms": (done - created) * 1000,
+    "modules": [m for m in %r if m in sys.modules],
+}))
+"""
+
+
+def measure_startup(env: dict | None = None) -> dict:
+    """Mesurer un demarrage dans un interpreteur neuf.
+
+    Args:
+        env: Variables d'environnement ajoutees (configuration du service)
+
+    Returns:
+        Dict {import_ms, create_ms, first_request_ms, modules}
+
+    Raises:
+        RuntimeError: Si le sous-processus echoue
+
+    """
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE % (OPTIONAL_MODULES,)],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env={**os.environ, **(env or {})},
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Echec de la mesure de demarrage:\n{proc.stderr}")
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def run(runs: int = 5, env: dict | None = None) -> dict:
+    """Mesurer runs demarrages et en donner les medianes.
+
+    Returns:
+        Dict {runs, import_ms, create_ms, first_request_ms, modules}
+
+    """
+    samples = [measure_startup(env) for _ in range(runs)]
+    report = {"runs": runs}
+    for field in ("import_ms", "create_ms", "first_request_ms"):
+        report[field] = statistics.median(s[field] for s in samples)
+    report["modules"] = sorted({m for s in samples for m in s["modules"]})
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entree: mesurer et afficher le rapport."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="rapport JSON")
+    args = parser.parse_args(argv)
+
+    report = run(args.runs)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(
+        f"import {report['import_ms']:.1f}ms, create_app {report['create_ms']:.1f}ms, "
+        f"premiere requete {report['first_request_ms']:.1f}ms "
+        f"(mediane sur {report['runs']})"
+    )
+    print(f"modules optionnels charges: {', '.join(report['modules']) or 'aucun'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
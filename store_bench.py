@@ -0,0 +1,112 @@
+"""Benchmark de contention des stores en memoire (MemoryStore / sharde).
+
+Plusieurs threads executent un melange lectures / ecritures sur un meme
+store; le rapport donne le debit (operations par seconde) par nombre de
+threads. Avec un verrou global le debit plafonne; le store sharde lit
+sans verrou et n'ecrit que sous le verrou d'un shard, ce qui passe a
+l'echelle sur un CPython sans GIL (3.13t) et reduit l'attente sinon.
+
+Usage:
+    python store_bench.py --threads 1,2,4,8 --ops 20000
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+from pointset_store import MemoryStore, ShardedMemoryStore
+
+STORES = {
+    "memory": MemoryStore,
+    "sharded": ShardedMemoryStore,
+}
+
+
+def contention_benchmark(
+    store, threads: int, ops: int, read_ratio: float = 0.9, keys: int = 1024
+) -> float:
+    """Mesurer le debit d'un store sous acces concurrents.
+
+    Args:
+        store: Store a mesurer (prerempli ici avec keys entrees)
+        threads: Nombre de threads simultanes
+        ops: Nombre d'operations par thread
+        read_ratio: Part des lectures (0..1)
+        keys: Nombre de cles distinctes
+
+    Returns:
+        Operations par seconde, tous threads confondus
+
+    """
+    payload = b"\x03\x00\x00\x00" + b"\x00" * 24
+    for k in range(keys):
+        store.put_pointset(f"k{k}", payload)
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        plan = [
+            (rng.random() < read_ratio, f"k{rng.randrange(keys)}") for _ in range(ops)
+        ]
+        barrier.wait()
+        for read, key in plan:
+            if read:
+                store.get_pointset(key)
+            else:
+                store.put_pointset(key, payload)
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def run(thread_counts: list[int], ops: int, read_ratio: float) -> dict:
+    """Mesurer chaque store pour chaque nombre de threads.
+
+    Returns:
+        Dict {store: {threads: operations par seconde}}
+
+    """
+    return {
+        name: {
+            n: contention_benchmark(factory(), n, ops, read_ratio)
+            for n in thread_counts
+        }
+        for name, factory in STORES.items()
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entree: mesurer et afficher le debit par store et par threads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", default="1,2,4,8")
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--read-ratio", type=float, default=0.9)
+    parser.add_argument("--json", action="store_true", help="rapport JSON")
+    args = parser.parse_args(argv)
+
+    thread_counts = [int(n) for n in args.threads.split(",")]
+    report = run(thread_counts, args.ops, args.read_ratio)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'actif' if gil else 'desactive'}")
+    for name, by_threads in report.items():
+        cells = ", ".join(
+            f"{n}t: {rate / 1000:.0f}k op/s" for n, rate in by_threads.items()
+        )
+        print(f"{name:<10}{cells}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""Tests d'integration - GET /triangulation/{id}?algorithm=sweep|auto.
+
+- Triangulation par balayage: triangles CCW sans chevauchement
+- Cles de cache et ETag propres a chaque algorithme
+- Mode auto: resultat identique en ligne et dans le pool de processus
+- Parametre invalide -> 400
+"""
+
+import math
+import random
+
+import pytest
+
+import app as app_module
+from pointset_store import MemoryStore
+from triangulator_core import parse_triangulation, serialize_pointset
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Store en memoire vide, installe dans l'application."""
+    store = MemoryStore()
+    monkeypatch.setattr(app_module, "_POINTSETS", store)
+    return store
+
+
+@pytest.fixture
+def client(store):
+    """Create test client for Flask app."""
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def pointset_id(client):
+    """PointSet de 500 points aleatoires, dans un ordre quelconque."""
+    rng = random.Random(7)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(500)]
+    resp = client.post(
+        "/pointset", data=serialize_pointset(points),
+        content_type="application/octet-stream",
+    )
+    return resp.get_json()["pointSetId"]
+
+
+def _signed_area2(vertices, tri) -> float:
+    """Double de l'aire signee d'un triangle."""
+    (ax, ay), (bx, by), (cx, cy) = (vertices[i] for i in tri)
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+class TestAlgorithmParameter:
+    """Choix de l'algorithme par requete."""
+
+    def test_sweep_returns_ccw_triangles(self, client, pointset_id):
+        """Teste ?algorithm=sweep -> triangles CCW, aretes non partagees deux fois.
+
+        Raison: Contrat du mode balayage pour un ordre quelconque.
+        """
+        resp = client.get(f"/triangulation/{pointset_id}?algorithm=sweep")
+
+        assert resp.status_code == 200
+        vertices, triangles = parse_triangulation(resp.data)
+        assert len(vertices) == 500
+        assert all(_signed_area2(vertices, t) > 0 for t in triangles)
+        edges = [(a, b) for a, b, c in triangles] + [
+            (b, c) for a, b, c in triangles
+        ] + [(c, a) for a, b, c in triangles]
+        assert len(edges) == len(set(edges))
+
+    def test_each_algorithm_has_own_cache_and_etag(
+        self, client, store, pointset_id
+    ):
+        """Teste que fan et sweep ne partagent ni resultat ni ETag.
+
+        Raison: Un client ne doit jamais recevoir 304 pour l'autre algorithme.
+        """
+        fan = client.get(f"/triangulation/{pointset_id}")
+        sweep = client.get(f"/triangulation/{pointset_id}?algorithm=sweep")
+
+        assert fan.data != sweep.data
+        assert fan.headers["ETag"] != sweep.headers["ETag"]
+        assert store.get_result(f"{pointset_id}.sweep") == sweep.data
+        again = client.get(
+            f"/triangulation/{pointset_id}?algorithm=sweep",
+            headers={"If-None-Match": sweep.headers["ETag"]},
+        )
+        assert again.status_code == 304
+        other = client.get(
+            f"/triangulation/{pointset_id}",
+            headers={"If-None-Match": sweep.headers["ETag"]},
+        )
+        assert other.status_code == 200
+
+    def test_default_algorithm_keeps_keys(self, client, store, pointset_id):
+        """Teste que ?algorithm=fan equivaut a l'absence de parametre.
+
+        Raison: Les resultats deja en cache restent valides.
+        """
+        implicit = client.get(f"/triangulation/{pointset_id}")
+        explicit = client.get(f"/triangulation/{pointset_id}?algorithm=fan")
+
+        assert implicit.headers["ETag"] == explicit.headers["ETag"]
+        assert store.get_result(pointset_id) == implicit.data
+
+    def test_sweep_with_lod(self, client, store, pointset_id):
+        """Teste la combinaison apercu + balayage (cle lod puis algorithme).
+
+        Raison: Les parametres se composent sans collision de cle.
+        """
+        resp = client.get(f"/triangulation/{pointset_id}?lod=64&algorithm=sweep")
+
+        assert resp.status_code == 200
+        vertices, triangles = parse_triangulation(resp.data)
+        assert len(vertices) <= 64
+        assert all(_signed_area2(vertices, t) > 0 for t in triangles)
+        assert store.get_result(f"{pointset_id}.lod64.sweep") == resp.data
+
+    def test_unknown_algorithm_is_400(self, client, pointset_id):
+        """Teste qu'un algorithme inconnu est refuse.
+
+        Raison: Erreur du client, pas du service.
+        """
+        resp = client.get(f"/triangulation/{pointset_id}?algorithm=delaunay")
+
+        assert resp.status_code == 400
+        assert resp.get_json()["code"] == "BAD_REQUEST"
+
+
+class TestAutoAlgorithm:
+    """Mode auto: moteur et execution choisis par le service."""
+
+    def test_auto_inline(self, client, pointset_id, monkeypatch):
+        """Teste ?algorithm=auto sans pool -> balayage dans le thread.
+
+        Raison: Sans pool configure, tout reste dans la requete.
+        """
+        monkeypatch.setattr(app_module, "_POOL", None)
+        monkeypatch.setattr(app_module, "_POOL_WORKERS", 0)
+        auto = client.get(f"/triangulation/{pointset_id}?algorithm=auto")
+        sweep = client.get(f"/triangulation/{pointset_id}?algorithm=sweep")
+
+        assert auto.status_code == 200
+        assert auto.data == sweep.data
+        assert auto.headers["ETag"] != sweep.headers["ETag"]
+
+    def test_auto_offloads_to_pool(self, client, pointset_id, monkeypatch):
+        """Teste l'envoi au pool de processus quand le modele le juge rentable.
+
+        Raison: Meme resultat qu'en ligne, sans bloquer le thread du serveur.
+        """
+        multiprocessing = pytest.importorskip("multiprocessing")
+        from concurrent.futures import ProcessPoolExecutor
+
+        from cost_model import CostModel
+
+        inline = client.get(f"/triangulation/{pointset_id}?algorithm=sweep").data
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            monkeypatch.setattr(app_module, "_POOL", pool)
+            monkeypatch.setattr(
+                app_module,
+                "_COST_MODEL",
+                CostModel(min_offload_seconds=0.0, max_overhead_ratio=math.inf),
+            )
+            resp = client.get(f"/triangulation/{pointset_id}?algorithm=auto")
+
+        assert resp.status_code == 200
+        assert resp.data == inline
+        assert "pool;dur=" in resp.headers["Server-Timing"]
@@ -112,3 +112,49 @@ class TestAPIErrors:
         data = resp.get_json()
         assert "code" in data or "error" in data
         assert "message" in data or "detail" in data
+
+    def test_expired_pointset_returns_404(self, client, sample_3_points, monkeypatch):
+        """Teste qu'un PointSet expire donne 404, meme avec un resultat en cache.
+
+        Raison: La duree de vie du store doit etre visible proprement par l'API.
+        """
+        import app as app_module
+        from pointset_store import MemoryStore
+
+        now = [0.0]
+        store = MemoryStore(ttl_seconds=10, clock=lambda: now[0])
+        monkeypatch.setattr(app_module, "_POINTSETS", store)
+        pointset_id = self._register_pointset(client, sample_3_points)
+        assert client.get(f"/triangulation/{pointset_id}").status_code == 200
+
+        now[0] = 10.0
+        resp = client.get(f"/triangulation/{pointset_id}")
+
+        assert resp.status_code == 404
+        assert resp.get_json()["code"] == "NOT_FOUND"
+        assert client.get("/store/stats").get_json()["expirations"] >= 1
+
+    def test_overloaded_returns_503_with_retry_after(
+        self, client, sample_3_points, monkeypatch
+    ):
+        """Teste qu'un budget de calcul epuise donne 503 + Retry-After.
+
+        Raison: Sous surcharge, refuser vite plutot qu'empiler les calculs.
+        """
+        import app as app_module
+        from admission import AdmissionController
+        from pointset_store import MemoryStore
+
+        controller = AdmissionController(budget=10, max_queue=0)
+        monkeypatch.setattr(app_module, "_ADMISSION", controller)
+        monkeypatch.setattr(app_module, "_POINTSETS", MemoryStore())
+        pointset_id = self._register_pointset(client, sample_3_points)
+        held = controller.acquire(10)
+
+        resp = client.get(f"/triangulation/{pointset_id}")
+
+        assert resp.status_code == 503
+        assert resp.get_json()["code"] == "SERVICE_UNAVAILABLE"
+        assert int(resp.headers["Retry-After"]) >= 1
+        controller.release(held)
+        assert client.get(f"/triangulation/{pointset_id}").status_code == 200
@@ -0,0 +1,96 @@
+"""Tests d'integration - Fabrique d'application et prechauffage.
+
+- create_app() construit une application Flask complete
+- `from app import app` reste valide (application par defaut, unique)
+- Le prechauffage recopie un store disque dans le store du service
+"""
+
+import pytest
+
+import app as app_module
+from pointset_store import DiskStore, MemoryStore
+from triangulator_core import serialize_pointset
+
+POINTS = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Store memoire vide utilise par le service."""
+    store = MemoryStore()
+    monkeypatch.setattr(app_module, "_POINTSETS", store)
+    return store
+
+
+class TestCreateApp:
+    """Fabrique d'application."""
+
+    def test_factory_builds_independent_apps(self, store):
+        """Teste que deux appels donnent deux applications fonctionnelles.
+
+        Raison: Les tests et les serveurs WSGI construisent leur application.
+        """
+        first, second = app_module.create_app(), app_module.create_app()
+
+        assert first is not second
+        assert first.test_client().get("/healthz").status_code == 200
+        assert second.test_client().get("/healthz").status_code == 200
+
+    def test_default_app_is_built_once(self):
+        """Teste que `app.app` est construite au premier acces puis reutilisee.
+
+        Raison: Compatibilite de `from app import app` et de "app:app".
+        """
+        from app import app
+
+        assert app is app_module.app
+        assert app.test_client().get("/healthz").status_code == 200
+
+    def test_unknown_attribute_raises(self):
+        """Teste qu'un attribut inconnu du module leve AttributeError.
+
+        Raison: Le __getattr__ du module ne doit intercepter que `app`.
+        """
+        with pytest.raises(AttributeError):
+            app_module.not_an_attribute  # noqa: B018
+
+
+class TestWarmUp:
+    """Prechauffage depuis un store disque."""
+
+    def test_warmup_copies_disk_entries(self, store, tmp_path):
+        """Teste que PointSets et resultats du disque sont recopies.
+
+        Raison: Un worker neuf sert les resultats deja calcules sans recalcul.
+        """
+        source = DiskStore(str(tmp_path))
+        source.put_pointset("p1", serialize_pointset(POINTS))
+        source.put_result("p1.compact", b"cached")
+
+        application = app_module.create_app(warmup_dir=str(tmp_path))
+        application.extensions["triangulator_warmup"].join(timeout=10)
+
+        assert store.get_pointset("p1") == serialize_pointset(POINTS)
+        assert store.get_result("p1.compact") == b"cached"
+
+    def test_warmup_skips_entries_over_budget(self, monkeypatch, tmp_path):
+        """Teste qu'une entree plus grosse que le budget est ignoree.
+
+        Raison: Le prechauffage ne doit pas echouer sur un store borne.
+        """
+        monkeypatch.setattr(app_module, "_POINTSETS", MemoryStore(max_bytes=40))
+        source = DiskStore(str(tmp_path))
+        source.put_pointset("big", b"x" * 100)
+        source.put_pointset("small", serialize_pointset(POINTS))
+
+        assert app_module.warm_up(str(tmp_path)) == 1
+        assert "small" in app_module._POINTSETS
+
+    def test_no_warmup_thread_by_default(self, monkeypatch):
+        """Teste qu'aucun prechauffage n'est lance sans configuration.
+
+        Raison: Le demarrage par defaut reste minimal.
+        """
+        monkeypatch.delenv("TRIANGULATOR_WARMUP_DIR", raising=False)
+
+        assert "triangulator_warmup" not in app_module.create_app().extensions
@@ -0,0 +1,146 @@
+"""Tests d'integration - Format Triangles compact negocie par Accept.
+
+- Format standard par defaut
+- Formats compact et compact-q16 decodables par parse_triangulation
+- Combinaison avec la compression et mise en cache des variantes
+- Section d'adjacence optionnelle (?adjacency=1)
+"""
+
+import random
+
+import pytest
+
+import app as app_module
+from compression import decompress
+from pointset_store import DiskStore, MemoryStore
+from triangulator_core import COMPACT_MAGIC, parse_triangulation, serialize_pointset
+
+
+@pytest.fixture(params=["memory", "disk"])
+def client(request, tmp_path, monkeypatch):
+    """Create test client with each store backend."""
+    store = MemoryStore() if request.param == "memory" else DiskStore(str(tmp_path))
+    monkeypatch.setattr(app_module, "_POINTSETS", store)
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def pointset_id(client):
+    """Enregistrer 2000 points aleatoires."""
+    rng = random.Random(7)
+    points = [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(2000)]
+    resp = client.post(
+        "/pointset", data=serialize_pointset(points),
+        content_type="application/octet-stream",
+    )
+    return resp.get_json()["pointSetId"]
+
+
+class TestCompactNegotiation:
+    """Negociation du format par Accept."""
+
+    def test_default_is_standard(self, client, pointset_id):
+        """Teste que */* et l'absence d'Accept donnent le format standard.
+
+        Raison: Les clients existants ne doivent rien voir changer.
+        """
+        for headers in ({}, {"Accept": "*/*"}):
+            resp = client.get(f"/triangulation/{pointset_id}", headers=headers)
+            assert resp.mimetype == app_module.MIMETYPE_TRIANGLES
+            assert resp.data[:4] != COMPACT_MAGIC
+
+    def test_compact_matches_standard(self, client, pointset_id):
+        """Teste que le format compact decode aux memes donnees, en moins d'octets.
+
+        Raison: Le format compact sans quantification est sans perte.
+        """
+        standard = client.get(f"/triangulation/{pointset_id}").data
+        resp = client.get(
+            f"/triangulation/{pointset_id}",
+            headers={"Accept": app_module.MIMETYPE_COMPACT},
+        )
+
+        assert resp.mimetype == app_module.MIMETYPE_COMPACT
+        assert "Accept" in resp.headers["Vary"]
+        assert len(resp.data) < 0.6 * len(standard)
+        assert parse_triangulation(resp.data) == parse_triangulation(standard)
+
+    def test_quantized_is_smaller(self, client, pointset_id):
+        """Teste le format quantifie: meme topologie, coordonnees proches.
+
+        Raison: Mode bande passante minimale pour l'affichage.
+        """
+        standard = parse_triangulation(client.get(f"/triangulation/{pointset_id}").data)
+        resp = client.get(
+            f"/triangulation/{pointset_id}",
+            headers={"Accept": app_module.MIMETYPE_COMPACT_Q16},
+        )
+        verts, tris = parse_triangulation(resp.data)
+
+        assert tris == standard[1]
+        for (x, y), (qx, qy) in zip(standard[0], verts, strict=True):
+            assert abs(x - qx) < 2e-3
+            assert abs(y - qy) < 2e-3
+
+    def test_compact_with_gzip_is_cached(self, client, pointset_id):
+        """Teste compact + gzip, puis service depuis le cache.
+
+        Raison: Chaque variante (format, encodage) est calculee une fois.
+        """
+        headers = {"Accept": app_module.MIMETYPE_COMPACT, "Accept-Encoding": "gzip"}
+        first = client.get(f"/triangulation/{pointset_id}", headers=headers)
+        second = client.get(f"/triangulation/{pointset_id}", headers=headers)
+
+        assert first.headers["Content-Encoding"] == "gzip"
+        assert second.data == first.data
+        assert "encode" not in second.headers["Server-Timing"]
+        assert decompress(first.data, "gzip")[:4] == COMPACT_MAGIC
+
+
+class TestAdjacencyOption:
+    """Parametre adjacency de GET /triangulation."""
+
+    def test_adjacency_section_appended(self, client, pointset_id):
+        """Teste ?adjacency=1 -> meme triangulation plus la section ADJC.
+
+        Raison: Option sans impact sur les clients qui l'ignorent.
+        """
+        from triangulator_core import (
+            SECTION_ADJACENCY,
+            parse_adjacency,
+            parse_sections,
+        )
+
+        plain = client.get(f"/triangulation/{pointset_id}")
+        resp = client.get(f"/triangulation/{pointset_id}?adjacency=1")
+
+        assert parse_triangulation(resp.data) == parse_triangulation(plain.data)
+        assert resp.data.startswith(plain.data)
+        assert resp.get_etag() != plain.get_etag()
+        neighbors, _ = parse_adjacency(parse_sections(resp.data)[SECTION_ADJACENCY])
+        assert len(neighbors) == len(parse_triangulation(plain.data)[1])
+
+    def test_adjacency_with_compact(self, client, pointset_id):
+        """Teste adjacency combinee au format compact.
+
+        Raison: Les options se composent.
+        """
+        from triangulator_core import SECTION_ADJACENCY, parse_sections
+
+        resp = client.get(
+            f"/triangulation/{pointset_id}?adjacency=true",
+            headers={"Accept": app_module.MIMETYPE_COMPACT},
+        )
+
+        assert resp.data[:4] == COMPACT_MAGIC
+        assert SECTION_ADJACENCY in parse_sections(resp.data)
+
+    def test_invalid_adjacency_returns_400(self, client, pointset_id):
+        """Teste une valeur non booleenne -> 400.
+
+        Raison: Erreur explicite.
+        """
+        resp = client.get(f"/triangulation/{pointset_id}?adjacency=peut-etre")
+        assert resp.status_code == 400
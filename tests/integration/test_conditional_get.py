@@ -0,0 +1,161 @@
+"""Tests d'integration - ETag, GET conditionnel et requetes Range.
+
+- ETag fort stable, distinct par representation
+- If-None-Match -> 304 sans recalcul
+- Range / If-Range -> 206, Range invalide -> 416
+"""
+
+import random
+
+import pytest
+
+import app as app_module
+from pointset_store import DiskStore, MemoryStore
+from triangulator_core import serialize_pointset
+
+
+@pytest.fixture(params=["memory", "disk"])
+def client(request, tmp_path, monkeypatch):
+    """Create test client with each store backend."""
+    store = MemoryStore() if request.param == "memory" else DiskStore(str(tmp_path))
+    monkeypatch.setattr(app_module, "_POINTSETS", store)
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+def _register(client, seed=3, n=500):
+    """Enregistrer n points aleatoires et retourner le PointSetID."""
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(n)]
+    resp = client.post(
+        "/pointset", data=serialize_pointset(points),
+        content_type="application/octet-stream",
+    )
+    return resp.get_json()["pointSetId"]
+
+
+class TestETag:
+    """ETag des resultats."""
+
+    def test_etag_is_strong_and_stable(self, client):
+        """Teste qu'un meme resultat garde le meme ETag fort.
+
+        Raison: Le client peut reutiliser sa copie entre deux sondages.
+        """
+        pid = _register(client)
+        first = client.get(f"/triangulation/{pid}")
+        second = client.get(f"/triangulation/{pid}")
+
+        etag, weak = first.get_etag()
+        assert etag and not weak
+        assert second.get_etag() == (etag, False)
+
+    def test_same_content_same_etag(self, client):
+        """Teste que deux PointSets identiques partagent l'ETag.
+
+        Raison: L'ETag derive du contenu, pas de l'identifiant.
+        """
+        a = client.get(f"/triangulation/{_register(client)}").get_etag()
+        b = client.get(f"/triangulation/{_register(client)}").get_etag()
+        other = client.get(f"/triangulation/{_register(client, seed=4)}").get_etag()
+
+        assert a == b
+        assert a != other
+
+    def test_representations_have_distinct_etags(self, client):
+        """Teste des ETag differents par format et par encodage.
+
+        Raison: Un ETag fort designe exactement un corps de reponse.
+        """
+        pid = _register(client)
+        etags = {
+            client.get(f"/triangulation/{pid}", headers=headers).get_etag()[0]
+            for headers in (
+                {},
+                {"Accept-Encoding": "gzip"},
+                {"Accept": app_module.MIMETYPE_COMPACT},
+            )
+        }
+        assert len(etags) == 3
+
+
+class TestConditionalGet:
+    """If-None-Match."""
+
+    def test_if_none_match_returns_304_without_compute(self, client, monkeypatch):
+        """Teste 304 sans corps et sans recalcul.
+
+        Raison: Un sondage ne doit couter ni calcul ni bande passante.
+        """
+        etag = client.get(f"/triangulation/{_register(client)}").get_etag()[0]
+        # Meme contenu, resultat jamais calcule pour ce PointSetID
+        pid = _register(client)
+
+        def fail(raw):
+            raise AssertionError("recalcul inattendu")
+
+        monkeypatch.setattr(app_module, "_triangulate", fail)
+        resp = client.get(
+            f"/triangulation/{pid}", headers={"If-None-Match": f'"{etag}"'}
+        )
+
+        assert resp.status_code == 304
+        assert resp.data == b""
+        assert resp.get_etag()[0] == etag
+
+    def test_stale_etag_returns_200(self, client):
+        """Teste qu'un ETag different renvoie le contenu complet.
+
+        Raison: Le client dont la copie differe doit la remplacer.
+        """
+        pid = _register(client)
+        resp = client.get(f"/triangulation/{pid}", headers={"If-None-Match": '"autre"'})
+
+        assert resp.status_code == 200
+        assert resp.data
+
+
+class TestRange:
+    """Requetes partielles."""
+
+    def test_range_returns_partial_content(self, client):
+        """Teste Range: bytes=a-b -> 206 avec la tranche demandee.
+
+        Raison: Reprendre le telechargement d'un gros maillage.
+        """
+        pid = _register(client)
+        full = client.get(f"/triangulation/{pid}").data
+
+        resp = client.get(f"/triangulation/{pid}", headers={"Range": "bytes=100-199"})
+
+        assert resp.status_code == 206
+        assert resp.data == full[100:200]
+        assert resp.headers["Content-Range"] == f"bytes 100-199/{len(full)}"
+        assert resp.headers["Accept-Ranges"] == "bytes"
+
+    def test_if_range_mismatch_returns_full(self, client):
+        """Teste If-Range avec un ETag perime -> contenu complet.
+
+        Raison: Ne pas recoller des tranches de deux contenus differents.
+        """
+        pid = _register(client)
+        full = client.get(f"/triangulation/{pid}").data
+        resp = client.get(
+            f"/triangulation/{pid}",
+            headers={"Range": "bytes=0-9", "If-Range": '"perime"'},
+        )
+
+        assert resp.status_code == 200
+        assert resp.data == full
+
+    def test_unsatisfiable_range_returns_416(self, client):
+        """Teste une Range au-dela du contenu -> 416.
+
+        Raison: Erreur explicite plutot qu'une 500.
+        """
+        pid = _register(client)
+        resp = client.get(
+            f"/triangulation/{pid}", headers={"Range": "bytes=99999999-"}
+        )
+        assert resp.status_code == 416
@@ -0,0 +1,117 @@
+"""Tests d'integration - GET /triangulation/{id}/delta?base={id}.
+
+- Le delta applique a la base reconstruit la triangulation cible
+- ETag, 304 et compression comme les autres representations
+- Erreurs: base absente ou invalide (400), PointSet inconnu (404)
+"""
+
+import random
+import uuid
+
+import pytest
+
+import app as app_module
+from compression import decompress
+from pointset_store import MemoryStore
+from triangulator_core import (
+    apply_triangulation_delta,
+    parse_triangulation,
+    serialize_pointset,
+)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create test client with an empty memory store."""
+    monkeypatch.setattr(app_module, "_POINTSETS", MemoryStore())
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+def _register(client, points):
+    """Enregistrer un PointSet et retourner son ID."""
+    resp = client.post(
+        "/pointset", data=serialize_pointset(points),
+        content_type="application/octet-stream",
+    )
+    return resp.get_json()["pointSetId"]
+
+
+@pytest.fixture
+def edited(client):
+    """PointSet de base (2000 points) et sa version avec un point insere."""
+    rng = random.Random(4)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(2000)]
+    base = _register(client, points)
+    target = _register(client, points[:700] + [(5.25, 5.25)] + points[700:])
+    return base, target
+
+
+class TestDeltaEndpoint:
+    """Delta entre deux triangulations."""
+
+    def test_delta_rebuilds_target(self, client, edited):
+        """Teste base + delta == triangulation complete de la cible.
+
+        Raison: Contrat du client d'edition iterative.
+        """
+        base, target = edited
+        held = client.get(f"/triangulation/{base}").data
+        full = client.get(f"/triangulation/{target}").data
+
+        resp = client.get(f"/triangulation/{target}/delta?base={base}")
+
+        assert resp.status_code == 200
+        assert resp.mimetype == app_module.MIMETYPE_DELTA
+        assert len(resp.data) * 100 < len(full)
+        rebuilt = apply_triangulation_delta(held, resp.data)
+        assert rebuilt == parse_triangulation(full)
+
+    def test_delta_has_etag_and_304(self, client, edited):
+        """Teste If-None-Match sur le delta -> 304.
+
+        Raison: Un delta deja recu n'est ni recalcule ni renvoye.
+        """
+        base, target = edited
+        url = f"/triangulation/{target}/delta?base={base}"
+        etag, _ = client.get(url).get_etag()
+
+        resp = client.get(url, headers={"If-None-Match": f'"{etag}"'})
+
+        assert resp.status_code == 304
+
+    def test_delta_is_compressed(self, client, edited, monkeypatch):
+        """Teste Accept-Encoding: gzip sur le delta.
+
+        Raison: Meme negociation que les autres representations binaires.
+        """
+        monkeypatch.setenv("TRIANGULATOR_COMPRESSION_MIN_BYTES", "0")
+        base, target = edited
+        url = f"/triangulation/{target}/delta?base={base}"
+        plain = client.get(url).data
+
+        resp = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert decompress(resp.data, "gzip") == plain
+
+    @pytest.mark.parametrize("query", ["", "?base=not-a-uuid"])
+    def test_missing_or_invalid_base_is_400(self, client, edited, query):
+        """Teste base absente ou invalide -> 400.
+
+        Raison: Le parametre base est obligatoire.
+        """
+        _, target = edited
+
+        assert client.get(f"/triangulation/{target}/delta{query}").status_code == 400
+
+    def test_unknown_base_is_404(self, client, edited):
+        """Teste une base inconnue -> 404.
+
+        Raison: Meme contrat que GET /triangulation.
+        """
+        _, target = edited
+        url = f"/triangulation/{target}/delta?base={uuid.uuid4()}"
+
+        assert client.get(url).status_code == 404
@@ -0,0 +1,64 @@
+"""Tests d'integration - API avec le store disque.
+
+- Les PointSets et resultats sont ecrits en fichiers
+- Le resultat en cache est servi depuis le fichier
+"""
+
+import os
+
+import pytest
+
+import app as app_module
+from pointset_store import DiskStore
+from triangulator_core import parse_triangulation, serialize_pointset
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Create test client with a disk-backed store."""
+    monkeypatch.setattr(app_module, "_POINTSETS", DiskStore(str(tmp_path)))
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+class TestDiskStoreAPI:
+    """API avec stockage sur disque."""
+
+    def _register(self, client, points):
+        """Enregistrer un PointSet et retourner son ID."""
+        resp = client.post(
+            "/pointset",
+            data=serialize_pointset(points),
+            content_type="application/octet-stream",
+        )
+        assert resp.status_code == 200
+        return resp.get_json()["pointSetId"]
+
+    def test_triangulation_written_and_served_from_file(self, client, tmp_path):
+        """Teste le cycle register -> triangulation avec le store disque.
+
+        Raison: Verifier que resultat et PointSet sont persistes en fichiers.
+        """
+        pid = self._register(client, [(0.0, 0.0), (1.0, 0.0), (0.5, 1.0)])
+        assert os.path.exists(tmp_path / "pointsets" / f"{pid}.bin")
+
+        first = client.get(f"/triangulation/{pid}")
+        assert first.status_code == 200
+        assert first.content_type == "application/octet-stream"
+        assert os.path.exists(tmp_path / "results" / f"{pid}.bin")
+
+        second = client.get(f"/triangulation/{pid}")
+        assert second.status_code == 200
+        assert second.data == first.data
+        verts, tris = parse_triangulation(second.data)
+        assert len(verts) == 3
+        assert tris == [(0, 1, 2)]
+
+    def test_unknown_id_returns_404(self, client):
+        """Teste un ID inconnu avec le store disque -> 404.
+
+        Raison: Le comportement d'erreur ne depend pas du backend.
+        """
+        resp = client.get("/triangulation/123e4567-e89b-12d3-a456-426614174000")
+        assert resp.status_code == 404
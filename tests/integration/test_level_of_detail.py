@@ -0,0 +1,90 @@
+"""Tests d'integration - Apercus par niveau de detail (?lod=).
+
+- Apercu borne par le niveau demande, mis en cache par PointSet
+- Petit PointSet: resultat complet partage
+- Parametre invalide -> 400
+"""
+
+import random
+
+import pytest
+
+import app as app_module
+from pointset_store import MemoryStore
+from triangulator_core import parse_triangulation, serialize_pointset
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create test client with a fresh store."""
+    monkeypatch.setattr(app_module, "_POINTSETS", MemoryStore())
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+def _register(client, n):
+    """Enregistrer n points aleatoires et retourner le PointSetID."""
+    rng = random.Random(n)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)]
+    resp = client.post(
+        "/pointset", data=serialize_pointset(points),
+        content_type="application/octet-stream",
+    )
+    return resp.get_json()["pointSetId"]
+
+
+class TestLevelOfDetail:
+    """Parametre lod de GET /triangulation."""
+
+    def test_preview_is_bounded_and_cached(self, client):
+        """Teste un apercu d'au plus 256 vertices, servi ensuite du cache.
+
+        Raison: La latence de l'apercu ne doit pas dependre du PointSet.
+        """
+        pid = _register(client, 10_000)
+        first = client.get(f"/triangulation/{pid}?lod=300")
+        second = client.get(f"/triangulation/{pid}?lod=300")
+
+        verts, tris = parse_triangulation(first.data)
+        assert first.status_code == 200
+        assert 128 <= len(verts) <= 256
+        assert len(tris) == len(verts) - 2
+        assert "decimate" in first.headers["Server-Timing"]
+        assert "decimate" not in second.headers["Server-Timing"]
+        assert second.data == first.data
+
+    def test_preview_has_its_own_etag(self, client):
+        """Teste des ETag distincts pour l'apercu et le resultat complet.
+
+        Raison: Un cache HTTP ne doit pas confondre les deux.
+        """
+        pid = _register(client, 10_000)
+        full = client.get(f"/triangulation/{pid}").get_etag()
+        preview = client.get(f"/triangulation/{pid}?lod=256").get_etag()
+
+        assert full != preview
+
+    def test_small_pointset_returns_full_result(self, client):
+        """Teste qu'un niveau superieur au PointSet rend le resultat complet.
+
+        Raison: Pas de decimation inutile ni de doublon en cache.
+        """
+        pid = _register(client, 100)
+        full = client.get(f"/triangulation/{pid}")
+        preview = client.get(f"/triangulation/{pid}?lod=1024")
+
+        assert preview.data == full.data
+        assert preview.get_etag() == full.get_etag()
+
+    @pytest.mark.parametrize("value", ["abc", "2", "-5"])
+    def test_invalid_lod_returns_400(self, client, value):
+        """Teste un parametre lod invalide -> 400 BAD_REQUEST.
+
+        Raison: Erreur explicite plutot qu'un resultat inattendu.
+        """
+        pid = _register(client, 100)
+        resp = client.get(f"/triangulation/{pid}?lod={value}")
+
+        assert resp.status_code == 400
+        assert resp.get_json()["code"] == "BAD_REQUEST"
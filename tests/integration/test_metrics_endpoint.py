@@ -0,0 +1,49 @@
+"""Tests d'integration - Endpoint GET /metrics.
+
+- Latence par etape de GET /triangulation
+- Requetes par statut, tailles de payload, occupation du store
+"""
+
+import pytest
+
+from app import app
+from triangulator_core import serialize_pointset
+
+
+@pytest.fixture
+def client():
+    """Create test client for Flask app."""
+    app.config["TESTING"] = True
+    with app.test_client() as test_client:
+        yield test_client
+
+
+class TestMetricsEndpoint:
+    """Exposition des metriques."""
+
+    def test_metrics_after_triangulation(self, client):
+        """Teste que /metrics expose etapes, statuts, tailles et store.
+
+        Raison: Savoir ou passe le temps d'un GET /triangulation lent.
+        """
+        resp = client.post(
+            "/pointset",
+            data=serialize_pointset([(0.0, 0.0), (1.0, 0.0), (0.5, 1.0)]),
+            content_type="application/octet-stream",
+        )
+        pid = resp.get_json()["pointSetId"]
+        assert client.get(f"/triangulation/{pid}").status_code == 200
+        client.get("/triangulation/not-a-uuid")
+
+        resp = client.get("/metrics")
+
+        assert resp.status_code == 200
+        assert resp.content_type.startswith("text/plain")
+        text = resp.get_data(as_text=True)
+        for stage in ("store_lookup", "convert", "compute", "serialize"):
+            assert f'triangulator_stage_seconds_count{{stage="{stage}"}}' in text
+        route = 'endpoint="/triangulation/<pointSetId>"'
+        assert f'{route},method="GET",status="400"' in text
+        upload = 'endpoint="/pointset",direction="in"'
+        assert f"triangulator_payload_bytes_count{{{upload}}}" in text
+        assert "triangulator_store_bytes " in text
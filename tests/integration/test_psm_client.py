@@ -0,0 +1,112 @@
+"""Tests d'integration - Recuperation des PointSets aupres du PointSetManager.
+
+- PointSetID inconnu localement -> demande au PointSetManager
+- PointSetManager injoignable -> 503
+- Parametres invalides -> 400 sans consulter le PointSetManager
+"""
+
+import socket
+import uuid
+
+import pytest
+
+import app as app_module
+from loadtest import BackgroundServer, PointSetManagerStub
+from psm_client import PointSetManagerClient
+from triangulator_core import parse_triangulation, serialize_pointset
+
+
+@pytest.fixture
+def client():
+    """Create test client for Flask app."""
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def psm():
+    """Demarre un PointSetManager de substitution."""
+    server = BackgroundServer(PointSetManagerStub())
+    yield server
+    server.stop()
+
+
+class TestPointSetManagerFetch:
+    """Le Triangulator consulte le PointSetManager."""
+
+    def test_unknown_id_is_fetched_from_psm(self, client, psm, monkeypatch):
+        """Teste qu'un PointSet du PointSetManager est triangule.
+
+        Raison: Contrat du Triangulator (TP/triangulator.yml).
+        """
+        monkeypatch.setattr(app_module, "_PSM", PointSetManagerClient(psm.url))
+        status, body = _post(psm.url, serialize_pointset([(0, 0), (1, 0), (0, 1)]))
+        assert status == 201
+        pid = body["pointSetId"]
+
+        resp = client.get(f"/triangulation/{pid}")
+
+        assert resp.status_code == 200
+        assert parse_triangulation(resp.data)[1] == [(0, 1, 2)]
+
+    def test_id_unknown_to_psm_returns_404(self, client, psm, monkeypatch):
+        """Teste un ID inconnu du PointSetManager -> 404.
+
+        Raison: Le 404 du PointSetManager est relaye tel quel.
+        """
+        monkeypatch.setattr(app_module, "_PSM", PointSetManagerClient(psm.url))
+        resp = client.get(f"/triangulation/{uuid.uuid4()}")
+        assert resp.status_code == 404
+
+    def test_unreachable_psm_returns_503(self, client, monkeypatch):
+        """Teste un PointSetManager injoignable -> 503 SERVICE_UNAVAILABLE.
+
+        Raison: Code d'erreur prevu par le contrat en cas de panne amont.
+        """
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        monkeypatch.setattr(
+            app_module, "_PSM", PointSetManagerClient(f"http://127.0.0.1:{port}", 1.0)
+        )
+
+        resp = client.get(f"/triangulation/{uuid.uuid4()}")
+
+        assert resp.status_code == 503
+        assert resp.get_json()["code"] == "SERVICE_UNAVAILABLE"
+
+    @pytest.mark.parametrize(
+        "query", ["lod=-1", "algorithm=bogus", "snap=abc", "lod=2&snap=0.1"]
+    )
+    def test_invalid_params_skip_psm_fetch(self, client, monkeypatch, query):
+        """Teste qu'une requete invalide est refusee sans recuperer le PointSet.
+
+        Raison: Une recuperation distante et un parse inutiles pour un 400.
+        """
+        fetched = []
+
+        class RecordingPSM:
+            def get_pointset(self, pointset_id):
+                fetched.append(pointset_id)
+                return serialize_pointset([(0, 0), (1, 0), (0, 1)])
+
+        monkeypatch.setattr(app_module, "_PSM", RecordingPSM())
+
+        resp = client.get(f"/triangulation/{uuid.uuid4()}?{query}")
+
+        assert resp.status_code == 400
+        assert fetched == []
+
+
+def _post(base_url, data):
+    """POST /pointset sur le PointSetManager: (statut, JSON)."""
+    import json
+    import urllib.request
+
+    req = urllib.request.Request(
+        f"{base_url}/pointset", data=data,
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    with urllib.request.urlopen(req) as resp:
+        return resp.status, json.loads(resp.read())
@@ -0,0 +1,104 @@
+"""Tests d'integration - Compression des reponses (Accept-Encoding).
+
+- gzip / deflate negocies, identity par defaut
+- Variante compressee mise en cache
+- Petites reponses non compressees
+"""
+
+import random
+
+import pytest
+
+import app as app_module
+from compression import decompress
+from pointset_store import DiskStore, MemoryStore
+from triangulator_core import parse_triangulation, serialize_pointset
+
+
+@pytest.fixture(params=["memory", "disk"])
+def client(request, tmp_path, monkeypatch):
+    """Create test client with each store backend."""
+    store = MemoryStore() if request.param == "memory" else DiskStore(str(tmp_path))
+    monkeypatch.setattr(app_module, "_POINTSETS", store)
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+def _register(client, n):
+    """Enregistrer n points aleatoires et retourner le PointSetID."""
+    rng = random.Random(n)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(n)]
+    resp = client.post(
+        "/pointset", data=serialize_pointset(points),
+        content_type="application/octet-stream",
+    )
+    return resp.get_json()["pointSetId"]
+
+
+class TestCompression:
+    """Negociation de Content-Encoding."""
+
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+    def test_compressed_response_roundtrip(self, client, encoding):
+        """Teste qu'une reponse compressee se decompresse en binaire identique.
+
+        Raison: La compression ne doit pas alterer le format Triangles.
+        """
+        pid = _register(client, 500)
+        plain = client.get(f"/triangulation/{pid}").data
+
+        resp = client.get(
+            f"/triangulation/{pid}", headers={"Accept-Encoding": encoding}
+        )
+
+        assert resp.status_code == 200
+        assert resp.headers["Content-Encoding"] == encoding
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert len(resp.data) < len(plain)
+        assert decompress(resp.data, encoding) == plain
+        verts, tris = parse_triangulation(decompress(resp.data, encoding))
+        assert len(verts) == 500
+
+    def test_compressed_variant_is_cached(self, client, monkeypatch):
+        """Teste qu'un second appel ne recompresse pas.
+
+        Raison: Eviter de payer la compression a chaque telechargement.
+        """
+        pid = _register(client, 500)
+        headers = {"Accept-Encoding": "gzip"}
+        first = client.get(f"/triangulation/{pid}", headers=headers)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("recompression inattendue")
+
+        monkeypatch.setattr(app_module, "compress", fail)
+        second = client.get(f"/triangulation/{pid}", headers=headers)
+
+        assert second.status_code == 200
+        assert second.data == first.data
+        assert "compress" not in second.headers["Server-Timing"]
+
+    def test_identity_by_default_and_when_refused(self, client):
+        """Teste l'absence de compression sans Accept-Encoding ou avec q=0.
+
+        Raison: Les clients existants recoivent le binaire brut.
+        """
+        pid = _register(client, 500)
+
+        assert "Content-Encoding" not in client.get(f"/triangulation/{pid}").headers
+        resp = client.get(
+            f"/triangulation/{pid}", headers={"Accept-Encoding": "gzip;q=0"}
+        )
+        assert "Content-Encoding" not in resp.headers
+
+    def test_small_response_not_compressed(self, client):
+        """Teste qu'un petit resultat reste non compresse.
+
+        Raison: Sur quelques octets l'en-tete gzip coute plus qu'il ne gagne.
+        """
+        pid = _register(client, 3)
+        resp = client.get(f"/triangulation/{pid}", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in resp.headers
+        assert len(parse_triangulation(resp.data)[0]) == 3
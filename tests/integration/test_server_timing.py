@@ -0,0 +1,67 @@
+"""Tests d'integration - En-tete Server-Timing et capture des requetes lentes."""
+
+import pytest
+
+import app as app_module
+from profiling import SlowRequestSampler
+from triangulator_core import serialize_pointset
+
+
+@pytest.fixture
+def client():
+    """Create test client for Flask app."""
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+def _timings(header):
+    """Parser Server-Timing en dict {nom: duree_ms}."""
+    out = {}
+    for part in header.split(","):
+        name, dur = part.strip().split(";dur=")
+        out[name] = float(dur)
+    return out
+
+
+class TestServerTiming:
+    """Decomposition de la latence par reponse."""
+
+    def test_triangulation_response_has_stage_timings(self, client):
+        """Teste que GET /triangulation detaille parse/compute/serialize.
+
+        Raison: Diagnostiquer une requete lente sans redeploiement.
+        """
+        resp = client.post(
+            "/pointset",
+            data=serialize_pointset([(0.0, 0.0), (1.0, 0.0), (0.5, 1.0)]),
+            content_type="application/octet-stream",
+        )
+        assert "parse" in _timings(resp.headers["Server-Timing"])
+        pid = resp.get_json()["pointSetId"]
+
+        timings = _timings(client.get(f"/triangulation/{pid}").headers["Server-Timing"])
+
+        for stage in ("parse", "compute", "serialize", "total"):
+            assert stage in timings
+        assert timings["total"] >= timings["compute"]
+
+    def test_every_response_has_total(self, client):
+        """Teste que meme une erreur porte l'en-tete Server-Timing.
+
+        Raison: Toutes les reponses doivent etre mesurables.
+        """
+        resp = client.get("/triangulation/not-a-uuid")
+        assert "total" in _timings(resp.headers["Server-Timing"])
+
+    def test_slow_request_is_captured(self, client, tmp_path, monkeypatch):
+        """Teste qu'une requete au-dela du seuil laisse une capture sur disque.
+
+        Raison: Le sampler doit se brancher sur le cycle de requete.
+        """
+        sampler = SlowRequestSampler(str(tmp_path), threshold_ms=0)
+        monkeypatch.setattr(app_module, "_SAMPLER", sampler)
+
+        client.get("/healthz")
+
+        assert [p.suffix for p in tmp_path.iterdir()] == [".prof"]
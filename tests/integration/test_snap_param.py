@@ -0,0 +1,113 @@
+"""Tests d'integration - GET /triangulation/{id}?snap=<tolerance>.
+
+- Quasi-doublons fusionnes, correspondance dans SECTION_VERTEX_MAP
+- Cle de cache et ETag propres a chaque tolerance, format compact
+- Parametre invalide, combine a lod ou laissant moins de 3 vertices -> 400
+"""
+
+import pytest
+
+import app as app_module
+from pointset_store import MemoryStore
+from triangulator_core import (
+    SECTION_VERTEX_MAP,
+    parse_sections,
+    parse_triangulation,
+    parse_triangulation_compact,
+    parse_vertex_map,
+    serialize_pointset,
+)
+
+POINTS = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (0.0001, 0.0), (1.0, 1.0)]
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Store en memoire vide, installe dans l'application."""
+    store = MemoryStore()
+    monkeypatch.setattr(app_module, "_POINTSETS", store)
+    return store
+
+
+@pytest.fixture
+def client(store):
+    """Create test client for Flask app."""
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def pointset_id(client):
+    """PointSet avec un quasi-doublon du premier point."""
+    resp = client.post(
+        "/pointset", data=serialize_pointset(POINTS),
+        content_type="application/octet-stream",
+    )
+    return resp.get_json()["pointSetId"]
+
+
+class TestSnapParameter:
+    """Fusion des quasi-doublons par requete."""
+
+    def test_snap_merges_and_returns_mapping(self, client, store, pointset_id):
+        """Teste ?snap=0.001 -> 4 vertices et correspondance des 5 points.
+
+        Raison: Le client correle ses points d'entree aux vertices.
+        """
+        resp = client.get(f"/triangulation/{pointset_id}?snap=0.001")
+
+        assert resp.status_code == 200
+        vertices, triangles = parse_triangulation(resp.data)
+        assert len(vertices) == 4
+        assert len(triangles) == 2
+        mapping = parse_vertex_map(parse_sections(resp.data)[SECTION_VERTEX_MAP])
+        assert list(mapping) == [0, 1, 2, 0, 3]
+        assert store.get_result(f"{pointset_id}.snap0.001") == resp.data
+
+    def test_each_tolerance_has_own_etag(self, client, pointset_id):
+        """Teste que sans fusion, snap=0 et snap=0.001 different.
+
+        Raison: Un 304 ne doit jamais servir une autre tolerance.
+        """
+        plain = client.get(f"/triangulation/{pointset_id}")
+        exact = client.get(f"/triangulation/{pointset_id}?snap=0")
+        snapped = client.get(f"/triangulation/{pointset_id}?snap=0.001")
+
+        etags = {r.headers["ETag"] for r in (plain, exact, snapped)}
+        assert len(etags) == 3
+        assert SECTION_VERTEX_MAP not in parse_sections(plain.data)
+        assert len(parse_triangulation(exact.data)[0]) == 5
+
+    def test_snap_with_sweep_and_compact(self, client, pointset_id):
+        """Teste la combinaison snap + sweep + format compact.
+
+        Raison: La section est recopiee par la conversion compacte.
+        """
+        resp = client.get(
+            f"/triangulation/{pointset_id}?snap=0.001&algorithm=sweep",
+            headers={"Accept": app_module.MIMETYPE_COMPACT},
+        )
+
+        assert resp.status_code == 200
+        vertices, _ = parse_triangulation_compact(resp.data)
+        assert len(vertices) == 4
+        mapping = parse_vertex_map(parse_sections(resp.data)[SECTION_VERTEX_MAP])
+        assert len(mapping) == len(POINTS)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "snap=-1", "snap=abc", "snap=inf", "snap=0.1&lod=64",
+            "snap=1e-310", "snap=1e6", "snap=1e6&algorithm=auto",
+        ],
+    )
+    def test_invalid_snap_is_400(self, client, pointset_id, query):
+        """Teste les tolerances invalides, trop grandes et l'usage avec lod.
+
+        Raison: Erreur du client, pas du service.
+        """
+        resp = client.get(f"/triangulation/{pointset_id}?{query}")
+
+        assert resp.status_code == 400
+        assert resp.get_json()["code"] == "BAD_REQUEST"
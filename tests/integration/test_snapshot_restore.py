@@ -0,0 +1,114 @@
+"""Tests d'integration - Snapshot du store et redemarrage d'un worker.
+
+- Un worker restaure le snapshot au demarrage et sert les resultats deja
+  calcules sans recalcul
+- Le snapshot est reecrit a l'arret
+- Une entree expiree depuis le snapshot n'est pas restauree
+"""
+
+import atexit
+import struct
+import time
+
+import pytest
+
+import app as app_module
+from pointset_store import MemoryStore
+from snapshot import Snapshot
+from triangulator_core import serialize_pointset
+
+POINTS = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+
+
+@pytest.fixture
+def worker(monkeypatch, tmp_path):
+    """Demarrer un "worker": store vide, snapshot restaure et entretenu."""
+    monkeypatch.setenv("TRIANGULATOR_SNAPSHOT_INTERVAL", "0")
+    path = str(tmp_path / "store.snap")
+    writers = []
+
+    def start(ttl_seconds=None):
+        monkeypatch.setattr(
+            app_module, "_POINTSETS", MemoryStore(ttl_seconds=ttl_seconds)
+        )
+        monkeypatch.setattr(app_module, "_SNAPSHOTS", None)
+        application = app_module.create_app(snapshot_path=path)
+        writers.append(app_module._SNAPSHOTS)
+        application.config["TESTING"] = True
+        return application.test_client()
+
+    yield start, path
+    for writer in writers:
+        atexit.unregister(writer.stop)
+
+
+class TestSnapshotRestore:
+    """Redemarrage avec snapshot."""
+
+    def test_restarted_worker_serves_warm_results(self, worker, monkeypatch):
+        """Teste qu'apres redemarrage le resultat est servi sans recalcul.
+
+        Raison: Eviter de recalculer les resultats chauds apres un deploiement.
+        """
+        start, _ = worker
+        client = start()
+        resp = client.post(
+            "/pointset", data=serialize_pointset(POINTS),
+            content_type="application/octet-stream",
+        )
+        pid = resp.get_json()["pointSetId"]
+        first = client.get(f"/triangulation/{pid}")
+        app_module._SNAPSHOTS.stop()
+
+        restarted = start()
+
+        def no_compute(*args, **kwargs):
+            raise AssertionError("recalcul inattendu")
+
+        monkeypatch.setattr(app_module, "_admitted_triangulate", no_compute)
+        again = restarted.get(f"/triangulation/{pid}")
+        assert again.status_code == 200
+        assert again.data == first.data
+        assert again.get_etag() == first.get_etag()
+        assert restarted.get("/store/stats").get_json()["snapshot_entries"] >= 3
+
+    def test_shutdown_writes_snapshot(self, worker):
+        """Teste que l'arret ecrit le snapshot.
+
+        Raison: Le snapshot final contient les entrees les plus recentes.
+        """
+        start, path = worker
+        client = start()
+        resp = client.post(
+            "/pointset", data=serialize_pointset(POINTS),
+            content_type="application/octet-stream",
+        )
+        pid = resp.get_json()["pointSetId"]
+
+        app_module._SNAPSHOTS.stop()
+
+        assert ("pointset", pid) in Snapshot(path)
+
+    def test_expired_entries_are_404_after_restart(self, worker):
+        """Teste qu'un PointSet expire depuis le snapshot donne 404.
+
+        Raison: Le snapshot ne prolonge pas la duree de vie des entrees.
+        """
+        start, path = worker
+        client = start(ttl_seconds=10)
+        resp = client.post(
+            "/pointset", data=serialize_pointset(POINTS),
+            content_type="application/octet-stream",
+        )
+        pid = resp.get_json()["pointSetId"]
+        app_module._SNAPSHOTS.stop()
+        # Snapshot ecrit une heure avant le redemarrage
+        with open(path, "r+b") as f:
+            f.seek(16)
+            f.write(struct.pack("<d", time.time() - 3600))
+
+        restarted = start(ttl_seconds=10)
+
+        assert restarted.get(f"/triangulation/{pid}").status_code == 404
+        app_module._SNAPSHOTS.stop()
+        assert ("pointset", pid) not in Snapshot(path)
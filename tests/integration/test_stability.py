@@ -3,11 +3,17 @@
 Tests de stabilite et gestion de charge avec le test client Flask.
 """
 
+import gc
+import random
 import struct
+import tracemalloc
 
 import pytest
 
+import app as app_module
 from app import app
+from memory_accounting import MemoryTracker
+from pointset_store import ShardedMemoryStore
 
 
 @pytest.fixture
@@ -96,3 +102,106 @@ class TestStabilityAndLoad:
             binary = resp.data
             n_verts = struct.unpack("<I", binary[0:4])[0]
             assert n_verts == 3
+
+
+@pytest.fixture
+def bounded_client(monkeypatch):
+    """Client sur un store borne: l'etat en regime permanent est fini."""
+    monkeypatch.setattr(
+        app_module, "_POINTSETS", ShardedMemoryStore(max_bytes=64 * 1024)
+    )
+    app.config["TESTING"] = True
+    with app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    """Comptabilite memoire active le temps du test (traces d'une frame)."""
+    tracker = MemoryTracker(frames=1)
+    monkeypatch.setattr(app_module, "_MEMORY", tracker)
+    yield tracker
+    tracker.stop()
+
+
+def _cycles(client, count: int, seed: int, size: int = 16) -> None:
+    """Enregistrer puis trianguler count PointSets distincts."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        coords = [rng.uniform(-100.0, 100.0) for _ in range(2 * size)]
+        body = struct.pack(f"<I{2 * size}f", size, *coords)
+        resp = client.post(
+            "/pointset", data=body, content_type="application/octet-stream"
+        )
+        assert resp.status_code == 200
+        resp = client.get(f"/triangulation/{resp.get_json()['pointSetId']}")
+        assert resp.status_code == 200
+
+
+def _live_bytes() -> int:
+    """Octets traces apres collecte des cycles (dechets en attente exclus)."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+class TestSteadyStateMemory:
+    """Memoire stable sur des milliers de cycles enregistrement/triangulation."""
+
+    def test_heap_stays_flat_over_cycles(self, bounded_client, tracker):
+        """Teste que le tas ne croit plus une fois le store plein.
+
+        Raison: Une fuite par requete (copie de points, tampon de
+        serialisation, etiquette de metrique) ferait croitre le tas
+        lineairement avec le nombre de requetes. La premiere serie remplit
+        le store et les listes libres de l'interpreteur.
+        """
+        _cycles(bounded_client, 1000, seed=1)
+        baseline = _live_bytes()
+
+        _cycles(bounded_client, 1000, seed=2)
+        growth = _live_bytes() - baseline
+
+        # Une fuite de 64 octets par cycle suffit a depasser le seuil
+        assert growth < 64 * 1000, f"Tas en croissance: +{growth} octets"
+
+    def test_request_peaks_are_stable(self, bounded_client, tracker):
+        """Teste que le pic par requete ne derive pas d'un lot a l'autre.
+
+        Raison: Un pic croissant trahit un tampon qui grossit a chaque appel.
+        """
+        endpoint = "/triangulation/<pointSetId>"
+        _cycles(bounded_client, 200, seed=3)
+        early = tracker.report()["requests"][endpoint]["max_peak_bytes"]
+
+        _cycles(bounded_client, 300, seed=4)
+        late = tracker.report()["requests"][endpoint]["last_peak_bytes"]
+
+        assert 0 < late <= early * 1.5
+
+    def test_diagnostics_endpoint(self, bounded_client, tracker):
+        """Teste GET /debug/memory: sous-systemes, pics par requete et etape.
+
+        Raison: Voir ou va la memoire sans redemarrer le service.
+        """
+        _cycles(bounded_client, 20, seed=5)
+        resp = bounded_client.get("/debug/memory")
+
+        assert resp.status_code == 200
+        report = resp.get_json()
+        assert report["tracing"] is True
+        assert report["subsystems"]
+        assert report["store"]["bytes"] > 0
+        for stage in ("parse", "convert", "compute", "serialize"):
+            assert report["stages"][stage]["max_peak_bytes"] > 0
+        assert report["requests"]["/pointset"]["count"] == 20
+
+    def test_diagnostics_without_tracking(self, bounded_client, monkeypatch):
+        """Teste que l'endpoint repond sans comptabilite active.
+
+        Raison: L'occupation du store reste utile sans tracemalloc.
+        """
+        monkeypatch.setattr(app_module, "_MEMORY", None)
+        report = bounded_client.get("/debug/memory").get_json()
+
+        assert report["tracing"] is False
+        assert "bytes" in report["store"]
@@ -0,0 +1,131 @@
+"""PLAN.md - Tests de performance - Charge HTTP concurrente (loadtest).
+
+Serveur reel (threads) + PointSetManager de substitution, charge mixte
+upload/triangulation en parallele.
+"""
+
+import pytest
+
+from loadtest import BackgroundServer, PointSetManagerStub, percentile, run_load
+
+
+@pytest.fixture(scope="module")
+def stack():
+    """Demarre le service et un PointSetManager de substitution."""
+    import app as app_module
+    from psm_client import PointSetManagerClient
+
+    psm = BackgroundServer(PointSetManagerStub())
+    previous = app_module._PSM
+    app_module._PSM = PointSetManagerClient(psm.url)
+    service = BackgroundServer(app_module.app)
+    yield service, psm
+    service.stop()
+    psm.stop()
+    app_module._PSM = previous
+
+
+@pytest.mark.performance
+class TestConcurrentLoad:
+    """Charge concurrente."""
+
+    def test_mixed_load_without_errors(self, stack):
+        """Teste 200 operations sur 8 clients -> aucune erreur, percentiles.
+
+        Raison: Verifier le comportement sous requetes simultanees.
+        """
+        service, psm = stack
+        report = run_load(
+            service.url, psm.url, requests=200, concurrency=8,
+            upload_ratio=0.3, sizes=[(10, 0.5), (100, 0.4), (1000, 0.1)],
+        )
+
+        overall = report["ops"]["all"]
+        assert overall["count"] == 200
+        assert overall["errors"] == 0, overall["statuses"]
+        assert report["ops"]["triangulate"]["count"] > 0
+        assert overall["p50_ms"] <= overall["p95_ms"] <= overall["p99_ms"]
+        assert report["throughput_rps"] > 0
+
+    def test_overload_sheds_with_503(self, stack, monkeypatch):
+        """Teste qu'un budget de calcul etroit delest en 503 au lieu de ralentir.
+
+        Raison: Sous surcharge, la latence de queue doit rester bornee.
+        """
+        import app as app_module
+        from admission import AdmissionController
+
+        monkeypatch.setattr(
+            app_module, "_ADMISSION",
+            AdmissionController(budget=10_000, max_queue=2, timeout=0.2),
+        )
+        service, psm = stack
+        report = run_load(
+            service.url, psm.url, requests=150, concurrency=16,
+            upload_ratio=0.5, sizes=[(10_000, 1.0)], seed=1,
+        )
+
+        triangulate = report["ops"]["triangulate"]
+        assert set(triangulate["statuses"]) <= {"200", "503"}
+        assert triangulate["statuses"].get("200", 0) > 0
+        assert triangulate["p99_ms"] < 5000
+
+    def test_interactive_client_not_starved(self, stack, monkeypatch):
+        """Teste qu'un client interactif passe devant l'arriere d'un gros client.
+
+        Raison: Un tenant qui sature le calcul ne doit pas affamer les autres.
+        """
+        import json
+        import random
+        import struct
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        import app as app_module
+        from admission import AdmissionController
+        from loadtest import _request
+
+        monkeypatch.setattr(
+            app_module, "_ADMISSION",
+            AdmissionController(budget=20_000, max_queue=64, timeout=30.0),
+        )
+        service, psm = stack
+        rng = random.Random(2)
+
+        def upload(n):
+            coords = [rng.uniform(-100.0, 100.0) for _ in range(2 * n)]
+            _, body = _request(
+                f"{psm.url}/pointset", struct.pack(f"<I{2 * n}f", n, *coords)
+            )
+            return json.loads(body)["pointSetId"]
+
+        big = [upload(20_000) for _ in range(12)]
+        small = [upload(10) for _ in range(8)]
+
+        def timed(pid, client):
+            start = time.perf_counter()
+            status, _ = _request(
+                f"{service.url}/triangulation/{pid}",
+                headers={"X-Client-Id": client},
+            )
+            return status, time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            batch = pool.map(timed, big, ["batch"] * len(big))
+            time.sleep(0.05)
+            interactive = [timed(pid, "ui") for pid in small]
+            batch = list(batch)
+
+        assert {status for status, _ in batch + interactive} == {200}
+        batch_latencies = sorted(seconds for _, seconds in batch)
+        assert max(s for _, s in interactive) < percentile(batch_latencies, 50)
+
+    def test_percentile_nearest_rank(self):
+        """Teste le calcul des percentiles par rang le plus proche.
+
+        Raison: Les percentiles du rapport servent au dimensionnement.
+        """
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
@@ -0,0 +1,76 @@
+"""PLAN.md - Tests de performance - Complexite empirique de triangulator_core.
+
+Balayage N = 1e3 .. 1e6 (TRIANGULATOR_BENCH_SIZES) sans passer par Flask:
+- exposant de complexite de compute / serialize / parse borne
+- pas de regression significative par rapport a la reference locale
+  (.benchmarks/baseline.json, creee au premier passage avec le modele de
+  cout du mode auto)
+"""
+
+import os
+import random
+import time
+
+import pytest
+
+import triangulator_bench as bench
+from cost_model import calibrate
+from triangulator_core import (
+    compute_triangulation,
+    decimate_pointset,
+    serialize_pointset,
+)
+
+
+@pytest.fixture(scope="module")
+def suite_results():
+    """Mesure le balayage une seule fois pour tout le module."""
+    return bench.run_suite(bench.sizes_from_env(), repeats=5)
+
+
+@pytest.mark.performance
+class TestScaling:
+    """Complexite et regressions du coeur de triangulation."""
+
+    @pytest.mark.parametrize("stage", bench.STAGES)
+    def test_empirical_exponent_is_near_linear(self, suite_results, stage):
+        """Teste que le temps croit au plus en n^1.3.
+
+        Raison: Detecter une regression quadratique (ex: concatenation de bytes).
+        """
+        exponent = suite_results[stage]["exponent"]
+        assert exponent <= 1.3, f"{stage}: temps ~ n^{exponent:.2f}"
+
+    def test_no_regression_against_local_baseline(self, suite_results):
+        """Teste l'absence de ralentissement significatif vs la reference.
+
+        Raison: Les plafonds absolus ne voient pas un ralentissement de 2x.
+        """
+        path = os.environ.get("TRIANGULATOR_BENCH_BASELINE", bench.DEFAULT_BASELINE)
+        baseline = bench.load_baseline(path)
+        if baseline is None:
+            bench.save_baseline(suite_results, path, calibrate(suite_results))
+            pytest.skip(f"Reference locale creee: {path}")
+
+        problems = bench.find_regressions(suite_results, baseline)
+        assert not problems, "\n".join(problems)
+
+    def test_preview_latency_independent_of_size(self):
+        """Teste qu'un apercu de 4096 vertices coute autant pour 1e5 que 1e6 points.
+
+        Raison: L'apercu sert justement aux PointSets de plusieurs millions.
+        """
+        rng = random.Random(0)
+        timings = []
+        for n in (100_000, 1_000_000):
+            data = serialize_pointset(
+                [(rng.uniform(0, 1), rng.uniform(0, 1)) for _ in range(n)]
+            )
+            best = float("inf")
+            for _ in range(3):
+                start = time.perf_counter()
+                compute_triangulation(decimate_pointset(data, 4096))
+                best = min(best, time.perf_counter() - start)
+            timings.append(best)
+
+        assert timings[1] < 3 * timings[0], timings
@@ -0,0 +1,33 @@
+"""PLAN.md - Tests de performance - Demarrage d'un worker.
+
+Interpreteur neuf: import du module, create_app() et premiere requete.
+"""
+
+import pytest
+
+from startup_bench import OPTIONAL_MODULES, measure_startup
+
+
+@pytest.mark.performance
+class TestStartup:
+    """Chemin de demarrage (mise a l'echelle automatique)."""
+
+    def test_optional_engines_not_imported(self):
+        """Teste qu'aucun module optionnel n'est importe au demarrage.
+
+        Raison: Le client du PointSetManager et la memoire partagee ne sont
+        charges qu'au premier usage.
+        """
+        report = measure_startup({"TRIANGULATOR_PSM_URL": "http://127.0.0.1:9"})
+
+        assert not set(report["modules"]) & set(OPTIONAL_MODULES)
+
+    def test_first_request_is_fast(self):
+        """Teste create_app() < 100ms et premiere requete < 500ms.
+
+        Raison: La latence de mise a l'echelle est dominee par l'import.
+        """
+        report = measure_startup()
+
+        assert report["create_ms"] < 100
+        assert report["first_request_ms"] < 500
@@ -0,0 +1,40 @@
+"""PLAN.md - Tests de performance - Contention des stores en memoire.
+
+Plusieurs threads lisent et ecrivent le meme store: le store sharde ne
+doit pas perdre de debit quand le nombre de threads augmente.
+"""
+
+import pytest
+
+from pointset_store import MemoryStore, ShardedMemoryStore
+from store_bench import contention_benchmark
+
+
+@pytest.mark.performance
+class TestStoreContention:
+    """Debit sous acces concurrents."""
+
+    def test_sharded_store_keeps_throughput_with_threads(self):
+        """Teste 8 threads sur le store sharde -> debit proche d'un thread.
+
+        Raison: Les lectures sans verrou ne doivent pas s'effondrer sous
+        contention (GIL actif: pas de gain attendu, pas de perte non plus).
+        """
+        single = contention_benchmark(ShardedMemoryStore(), threads=1, ops=20_000)
+        eight = contention_benchmark(ShardedMemoryStore(), threads=8, ops=20_000)
+
+        assert eight > 0.5 * single
+
+    def test_sharded_store_not_slower_than_global_lock(self):
+        """Teste 8 threads -> store sharde au moins aussi rapide (a 30% pres).
+
+        Raison: Le sharding ne doit pas couter plus que le verrou global.
+        """
+        best = {}
+        for name, factory in (("memory", MemoryStore), ("sharded", ShardedMemoryStore)):
+            best[name] = max(
+                contention_benchmark(factory(), threads=8, ops=10_000)
+                for _ in range(3)
+            )
+
+        assert best["sharded"] > 0.7 * best["memory"]
@@ -0,0 +1,125 @@
+"""Tests unitaires - Adjacence des triangles et sections optionnelles.
+
+- Voisins par arete et aretes uniques
+- Section ADJC lisible, ignoree par parse_triangulation
+- Sections conservees par le format compact
+"""
+
+import struct
+
+import pytest
+
+from triangulator_core import (
+    SECTION_ADJACENCY,
+    adjacency_section,
+    compute_adjacency,
+    compute_triangulation,
+    parse_adjacency,
+    parse_sections,
+    parse_triangulation,
+    serialize_triangulation,
+    to_compact,
+)
+
+
+class TestComputeAdjacency:
+    """Voisins et aretes."""
+
+    def test_two_triangles_share_one_edge(self):
+        """Teste un quadrilatere coupe en deux triangles.
+
+        Raison: Cas minimal d'arete interieure.
+        """
+        neighbors, edges = compute_adjacency([0, 1, 2, 0, 2, 3])
+
+        # Arete (2, 0) du premier = arete (0, 2) du second
+        assert list(neighbors) == [-1, -1, 1, 0, -1, -1]
+        assert len(edges) // 2 == 5
+
+    def test_fan_adjacency_matches_euler(self, sample_10_points):
+        """Teste E = V + T - 1 et chaque arete interieure vue deux fois.
+
+        Raison: Coherence topologique d'une triangulation planaire connexe.
+        """
+        verts, tris = compute_triangulation(sample_10_points)
+        flat = [v for tri in tris for v in tri]
+        neighbors, edges = compute_adjacency(flat)
+
+        assert len(edges) // 2 == len(verts) + len(tris) - 1
+        pairs = list(zip(edges[0::2], edges[1::2], strict=True))
+        assert all(a < b for a, b in pairs)
+        assert len(set(pairs)) == len(pairs)
+        for t, tri_neighbors in enumerate(zip(*[iter(neighbors)] * 3, strict=True)):
+            for other in tri_neighbors:
+                if other >= 0:
+                    assert t in neighbors[3 * other : 3 * other + 3]
+
+    def test_empty(self):
+        """Teste l'absence de triangles (points colineaires).
+
+        Raison: Cas degenere deja produit par compute_triangulation.
+        """
+        neighbors, edges = compute_adjacency([])
+        assert len(neighbors) == 0
+        assert len(edges) == 0
+
+
+class TestAdjacencySection:
+    """Section optionnelle du binaire Triangles."""
+
+    def _binary(self, sample_10_points):
+        verts, tris = compute_triangulation(sample_10_points)
+        return serialize_triangulation(verts, tris), tris
+
+    def test_section_roundtrip(self, sample_10_points):
+        """Teste que la section se relit en voisins et aretes.
+
+        Raison: Le client n'a plus a reconstruire l'adjacence.
+        """
+        binary, tris = self._binary(sample_10_points)
+        extended = binary + adjacency_section(binary)
+
+        sections = parse_sections(extended)
+        neighbors, edges = parse_adjacency(sections[SECTION_ADJACENCY])
+
+        assert len(neighbors) == len(tris)
+        assert neighbors[0] == (-1, -1, 1)
+        assert (0, 1) in edges
+
+    def test_parse_triangulation_skips_sections(self, sample_10_points):
+        """Teste que parse_triangulation ignore une section valide.
+
+        Raison: Les clients existants restent compatibles.
+        """
+        binary, tris = self._binary(sample_10_points)
+        extended = binary + adjacency_section(binary)
+
+        assert parse_triangulation(extended) == parse_triangulation(binary)
+        assert parse_sections(binary) == {}
+
+    def test_truncated_section_raises(self, sample_10_points):
+        """Teste qu'une section tronquee leve ValueError.
+
+        Raison: Detecter un telechargement incomplet.
+        """
+        binary, _ = self._binary(sample_10_points)
+        extended = binary + adjacency_section(binary)
+
+        with pytest.raises(ValueError):
+            parse_triangulation(extended[:-1])
+        with pytest.raises(ValueError):
+            parse_triangulation(binary + b"\x00\x01")
+        with pytest.raises(ValueError):
+            parse_adjacency(struct.pack("<I", 5))
+
+    def test_compact_keeps_sections(self, sample_10_points):
+        """Teste que to_compact recopie les sections.
+
+        Raison: Adjacence et format compact se combinent.
+        """
+        binary, tris = self._binary(sample_10_points)
+        extended = binary + adjacency_section(binary)
+        compact = to_compact(extended)
+
+        assert parse_triangulation(compact)[1] == tris
+        assert parse_sections(compact) == parse_sections(extended)
@@ -0,0 +1,260 @@
+"""Tests unitaires - Controle d'admission (admission).
+
+- Budget de cout borne, file courte
+- File equitable entre clients (poids, limite par client)
+- Refus immediat (file pleine) ou apres attente (timeout)
+- Retry-After derive du temps de service observe
+"""
+
+import struct
+import threading
+import time
+
+import pytest
+
+from admission import (
+    AdmissionController,
+    Overloaded,
+    admission_from_env,
+    estimate_cost,
+    parse_weights,
+)
+
+
+class TestAdmissionController:
+    """Budget et file d'attente."""
+
+    def test_admits_within_budget(self):
+        """Teste que des couts dont la somme tient dans le budget passent.
+
+        Raison: Aucun delai ajoute hors surcharge.
+        """
+        controller = AdmissionController(budget=100)
+        a = controller.acquire(60)
+        b = controller.acquire(40)
+
+        assert controller.stats()["inflight"] == 100
+        controller.release(a)
+        controller.release(b)
+        assert controller.stats()["inflight"] == 0
+
+    def test_queue_full_rejects_immediately(self):
+        """Teste le refus immediat quand la file est pleine.
+
+        Raison: Delester sans faire attendre le client.
+        """
+        controller = AdmissionController(budget=10, max_queue=0)
+        controller.acquire(10)
+
+        with pytest.raises(Overloaded) as excinfo:
+            controller.acquire(1)
+        assert excinfo.value.reason == "queue_full"
+        assert excinfo.value.retry_after >= 1
+        assert controller.stats()["rejected"] == 1
+
+    def test_waiter_times_out(self):
+        """Teste le refus d'une requete qui attend plus que timeout.
+
+        Raison: L'attente en file est bornee.
+        """
+        controller = AdmissionController(budget=10, max_queue=4, timeout=0.05)
+        controller.acquire(10)
+
+        with pytest.raises(Overloaded) as excinfo:
+            controller.acquire(5)
+        assert excinfo.value.reason == "timeout"
+        assert controller.stats()["queued"] == 0
+
+    def test_waiter_admitted_on_release(self):
+        """Teste qu'une requete en file passe des que le budget se libere.
+
+        Raison: La file absorbe les pointes courtes.
+        """
+        controller = AdmissionController(budget=10, max_queue=4, timeout=5.0)
+        held = controller.acquire(10)
+        admitted = threading.Event()
+
+        def waiter():
+            controller.release(controller.acquire(5))
+            admitted.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        assert not admitted.wait(0.05)
+        controller.release(held)
+        thread.join(timeout=5)
+
+        assert admitted.is_set()
+        assert controller.stats()["admitted"] == 2
+
+    def test_oversized_cost_runs_alone(self):
+        """Teste qu'un cout superieur au budget est admis seul.
+
+        Raison: Un gros PointSet ne doit pas etre refuse pour toujours.
+        """
+        controller = AdmissionController(budget=10, max_queue=0)
+        token = controller.acquire(1000)
+
+        assert controller.stats()["inflight"] == 10
+        with pytest.raises(Overloaded):
+            controller.acquire(1)
+        controller.release(token)
+
+    def test_retry_after_follows_service_time(self):
+        """Teste que Retry-After croit avec le travail en cours.
+
+        Raison: Conseiller un delai realiste au client.
+        """
+        now = [0.0]
+        controller = AdmissionController(budget=100, max_queue=0, clock=lambda: now[0])
+        token = controller.acquire(100)
+        now[0] = 10.0
+        controller.release(token)
+        controller.acquire(100)
+
+        with pytest.raises(Overloaded) as excinfo:
+            controller.acquire(100)
+        assert excinfo.value.retry_after == 10
+
+
+def _queue(controller, order, cost, client, label=None):
+    """Mettre en attente une requete qui note son admission puis libere."""
+
+    def run():
+        token = controller.acquire(cost, client)
+        order.append(label or client)
+        controller.release(token)
+
+    queued = controller.stats()["queued"]
+    thread = threading.Thread(target=run)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while controller.stats()["queued"] == queued and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return thread
+
+
+class TestFairQueueing:
+    """File equitable entre clients."""
+
+    def test_small_request_overtakes_heavy_backlog(self):
+        """Teste qu'une petite requete passe devant l'arriere d'un gros client.
+
+        Raison: Les requetes interactives gardent une latence faible.
+        """
+        controller = AdmissionController(budget=10, timeout=5.0)
+        held = controller.acquire(10, "batch")
+        order = []
+        threads = [_queue(controller, order, 10, "batch") for _ in range(2)]
+        threads.append(_queue(controller, order, 1, "ui"))
+
+        controller.release(held)
+        for thread in threads:
+            thread.join()
+
+        assert order == ["ui", "batch", "batch"]
+
+    def test_weights_share_capacity(self):
+        """Teste qu'un client de poids 3 passe 3 fois plus souvent.
+
+        Raison: Partage pondere entre clients en concurrence.
+        """
+        controller = AdmissionController(
+            budget=1, max_queue=16, timeout=5.0, weights={"a": 3.0}
+        )
+        held = controller.acquire(1, "x")
+        order = []
+        threads = [_queue(controller, order, 1, "a") for _ in range(4)]
+        threads += [_queue(controller, order, 1, "b") for _ in range(4)]
+
+        controller.release(held)
+        for thread in threads:
+            thread.join()
+
+        assert order[:4].count("a") == 3
+
+    def test_single_client_keeps_arrival_order(self):
+        """Teste qu'un client unique est servi dans l'ordre d'arrivee.
+
+        Raison: Comportement inchange sans identification des clients.
+        """
+        controller = AdmissionController(budget=10, timeout=5.0)
+        held = controller.acquire(10)
+        order = []
+        threads = [_queue(controller, order, cost, "", cost) for cost in (10, 1, 5)]
+
+        controller.release(held)
+        for thread in threads:
+            thread.join()
+
+        assert order == [10, 1, 5]
+
+    def test_per_client_queue_limit(self):
+        """Teste qu'un client ne peut pas occuper toute la file.
+
+        Raison: Un gros client ne doit pas provoquer le refus des autres.
+        """
+        controller = AdmissionController(
+            budget=10, max_queue=8, timeout=5.0, max_queue_per_client=1
+        )
+        held = controller.acquire(10, "batch")
+        order = []
+        waiter = _queue(controller, order, 5, "batch")
+
+        with pytest.raises(Overloaded) as excinfo:
+            controller.acquire(5, "batch")
+        assert excinfo.value.reason == "queue_full"
+        other = _queue(controller, order, 5, "ui")
+        assert controller.stats()["queued_clients"] == 2
+
+        controller.release(held)
+        waiter.join()
+        other.join()
+        assert order == ["ui", "batch"]
+
+
+class TestHelpers:
+    """Estimation du cout et configuration."""
+
+    def test_estimate_cost_reads_point_count(self):
+        """Teste que le cout est le nombre de points de l'en-tete.
+
+        Raison: Estimation sans parser tout le binaire.
+        """
+        assert estimate_cost(struct.pack("<I", 1234) + b"\0" * 8) == 1234
+        assert estimate_cost(b"") == 1
+
+    def test_disabled_with_zero_budget(self, monkeypatch):
+        """Teste que TRIANGULATOR_ADMISSION_BUDGET=0 desactive le controle.
+
+        Raison: Pouvoir revenir au comportement sans borne.
+        """
+        monkeypatch.setenv("TRIANGULATOR_ADMISSION_BUDGET", "0")
+        assert admission_from_env() is None
+        monkeypatch.setenv("TRIANGULATOR_ADMISSION_BUDGET", "500")
+        assert admission_from_env().budget == 500
+
+    def test_parse_weights(self):
+        """Teste le format "client=poids,...".
+
+        Raison: Configuration des poids par variable d'environnement.
+        """
+        assert parse_weights("") == {}
+        assert parse_weights("tenant-a=4, batch=0.5") == {
+            "tenant-a": 4.0, "batch": 0.5,
+        }
+        with pytest.raises(ValueError):
+            parse_weights("batch=0")
+        with pytest.raises(ValueError):
+            parse_weights("batch")
+
+    def test_weights_from_env(self, monkeypatch):
+        """Teste TRIANGULATOR_CLIENT_WEIGHTS et la limite par client.
+
+        Raison: Configurer le partage sans modifier le code.
+        """
+        monkeypatch.setenv("TRIANGULATOR_CLIENT_WEIGHTS", "ui=8")
+        monkeypatch.setenv("TRIANGULATOR_ADMISSION_CLIENT_QUEUE", "3")
+        controller = admission_from_env()
+        assert controller.weights == {"ui": 8.0}
+        assert controller.max_queue_per_client == 3
@@ -0,0 +1,89 @@
+"""Tests unitaires - Triangulation par lots (compute_triangulation_many).
+
+- Resultats identiques a compute_triangulation PointSet par PointSet
+- Cas degeneres (doublons, colineaires, < 3 points uniques)
+- Serialisation directe en binaires Triangles
+"""
+
+import random
+
+import pytest
+
+from triangulator_core import (
+    compute_triangulation,
+    compute_triangulation_many,
+    pack_pointsets,
+    parse_triangulation,
+    serialize_triangulation,
+    serialize_triangulation_many,
+)
+
+
+def _reference(pointset):
+    """Binaire Triangles obtenu par l'API unitaire."""
+    return serialize_triangulation(*compute_triangulation(pointset))
+
+
+class TestComputeTriangulationMany:
+    """Equivalence avec l'API unitaire."""
+
+    def test_matches_single_calls(self):
+        """Teste des milliers de petits PointSets -> memes binaires.
+
+        Raison: Le lot est une optimisation, pas un autre algorithme.
+        """
+        rng = random.Random(0)
+        pointsets = [
+            [(round(rng.uniform(0, 5), 1), round(rng.uniform(0, 5), 1))
+             for _ in range(rng.randint(3, 100))]
+            for _ in range(2000)
+        ]
+
+        packed = compute_triangulation_many(*pack_pointsets(pointsets))
+
+        assert serialize_triangulation_many(packed) == [
+            _reference(p) for p in pointsets
+        ]
+
+    def test_degenerate_sets(self, duplicate_points, collinear_points):
+        """Teste doublons et points colineaires dans un meme lot.
+
+        Raison: Les cas degeneres gardent leur comportement unitaire.
+        """
+        pointsets = [
+            [(p["x"], p["y"]) for p in duplicate_points],
+            [(p["x"], p["y"]) for p in collinear_points],
+        ]
+        vertex_offsets, _, triangle_offsets, _ = packed = compute_triangulation_many(
+            *pack_pointsets(pointsets)
+        )
+
+        assert list(vertex_offsets) == [0, 3, 6]
+        assert list(triangle_offsets) == [0, 1, 1]
+        binaries = serialize_triangulation_many(packed)
+        assert parse_triangulation(binaries[1])[1] == []
+
+    def test_too_few_unique_points_names_the_set(self):
+        """Teste qu'un PointSet invalide leve ValueError avec son rang.
+
+        Raison: Retrouver le PointSet fautif dans un lot de milliers.
+        """
+        pointsets = [[(0, 0), (1, 0), (0, 1)], [(0, 0), (0, 0), (1, 1)]]
+        with pytest.raises(ValueError, match="PointSet 1"):
+            compute_triangulation_many(*pack_pointsets(pointsets))
+
+    def test_plain_lists_are_accepted(self):
+        """Teste offsets et coords en listes Python.
+
+        Raison: Le format empaquete ne doit pas imposer array.
+        """
+        coords = [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0]
+        packed = compute_triangulation_many([0, 4], coords)
+        assert list(packed[3]) == [0, 1, 2, 0, 2, 3]
+
+    def test_empty_batch(self):
+        """Teste un lot vide.
+
+        Raison: Cas limite sans PointSet.
+        """
+        assert serialize_triangulation_many(compute_triangulation_many([0], [])) == []
@@ -0,0 +1,74 @@
+"""Tests unitaires - Compression des reponses (compression).
+
+- Aller-retour gzip / deflate
+- Compression par blocs identique a zlib
+- Configuration par variables d'environnement
+"""
+
+import gzip
+import mmap
+import zlib
+
+import pytest
+
+import compression
+from compression import compress, compression_level, decompress
+
+
+class TestCompress:
+    """Compression gzip / deflate."""
+
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+    def test_roundtrip(self, encoding):
+        """Teste compress puis decompress -> donnees identiques.
+
+        Raison: La compression est transparente pour le client.
+        """
+        data = bytes(range(256)) * 100
+        assert decompress(compress(data, encoding), encoding) == data
+
+    def test_gzip_readable_by_stdlib(self):
+        """Teste que la sortie gzip est lisible par le module gzip.
+
+        Raison: Compatibilite avec les clients HTTP standards.
+        """
+        data = b"triangles" * 1000
+        assert gzip.decompress(compress(data, "gzip")) == data
+
+    def test_chunked_source(self, monkeypatch, tmp_path):
+        """Teste une source mmap plus grande que CHUNK_SIZE.
+
+        Raison: Les resultats sur disque sont compresses sans copie complete.
+        """
+        monkeypatch.setattr(compression, "CHUNK_SIZE", 1000)
+        path = tmp_path / "r.bin"
+        path.write_bytes(bytes(range(256)) * 50)
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+        ):
+            out = compress(m, "deflate")
+
+        assert zlib.decompress(out) == path.read_bytes()
+
+    def test_unknown_encoding_raises(self):
+        """Teste qu'un encodage inconnu leve ValueError.
+
+        Raison: Seuls gzip et deflate sont negocies.
+        """
+        with pytest.raises(ValueError):
+            compress(b"x", "br")
+
+
+class TestConfiguration:
+    """Lecture de l'environnement."""
+
+    def test_level_is_clamped(self, monkeypatch):
+        """Teste que le niveau est borne a 0..9.
+
+        Raison: Une valeur hors bornes ne doit pas faire echouer zlib.
+        """
+        monkeypatch.setenv("TRIANGULATOR_COMPRESSION_LEVEL", "42")
+        assert compression_level() == 9
+        monkeypatch.delenv("TRIANGULATOR_COMPRESSION_LEVEL")
+        assert compression_level() == 6
@@ -0,0 +1,158 @@
+"""Tests unitaires - Modele de cout du mode auto (cost_model).
+
+- Durees predites et choix inline / pool
+- Calibration sur les mesures de triangulator_bench
+- Modele enregistre avec la reference locale, par machine
+"""
+
+import json
+import math
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import cost_model as cost_model_module
+import triangulator_bench as bench
+from cost_model import (
+    DEFAULT_COEFFICIENTS,
+    CostModel,
+    calibrate,
+    load_cost_model,
+    machine_id,
+    measure_pool_overhead,
+)
+
+
+def _stage(sizes, seconds):
+    """Resultat d'une etape au format run_suite (une mesure par taille)."""
+    return {
+        "sizes": sizes,
+        "samples": [[t] for t in seconds],
+        "median": seconds,
+        "exponent": bench.fit_exponent(sizes, seconds),
+    }
+
+
+class TestCostModel:
+    """Predictions et decision d'execution."""
+
+    def test_sweep_costs_more_than_fan(self):
+        """Teste que le balayage est predit plus couteux que l'eventail.
+
+        Raison: Le tri ajoute un facteur log n.
+        """
+        model = CostModel()
+        assert model.predict(1_000_000, "sweep") > model.predict(1_000_000, "fan")
+        assert model.predict(10, "sweep") < model.predict(100_000, "sweep")
+
+    def test_small_sets_stay_inline(self):
+        """Teste qu'un petit calcul reste dans le thread de la requete.
+
+        Raison: La latence du pool depasse le calcul lui-meme.
+        """
+        model = CostModel()
+        assert model.execution(100) == "inline"
+        assert model.execution(1_000_000) == "pool"
+        assert model.execution(1_000_000, pool=False) == "inline"
+
+    def test_costly_transfer_stays_inline(self):
+        """Teste qu'un transfert trop cher devant le calcul reste inline.
+
+        Raison: Le pool ne doit jamais ralentir plus qu'il ne libere.
+        """
+        model = CostModel({"pool_per_byte": 1e-6})
+        assert model.execution(1_000_000) == "inline"
+
+
+class TestCalibration:
+    """Calibration par le benchmark et reference locale."""
+
+    def test_calibrate_recovers_coefficients(self):
+        """Teste la calibration sur des mesures synthetiques exactes.
+
+        Raison: Les coefficients refletent la machine mesuree.
+        """
+        sizes = [1_000, 10_000, 100_000]
+        results = {
+            "parse": _stage(sizes, [2e-7 * n for n in sizes]),
+            "compute": _stage(sizes, [1e-6 * n for n in sizes]),
+            "sweep": _stage(sizes, [3e-7 * n * math.log2(n) for n in sizes]),
+        }
+        coefficients = calibrate(results, {"pool_fixed": 1e-3})
+
+        assert math.isclose(coefficients["parse"], 2e-7)
+        assert math.isclose(coefficients["fan"], 1e-6)
+        assert math.isclose(coefficients["sweep"], 3e-7)
+        assert coefficients["pool_fixed"] == 1e-3
+        assert "serialize" not in coefficients
+
+    def test_measure_pool_overhead(self):
+        """Teste la mesure de latence sur un executeur.
+
+        Raison: La calibration tourne sur le pool reel de la machine.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            overhead = measure_pool_overhead(pool, payload_bytes=1000, repeats=2)
+
+        assert overhead["pool_fixed"] >= 0
+        assert overhead["pool_per_byte"] >= 0
+
+    def test_model_is_machine_local(self, tmp_path, monkeypatch):
+        """Teste que le modele enregistre ne vaut que pour sa machine.
+
+        Raison: Des coefficients d'une autre machine fausseraient le choix.
+        """
+        path = str(tmp_path / "baseline.json")
+        bench.save_baseline({}, path, {"fan": 5e-6})
+
+        model = load_cost_model(path)
+        assert model.coefficients["fan"] == 5e-6
+        assert model.coefficients["sweep"] == DEFAULT_COEFFICIENTS["sweep"]
+        monkeypatch.setattr(cost_model_module, "machine_id", lambda: {"node": "other"})
+        assert load_cost_model(path).coefficients == DEFAULT_COEFFICIENTS
+
+    def test_stale_baseline_uses_defaults(self, tmp_path):
+        """Teste qu'un modele d'une ancienne version de reference est ignore.
+
+        Raison: Calibre avant l'etape sweep, il repose sur des coefficients
+        par defaut et doit etre recalibre.
+        """
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({
+            "machine": machine_id(),
+            "results": {},
+            "cost_model": {"fan": 5e-6},
+        }))
+
+        assert load_cost_model(str(path)).coefficients == DEFAULT_COEFFICIENTS
+
+    def test_loading_does_not_import_the_benchmark(self, tmp_path):
+        """Teste que le chargement du modele n'importe pas triangulator_bench.
+
+        Raison: Le service charge le modele a la premiere requete auto; le
+        CLI de benchmark et ses imports n'ont rien a y faire.
+        """
+        probe = (
+            "import sys, cost_model; cost_model.load_cost_model(sys.argv[1]); "
+            "print('triangulator_bench' in sys.modules)"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", probe, str(tmp_path / "absent.json")],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(cost_model_module.__file__)),
+            check=True,
+        )
+
+        assert proc.stdout.strip() == "False"
+
+    def test_missing_baseline_uses_defaults(self, tmp_path):
+        """Teste le modele par defaut sans reference.
+
+        Raison: Le mode auto fonctionne avant toute calibration.
+        """
+        model = load_cost_model(str(tmp_path / "absent.json"), min_offload_seconds=1)
+
+        assert model.coefficients == DEFAULT_COEFFICIENTS
+        assert model.min_offload_seconds == 1
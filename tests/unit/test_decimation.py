@@ -0,0 +1,143 @@
+"""Tests unitaires - Niveaux de detail (decimate_pointset, select_lod_level).
+
+- Sous-echantillon borne par le budget, points issus du PointSet
+- Couverture spatiale (stratification)
+- Choix du niveau
+"""
+
+import mmap
+import random
+import struct
+import tracemalloc
+from array import array
+
+import pytest
+
+from triangulator_core import (
+    LOD_LEVELS,
+    decimate_pointset,
+    parse_pointset,
+    select_lod_level,
+    serialize_pointset,
+)
+
+
+def _uniform(n, seed=0):
+    """PointSet binaire de n points uniformes dans [0, 100]^2."""
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)]
+    return serialize_pointset(points)
+
+
+class TestDecimation:
+    """Sous-echantillonnage stratifie."""
+
+    def test_small_pointset_is_kept_whole(self):
+        """Teste qu'un PointSet sous le budget est rendu tel quel.
+
+        Raison: Un apercu d'un petit PointSet est le PointSet complet.
+        """
+        data = _uniform(50)
+        assert decimate_pointset(data, 64) == parse_pointset(data)
+
+    def test_budget_is_respected_and_points_are_original(self):
+        """Teste au plus budget points, tous presents dans le PointSet.
+
+        Raison: L'apercu ne doit pas inventer de points.
+        """
+        data = _uniform(20_000)
+        original = set(parse_pointset(data))
+
+        kept = decimate_pointset(data, 256)
+
+        assert 128 <= len(kept) <= 256
+        assert set(kept) <= original
+
+    def test_sample_covers_the_extent(self):
+        """Teste que chaque quadrant de l'emprise est represente.
+
+        Raison: La stratification evite un apercu concentre dans un coin.
+        """
+        kept = decimate_pointset(_uniform(20_000), 256)
+
+        quadrants = {(x >= 50, y >= 50) for x, y in kept}
+        assert len(quadrants) == 4
+
+    def test_clustered_cloud_fills_half_the_budget(self):
+        """Teste qu'un nuage concentre remplit au moins la moitie du budget.
+
+        Raison: La grille est affinee quand beaucoup de cellules sont vides.
+        """
+        rng = random.Random(1)
+        points = [(rng.gauss(0, 1), rng.gauss(0, 1)) for _ in range(20_000)]
+
+        kept = decimate_pointset(serialize_pointset(points), 1024)
+
+        assert 512 <= len(kept) <= 1024
+
+    def test_reads_only_sampled_coordinates(self):
+        """Teste que l'allocation ne depend pas de la taille du PointSet.
+
+        Raison: Un apercu de 100M points recopiait ~800 Mo de coordonnees.
+        """
+        n = 1_000_000
+        rng = random.Random(2)
+        data = struct.pack("<I", n) + array(
+            "f", (rng.uniform(0, 100) for _ in range(2 * n))
+        ).tobytes()
+
+        tracemalloc.start()
+        try:
+            kept = decimate_pointset(data, 1024)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert 512 <= len(kept) <= 1024
+        assert peak < len(data) // 8
+
+    def test_memory_mapped_input_is_released(self, tmp_path):
+        """Teste un PointSet projete en memoire, refermable apres l'apercu.
+
+        Raison: Le store disque et le snapshot servent des mmap.
+        """
+        data = _uniform(20_000)
+        path = tmp_path / "points.bin"
+        path.write_bytes(data)
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        kept = decimate_pointset(mapped, 256)
+        mapped.close()
+
+        assert kept == decimate_pointset(data, 256)
+        assert set(kept) <= set(parse_pointset(data))
+
+    def test_invalid_binary_raises(self):
+        """Teste qu'un binaire tronque leve ValueError.
+
+        Raison: Meme validation que parse_pointset.
+        """
+        with pytest.raises(ValueError):
+            decimate_pointset(_uniform(100)[:-3], 64)
+
+
+class TestLevelSelection:
+    """Choix du niveau de detail."""
+
+    def test_largest_level_within_budget(self):
+        """Teste le choix du plus grand niveau <= budget.
+
+        Raison: Les niveaux sont discrets pour etre mis en cache.
+        """
+        assert select_lod_level(LOD_LEVELS[0]) == LOD_LEVELS[0]
+        assert select_lod_level(5000) == 4096
+        assert select_lod_level(10**9) == LOD_LEVELS[-1]
+
+    def test_budget_below_smallest_level_raises(self):
+        """Teste qu'un budget trop petit leve ValueError.
+
+        Raison: Pas d'apercu sans triangles exploitables.
+        """
+        with pytest.raises(ValueError):
+            select_lod_level(LOD_LEVELS[0] - 1)
@@ -0,0 +1,99 @@
+"""Tests unitaires - Comptabilite memoire (memory_accounting).
+
+- Attribution des allocations aux sous-systemes
+- Pics d'allocation par mesure, imbriques
+- Activation par l'environnement
+"""
+
+import tracemalloc
+
+import pytest
+
+from memory_accounting import MemoryTracker, memory_tracker_from_env, subsystem_of
+
+
+@pytest.fixture
+def tracker():
+    """Tracker arrete en fin de test (s'il a demarre tracemalloc)."""
+    tracker = MemoryTracker()
+    yield tracker
+    tracker.stop()
+
+
+def _traceback(*filenames: str) -> tracemalloc.Traceback:
+    """Construire une trace (de la plus ancienne a la plus recente frame)."""
+    return tracemalloc.Traceback(tuple((name, 1) for name in reversed(filenames)))
+
+
+class TestSubsystems:
+    """Attribution d'une allocation a un sous-systeme."""
+
+    def test_most_recent_service_frame_wins(self):
+        """Teste que la frame du service la plus recente decide.
+
+        Raison: Une allocation du store appelee par l'API revient au store.
+        """
+        trace = _traceback("/srv/app.py", "/srv/pointset_store.py", "<frozen>")
+        assert subsystem_of(trace) == "store"
+
+    def test_framework_allocation_is_http(self):
+        """Teste qu'une allocation de Werkzeug hors du service compte en http.
+
+        Raison: Distinguer le cout du serveur HTTP de celui du service.
+        """
+        trace = _traceback("/venv/werkzeug/serving.py", "/venv/werkzeug/wsgi.py")
+        assert subsystem_of(trace) == "http"
+        assert subsystem_of(_traceback("/usr/lib/python3/json.py")) == "other"
+
+
+class TestMemoryTracker:
+    """Pics d'allocation et rapport."""
+
+    def test_peak_covers_temporary_buffer(self, tracker):
+        """Teste qu'un tampon libere avant la fin compte dans le pic.
+
+        Raison: Les copies intermediaires (points_dicts) sont temporaires.
+        """
+        span = tracker.begin()
+        buffer = bytearray(1_000_000)
+        del buffer
+        peak = tracker.end(span, "stage", "convert")
+
+        assert peak >= 1_000_000
+        report = tracker.report()
+        assert report["stages"]["convert"]["max_peak_bytes"] == peak
+        assert report["stages"]["convert"]["count"] == 1
+
+    def test_nested_spans_keep_outer_peak(self, tracker):
+        """Teste qu'une etape imbriquee n'efface pas le pic de la requete.
+
+        Raison: reset_peak() est global; le pic anterieur doit etre reporte.
+        """
+        outer = tracker.begin()
+        buffer = bytearray(2_000_000)
+        del buffer
+        inner = tracker.begin()
+        small = tracker.end(inner, "stage", "serialize")
+        peak = tracker.end(outer, "request", "/triangulation/<pointSetId>")
+
+        assert small < 1_000_000
+        assert peak >= 2_000_000
+
+    def test_report_groups_live_bytes(self, tracker):
+        """Teste que le rapport donne les octets vivants par sous-systeme.
+
+        Raison: Repondre a "qui occupe le tas" sans outil externe.
+        """
+        report = tracker.report()
+
+        assert report["tracing"] is True
+        assert report["traced_bytes"] > 0
+        assert sum(report["subsystems"].values()) > 0
+
+    def test_disabled_without_env(self, monkeypatch):
+        """Teste que la comptabilite est desactivee par defaut.
+
+        Raison: tracemalloc ralentit chaque allocation.
+        """
+        monkeypatch.delenv("TRIANGULATOR_MEMORY_TRACKING", raising=False)
+        assert memory_tracker_from_env() is None
@@ -0,0 +1,78 @@
+"""Tests unitaires - Metriques au format Prometheus (metrics).
+
+- Compteurs et jauges
+- Histogrammes cumulatifs
+- Echappement des labels
+"""
+
+import pytest
+
+from metrics import Counter, Gauge, Histogram, Registry
+
+
+class TestMetrics:
+    """Exposition texte des metriques."""
+
+    def test_counter_render(self):
+        """Teste le rendu d'un compteur avec labels.
+
+        Raison: Format attendu par Prometheus.
+        """
+        counter = Counter("req_total", "Requetes.", ("status",))
+        counter.inc(status=200)
+        counter.inc(2, status=200)
+        counter.inc(status=404)
+
+        text = counter.render()
+        assert "# TYPE req_total counter" in text
+        assert 'req_total{status="200"} 3' in text
+        assert 'req_total{status="404"} 1' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Teste que les buckets d'un histogramme sont cumulatifs.
+
+        Raison: Les quantiles Prometheus reposent sur des buckets cumulatifs.
+        """
+        hist = Histogram("lat", "Latence.", ("stage",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            hist.observe(value, stage="compute")
+
+        text = hist.render()
+        assert 'lat_bucket{stage="compute",le="0.1"} 1' in text
+        assert 'lat_bucket{stage="compute",le="1"} 3' in text
+        assert 'lat_bucket{stage="compute",le="+Inf"} 4' in text
+        assert 'lat_count{stage="compute"} 4' in text
+        assert 'lat_sum{stage="compute"} 4.25' in text
+
+    def test_histogram_time_context(self):
+        """Teste que time() enregistre une observation.
+
+        Raison: Chronometrage des etapes par bloc with.
+        """
+        hist = Histogram("lat", "Latence.", ("stage",))
+        with hist.time(stage="parse"):
+            pass
+        assert hist.count(stage="parse") == 1
+
+    def test_wrong_labels_raise(self):
+        """Teste que des labels non declares levent ValueError.
+
+        Raison: Eviter des series incoherentes.
+        """
+        with pytest.raises(ValueError):
+            Counter("c", "C.", ("a",)).inc(b=1)
+
+    def test_registry_with_gauge_and_escaping(self):
+        """Teste une jauge et l'echappement des valeurs de labels.
+
+        Raison: Les valeurs libres ne doivent pas casser le format.
+        """
+        registry = Registry()
+        registry.register(Gauge("store_bytes", "Octets.", lambda: 42))
+        counter = registry.register(Counter("c", "C.", ("path",)))
+        counter.inc(path='a"b')
+
+        text = registry.render()
+        assert "store_bytes 42\n" in text
+        assert 'c{path="a\\"b"} 1' in text
+        assert text.endswith("\n")
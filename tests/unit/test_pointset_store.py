@@ -0,0 +1,510 @@
+"""Tests unitaires - Stockage des PointSets et resultats.
+
+- MemoryStore, DiskStore et SharedMemoryStore exposent la meme interface
+- DiskStore relit les donnees via mmap et survit a un redemarrage
+- SharedMemoryStore partage les entrees entre processus
+- MemoryStore respecte son budget (LRU) et la duree de vie des entrees
+- ShardedMemoryStore garde ces garanties sous acces concurrents
+- Les cles dangereuses sont refusees
+"""
+
+import mmap
+import os
+import subprocess
+import sys
+import threading
+import uuid
+
+import pytest
+
+from pointset_store import (
+    DiskStore,
+    MemoryStore,
+    ShardedMemoryStore,
+    SharedMemoryStore,
+    create_store,
+)
+from triangulator_core import parse_pointset, serialize_pointset
+
+POINTS = [(0.0, 0.0), (1.0, 0.0), (0.5, 1.0)]
+PID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def shm_store():
+    """Retourne un store partage isole (prefixe unique), detruit en fin de test."""
+    shared = SharedMemoryStore(f"tritest{uuid.uuid4().hex[:8]}")
+    yield shared
+    shared.destroy()
+
+
+@pytest.fixture(params=["memory", "sharded", "disk", "shm"])
+def store(request, tmp_path):
+    """Retourne un store de chaque backend."""
+    if request.param == "memory":
+        return MemoryStore()
+    if request.param == "sharded":
+        return ShardedMemoryStore()
+    if request.param == "disk":
+        return DiskStore(str(tmp_path))
+    return request.getfixturevalue("shm_store")
+
+
+class TestStores:
+    """Interface commune des stores."""
+
+    def test_pointset_roundtrip(self, store):
+        """Teste put_pointset puis get_pointset -> memes points.
+
+        Raison: Le store doit restituer le binaire PointSet a l'identique.
+        """
+        store.put_pointset(PID, serialize_pointset(POINTS))
+
+        assert PID in store
+        assert len(store) == 1
+        assert parse_pointset(store.get_pointset(PID)) == POINTS
+
+    def test_unknown_pointset_returns_none(self, store):
+        """Teste get_pointset avec un ID inconnu -> None.
+
+        Raison: L'application traduit None en 404.
+        """
+        assert store.get_pointset(PID) is None
+        assert store.get_result(PID) is None
+        assert PID not in store
+
+    def test_result_roundtrip(self, store):
+        """Teste put_result puis get_result -> memes bytes.
+
+        Raison: Eviter de recalculer une triangulation deja servie.
+        """
+        store.put_result(PID, b"\x01\x02\x03")
+
+        assert bytes(store.get_result(PID)) == b"\x01\x02\x03"
+
+    def test_stats_reports_bytes(self, store):
+        """Teste que stats() compte les entrees et les octets.
+
+        Raison: L'occupation du store doit etre observable.
+        """
+        store.put_pointset(PID, serialize_pointset(POINTS))
+        stats = store.stats()
+
+        assert stats["pointsets"] == 1
+        assert stats["bytes"] >= 4 + 8 * len(POINTS)
+
+
+class FakeClock:
+    """Horloge manuelle pour les tests de duree de vie."""
+
+    def __init__(self):
+        """Create a clock at t=0."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Retourne l'instant courant."""
+        return self.now
+
+
+@pytest.fixture(params=["memory", "sharded"])
+def memory_store_class(request):
+    """Store memoire a LRU exact ou CLOCK (un shard: ordre deterministe)."""
+    if request.param == "memory":
+        return MemoryStore
+    return lambda **kwargs: ShardedMemoryStore(shards=1, **kwargs)
+
+
+class TestMemoryStoreRetention:
+    """Budget en octets, LRU et duree de vie."""
+
+    def test_lru_eviction_respects_byte_budget(self, memory_store_class):
+        """Teste que l'entree la moins recemment utilisee est evincee.
+
+        Raison: La memoire doit rester bornee sous trafic continu.
+        """
+        store = memory_store_class(max_bytes=25)
+        store.put_pointset("a", b"x" * 10)
+        store.put_pointset("b", b"x" * 10)
+        assert store.get_pointset("a") is not None  # "a" devient recent
+        store.put_pointset("c", b"x" * 10)
+
+        assert "b" not in store
+        assert "a" in store and "c" in store
+        stats = store.stats()
+        assert stats["bytes"] == 20
+        assert stats["evictions"] == 1
+        assert stats["pointsets"] == len(store) == 2
+
+    def test_results_share_the_budget(self, memory_store_class):
+        """Teste que les resultats en cache comptent dans le budget.
+
+        Raison: Les triangulations sont plus volumineuses que les PointSets.
+        """
+        store = memory_store_class(max_bytes=15)
+        store.put_pointset("a", b"x" * 10)
+        store.put_result("a", b"y" * 10)
+
+        assert store.get_pointset("a") is None
+        assert store.get_result("a") == b"y" * 10
+
+    def test_oversized_pointset_is_rejected(self, memory_store_class):
+        """Teste qu'un PointSet plus gros que le budget leve ValueError.
+
+        Raison: Ne pas vider tout le store pour une seule entree.
+        """
+        store = memory_store_class(max_bytes=5)
+        with pytest.raises(ValueError):
+            store.put_pointset("a", b"x" * 10)
+        store.put_result("a", b"x" * 10)
+        assert store.get_result("a") is None
+
+    def test_expired_entry_is_unknown(self, memory_store_class):
+        """Teste qu'une entree expiree se comporte comme inconnue.
+
+        Raison: Un ID expire doit donner un 404 propre.
+        """
+        clock = FakeClock()
+        store = memory_store_class(ttl_seconds=60, clock=clock)
+        store.put_pointset("a", b"x")
+
+        clock.now = 59.0
+        assert "a" in store
+        clock.now = 60.0
+        assert store.get_pointset("a") is None
+        stats = store.stats()
+        assert stats["expirations"] == 1
+        assert stats["bytes"] == 0
+        assert len(store) == 0
+
+    def test_unread_entries_expire_on_write(self, memory_store_class):
+        """Teste que des entrees jamais relues sont retirees a l'ecriture.
+
+        Raison: Sans budget en octets, la duree de vie seule borne la memoire.
+        """
+        clock = FakeClock()
+        store = memory_store_class(ttl_seconds=10, clock=clock)
+        for i in range(1000):
+            clock.now = float(i)
+            store.put_result(f"r{i}", b"x" * 1000)
+            assert store.stats()["bytes"] <= 20 * 1000
+
+        stats = store.stats()
+        assert stats["expirations"] >= 980
+        assert stats["bytes"] == 1000 * stats["entries"]
+        assert store.get_result("r999") is not None
+
+    def test_budget_from_env(self, monkeypatch):
+        """Teste la configuration du budget et de la duree de vie par env.
+
+        Raison: Les limites se reglent au deploiement.
+        """
+        monkeypatch.setenv("TRIANGULATOR_STORE", "memory")
+        monkeypatch.setenv("TRIANGULATOR_STORE_MAX_BYTES", "1024")
+        monkeypatch.setenv("TRIANGULATOR_STORE_TTL", "30")
+
+        store = create_store()
+        assert store.max_bytes == 1024
+        assert store.ttl_seconds == 30.0
+
+
+class TestShardedMemoryStore:
+    """Repartition en shards et acces concurrents."""
+
+    def test_newest_entry_survives_eviction(self):
+        """Teste que l'entree qui vient d'etre ecrite n'est jamais evincee.
+
+        Raison: Un PointSet enregistre doit etre lisible juste apres.
+        """
+        store = ShardedMemoryStore(shards=8, max_bytes=50)
+        for i in range(100):
+            store.put_pointset(f"id{i}", b"x" * 10)
+            assert f"id{i}" in store
+            assert store.stats()["bytes"] <= 50
+
+        assert store.stats()["evictions"] == 95
+
+    def test_concurrent_writers_keep_accounting_exact(self):
+        """Teste ecritures et lectures concurrentes -> totaux exacts.
+
+        Raison: Les verrous par shard ne doivent perdre aucune mise a jour.
+        """
+        store = ShardedMemoryStore(shards=4, max_bytes=10_000)
+
+        def worker(t):
+            for i in range(500):
+                store.put_pointset(f"{t}-{i}", b"x" * 10)
+                store.get_pointset(f"{t}-{i // 2}")
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = store.stats()
+        assert stats["bytes"] == 10 * stats["entries"] <= 10_000
+        assert stats["pointsets"] == len(store) == stats["entries"]
+        assert stats["evictions"] == 8 * 500 - stats["entries"]
+
+    def test_unread_entries_expire_across_shards(self):
+        """Teste la duree de vie sans lecture ni budget, sur plusieurs shards.
+
+        Raison: L'aiguille de chaque shard retire les entrees expirees.
+        """
+        clock = FakeClock()
+        store = ShardedMemoryStore(shards=16, ttl_seconds=10, clock=clock)
+        for i in range(1000):
+            clock.now = float(i)
+            store.put_pointset(f"id{i}", b"x" * 1000)
+            assert store.stats()["entries"] < 100
+
+        stats = store.stats()
+        assert stats["pointsets"] == len(store) == stats["entries"]
+        assert stats["expirations"] == 1000 - stats["entries"]
+
+    def test_clock_hand_prefers_expired_entries(self):
+        """Teste qu'une entree expiree est evincee malgre son bit de reference.
+
+        Raison: Une entree perimee ne doit pas couter une entree vivante.
+        """
+        clock = FakeClock()
+        store = ShardedMemoryStore(
+            shards=1, max_bytes=20, ttl_seconds=10, clock=clock
+        )
+        store.put_pointset("old", b"x" * 10)
+        assert "old" in store
+        clock.now = 5.0
+        store.put_pointset("a", b"x" * 10)
+        clock.now = 10.0
+        store.EXPIRE_STEPS = 0
+        store.put_pointset("b", b"x" * 10)
+
+        stats = store.stats()
+        assert stats["expirations"] == 1 and stats["evictions"] == 0
+        assert "a" in store and "b" in store
+
+    def test_invalid_shard_count_raises(self):
+        """Teste qu'un nombre de shards nul leve ValueError.
+
+        Raison: Detecter une mauvaise configuration au demarrage.
+        """
+        with pytest.raises(ValueError):
+            ShardedMemoryStore(shards=0)
+
+
+class TestDiskStore:
+    """Specificites du store disque."""
+
+    def test_get_pointset_is_memory_mapped(self, tmp_path):
+        """Teste que la lecture passe par mmap.
+
+        Raison: Le volume stocke ne doit pas etre charge en RAM.
+        """
+        store = DiskStore(str(tmp_path))
+        store.put_pointset(PID, serialize_pointset(POINTS))
+
+        assert isinstance(store.get_pointset(PID), mmap.mmap)
+
+    def test_data_survives_new_instance(self, tmp_path):
+        """Teste qu'un nouveau DiskStore sur le meme repertoire relit les donnees.
+
+        Raison: Les PointSets ne doivent plus etre perdus au redemarrage.
+        """
+        DiskStore(str(tmp_path)).put_pointset(PID, serialize_pointset(POINTS))
+        DiskStore(str(tmp_path)).put_result(PID, b"abc")
+
+        reopened = DiskStore(str(tmp_path))
+        assert parse_pointset(reopened.get_pointset(PID)) == POINTS
+        assert reopened.result_path(PID) is not None
+
+    def test_entries_listed_oldest_first(self, tmp_path):
+        """Teste que entries() liste PointSets et resultats par anciennete.
+
+        Raison: Le prechauffage recopie les plus recents en dernier.
+        """
+        store = DiskStore(str(tmp_path))
+        store.put_result("r1", b"abc")
+        store.put_pointset(PID, serialize_pointset(POINTS))
+        os.utime(os.path.join(str(tmp_path), "results", "r1.bin"), ns=(1, 1))
+
+        assert store.entries() == [("result", "r1"), ("pointset", PID)]
+
+    def test_rejects_path_traversal_key(self, tmp_path):
+        """Teste qu'une cle contenant un chemin est refusee.
+
+        Raison: Les cles servent de nom de fichier.
+        """
+        store = DiskStore(str(tmp_path))
+        with pytest.raises(ValueError):
+            store.put_pointset("../evil", b"\x00\x00\x00\x00")
+
+
+class TestSharedMemoryStore:
+    """Specificites du store en memoire partagee."""
+
+    def test_entry_visible_from_another_process(self, shm_store):
+        """Teste qu'un PointSet ecrit par un autre processus est visible.
+
+        Raison: Un POST traite par le worker A doit etre lu par le worker B.
+        """
+        code = (
+            "from pointset_store import SharedMemoryStore\n"
+            "from triangulator_core import serialize_pointset\n"
+            f"s = SharedMemoryStore({shm_store.prefix!r})\n"
+            f"s.put_pointset({PID!r}, serialize_pointset({POINTS!r}))\n"
+            f"s.put_result({PID!r}, b'res')\n"
+            "s.close()\n"
+        )
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+        assert parse_pointset(shm_store.get_pointset(PID)) == POINTS
+        assert bytes(shm_store.get_result(PID)) == b"res"
+        assert len(shm_store) == 1
+
+    def test_existing_entry_is_not_overwritten(self, shm_store):
+        """Teste qu'une seconde ecriture de la meme cle est ignoree.
+
+        Raison: Les entrees sont immuables une fois publiees.
+        """
+        shm_store.put_result(PID, b"first")
+        shm_store.put_result(PID, b"other")
+
+        assert bytes(shm_store.get_result(PID)) == b"first"
+
+    def test_more_entries_than_open_files(self):
+        """Teste plus d'ecritures et de lectures que de descripteurs permis.
+
+        Raison: Un segment attache par entree epuisait les descripteurs.
+        """
+        resource = pytest.importorskip("resource")
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        limit = 256 if hard == resource.RLIM_INFINITY else min(256, hard)
+        shared = SharedMemoryStore(
+            f"tritest{uuid.uuid4().hex[:8]}", max_attached=8, copy_below=64
+        )
+        resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+        try:
+            for i in range(2 * limit):
+                shared.put_result(f"r{i}", bytes([i % 256]) * (32 + 64 * (i % 2)))
+                assert bytes(shared.get_result(f"r{i}"))[0] == i % 256
+                assert f"r{i}" not in shared
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+            shared.destroy()
+
+        assert shared.stats()["attached"] == 0
+
+    def test_large_entries_stay_attached_within_bound(self, shm_store):
+        """Teste la LRU des segments attaches (lecture sans copie).
+
+        Raison: Les gros binaires sont servis sans copie, en nombre borne.
+        """
+        shm_store.copy_below = 0
+        shm_store.max_attached = 2
+        views = []
+        for i in range(5):
+            shm_store.put_result(f"r{i}", b"x" * 100)
+            views.append(shm_store.get_result(f"r{i}"))
+
+        assert all(isinstance(view, memoryview) for view in views)
+        assert shm_store.stats()["attached"] == 5
+        for view in views:
+            view.release()
+        shm_store.get_result("r0")
+        assert shm_store.stats()["attached"] == 2
+
+    def test_byte_budget_unlinks_oldest(self, shm_store):
+        """Teste que le volume des segments reste sous max_bytes.
+
+        Raison: /dev/shm ne doit pas croitre sans limite.
+        """
+        if not os.path.isdir("/dev/shm"):
+            pytest.skip("/dev/shm requis")
+        shm_store.max_bytes = 10 * 4096
+        for i in range(50):
+            shm_store.put_result(f"r{i}", b"x" * 1000)
+            assert shm_store.get_result(f"r{i}") == b"x" * 1000
+
+        stats = shm_store.stats()
+        assert 0 < stats["bytes"] <= shm_store.max_bytes
+        assert stats["entries"] < 50
+        assert shm_store.get_result("r0") is None
+        with pytest.raises(ValueError):
+            shm_store.put_pointset(PID, b"x" * shm_store.max_bytes)
+
+    def test_budget_scans_only_past_the_margin(self, shm_store, monkeypatch):
+        """Teste que /dev/shm n'est parcouru qu'une fois la marge consommee.
+
+        Raison: Un parcours par ecriture rendait le cout total quadratique.
+        """
+        if not os.path.isdir("/dev/shm"):
+            pytest.skip("/dev/shm requis")
+        scans = []
+        evict = shm_store._evict
+        monkeypatch.setattr(
+            shm_store, "_evict", lambda name: scans.append(name) or evict(name)
+        )
+        shm_store.max_bytes = 100_000
+        for i in range(300):
+            shm_store.put_result(f"r{i}", b"x" * 992)
+            assert shm_store.stats()["bytes"] <= shm_store.max_bytes
+
+        # 1 parcours initial, puis un par marge de 10 % (10 ecritures)
+        assert 1 < len(scans) <= 1 + 300 // 9
+        assert shm_store.get_result("r299") == b"x" * 992
+
+    def test_destroy_is_silent(self, shm_store):
+        """Teste que destroy() ne fait pas reagir le resource_tracker.
+
+        Raison: Un double desenregistrement affichait des KeyError.
+        """
+        code = (
+            "from pointset_store import SharedMemoryStore\n"
+            f"s = SharedMemoryStore({shm_store.prefix!r})\n"
+            "for i in range(20):\n"
+            "    s.put_result(f'r{i}', b'res')\n"
+            "    s.get_result(f'r{i}')\n"
+            "s.destroy()\n"
+        )
+        done = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, check=True,
+            capture_output=True, text=True,
+        )
+
+        assert done.stderr == ""
+        assert len(shm_store) == 0 and shm_store.stats()["entries"] == 0
+
+
+class TestCreateStore:
+    """Selection du backend."""
+
+    def test_default_backend_is_memory(self, monkeypatch):
+        """Teste que le backend par defaut est en memoire, reparti en shards.
+
+        Raison: Memoire du processus sans configuration, sans verrou global.
+        """
+        monkeypatch.delenv("TRIANGULATOR_STORE", raising=False)
+        monkeypatch.delenv("TRIANGULATOR_STORE_SHARDS", raising=False)
+        assert isinstance(create_store(), ShardedMemoryStore)
+        monkeypatch.setenv("TRIANGULATOR_STORE_SHARDS", "1")
+        assert isinstance(create_store(), MemoryStore)
+
+    def test_disk_backend_from_env(self, monkeypatch, tmp_path):
+        """Teste la selection du store disque par variables d'environnement.
+
+        Raison: Le backend se configure au deploiement.
+        """
+        monkeypatch.setenv("TRIANGULATOR_STORE", "disk")
+        monkeypatch.setenv("TRIANGULATOR_STORE_DIR", str(tmp_path))
+        assert isinstance(create_store(), DiskStore)
+
+    def test_unknown_backend_raises(self):
+        """Teste qu'un backend inconnu leve ValueError.
+
+        Raison: Detecter les erreurs de configuration au demarrage.
+        """
+        with pytest.raises(ValueError):
+            create_store("nope")
@@ -0,0 +1,92 @@
+"""Tests unitaires - Echantillonnage des requetes lentes (profiling).
+
+- Capture ecrite seulement au-dela du seuil
+- Modes cprofile et tracemalloc
+- Nombre de captures borne
+"""
+
+import pstats
+import tracemalloc
+
+import pytest
+
+from profiling import SlowRequestSampler, sampler_from_env
+
+
+class TestSlowRequestSampler:
+    """Capture des requetes lentes."""
+
+    def test_fast_request_writes_nothing(self, tmp_path):
+        """Teste qu'une requete sous le seuil ne produit pas de capture.
+
+        Raison: Le cout disque ne concerne que les requetes lentes.
+        """
+        sampler = SlowRequestSampler(str(tmp_path), threshold_ms=1000)
+        token = sampler.start()
+
+        assert sampler.finish(token, 0.010, "GET /x") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_slow_request_writes_cprofile_stats(self, tmp_path):
+        """Teste qu'une requete lente produit un fichier pstats lisible.
+
+        Raison: La capture doit s'analyser apres coup sans redeploiement.
+        """
+        sampler = SlowRequestSampler(str(tmp_path), threshold_ms=5)
+        token = sampler.start()
+        sum(range(1000))
+
+        path = sampler.finish(token, 0.050, "GET /triangulation/<pointSetId>")
+
+        assert path.endswith(".prof")
+        assert "GET_triangulation_pointSetId" in path
+        assert pstats.Stats(path).total_calls > 0
+
+    def test_tracemalloc_mode(self, tmp_path):
+        """Teste le mode tracemalloc -> snapshot rechargeable.
+
+        Raison: Diagnostiquer les requetes lentes a cause de la memoire.
+        """
+        was_tracing = tracemalloc.is_tracing()
+        sampler = SlowRequestSampler(str(tmp_path), threshold_ms=0, mode="tracemalloc")
+        try:
+            path = sampler.finish(sampler.start(), 0.001, "POST /pointset")
+            assert isinstance(tracemalloc.Snapshot.load(path), tracemalloc.Snapshot)
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+    def test_max_files_is_enforced(self, tmp_path):
+        """Teste que seules les max_files captures les plus recentes restent.
+
+        Raison: Ne pas remplir le disque en production.
+        """
+        sampler = SlowRequestSampler(str(tmp_path), threshold_ms=0, max_files=2)
+        for _ in range(4):
+            sampler.finish(sampler.start(), 0.001, "GET /x")
+
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_zero_sample_rate_never_profiles(self, tmp_path):
+        """Teste qu'un taux d'echantillonnage nul n'instrumente rien.
+
+        Raison: Le sampler doit pouvoir tourner a cout quasi nul.
+        """
+        sampler = SlowRequestSampler(str(tmp_path), threshold_ms=0, sample_rate=0.0)
+        assert sampler.start() is None
+
+    def test_unknown_mode_raises(self, tmp_path):
+        """Teste qu'un mode inconnu leve ValueError.
+
+        Raison: Detecter une mauvaise configuration au demarrage.
+        """
+        with pytest.raises(ValueError):
+            SlowRequestSampler(str(tmp_path), mode="perf")
+
+    def test_disabled_without_env(self, monkeypatch):
+        """Teste que le sampler est desactive sans TRIANGULATOR_PROFILE_DIR.
+
+        Raison: Le profilage est opt-in.
+        """
+        monkeypatch.delenv("TRIANGULATOR_PROFILE_DIR", raising=False)
+        assert sampler_from_env() is None
@@ -4,6 +4,7 @@ Tests de serialisation/parsing binaire.
 - Points apres encodage/decodage identiques
 - Triangles apres conversion coherents
 - Donnees binaires invalides -> erreur
+- Format compact (indices etroits, delta, quantification)
 """
 
 import struct
@@ -12,8 +13,13 @@ import pytest
 
 from triangulator_core import (
     compute_triangulation,
+    parse_pointset,
     parse_triangulation,
+    parse_triangulation_compact,
+    serialize_pointset,
     serialize_triangulation,
+    serialize_triangulation_compact,
+    to_compact,
 )
 
 
@@ -103,3 +109,105 @@ class TestSerialization:
 
         with pytest.raises(ValueError):
             parse_triangulation(binary)
+
+    def test_pointset_roundtrip(self):
+        """Teste serialize_pointset puis parse_pointset -> memes points.
+
+        Raison: Le format PointSet est partage par l'API et le stockage.
+        """
+        points = [(0.0, 0.0), (1.5, -2.0), (3.25, 4.0)]
+        assert parse_pointset(serialize_pointset(points)) == points
+
+    def test_pointset_invalid_length(self):
+        """Teste un PointSet dont la longueur ne correspond pas -> ValueError.
+
+        Raison: Refuser un binaire tronque avant stockage.
+        """
+        with pytest.raises(ValueError):
+            parse_pointset(struct.pack("<I", 2) + struct.pack("<ff", 0.0, 0.0))
+
+
+class TestCompactFormat:
+    """Format compact negocie par l'API."""
+
+    @pytest.mark.parametrize("delta", [False, True, None])
+    def test_compact_roundtrip_is_lossless(self, sample_10_points, delta):
+        """Teste que le format compact non quantifie est sans perte.
+
+        Raison: Seule la quantification est autorisee a alterer les donnees.
+        """
+        verts, tris = compute_triangulation(sample_10_points)
+        expected = parse_triangulation(serialize_triangulation(verts, tris))
+
+        binary = serialize_triangulation_compact(verts, tris, delta=delta)
+
+        assert parse_triangulation(binary) == expected
+        assert parse_triangulation_compact(binary) == expected
+
+    def test_indices_are_narrowed(self):
+        """Teste uint16 sous 65536 vertices et uint32 au-dela.
+
+        Raison: La largeur d'indice doit suivre le nombre de vertices.
+        """
+        tris = [(0, 1, 70000), (2, 3, 4)]
+        verts = [(float(i), 0.0) for i in range(70001)]
+        small = serialize_triangulation_compact(verts[:300], [(0, 1, 299)], delta=False)
+        large = serialize_triangulation_compact(verts, tris, delta=False)
+
+        assert small[6] == 2
+        assert large[6] == 4
+        assert parse_triangulation(large)[1] == tris
+
+    def test_delta_shrinks_fan_indices(self):
+        """Teste que l'eventail (0, i, i+1) tient sur 1 octet par indice en delta.
+
+        Raison: Les indices successifs different peu: le delta les retrecit.
+        """
+        verts = [(float(i), float(i * i)) for i in range(1000)]
+        tris = [(0, i, i + 1) for i in range(1, 999)]
+        binary = serialize_triangulation_compact(verts, tris)
+
+        assert binary[6] == 1
+        assert len(binary) == 12 + 1000 * 8 + 4 + 998 * 3
+        assert parse_triangulation(binary)[1] == tris
+
+    def test_quantized_error_is_bounded(self, sample_10_points):
+        """Teste l'erreur de quantification <= etendue / 65535 par axe.
+
+        Raison: La perte de precision doit rester dans la borne annoncee.
+        """
+        verts, tris = compute_triangulation(sample_10_points)
+        standard = serialize_triangulation(verts, tris)
+        binary = to_compact(standard, quantize=True)
+        parsed_verts, parsed_tris = parse_triangulation(binary)
+
+        ref_verts = parse_triangulation(standard)[0]
+        span_x = max(x for x, _ in ref_verts) - min(x for x, _ in ref_verts)
+        span_y = max(y for _, y in ref_verts) - min(y for _, y in ref_verts)
+        assert parsed_tris == tris
+        for (x, y), (qx, qy) in zip(ref_verts, parsed_verts, strict=True):
+            assert abs(x - qx) <= span_x / 65535 + 1e-6
+            assert abs(y - qy) <= span_y / 65535 + 1e-6
+
+    def test_compact_reduces_size(self):
+        """Teste la reduction de taille sur une grande triangulation.
+
+        Raison: Objectif de bande passante du format compact.
+        """
+        verts = [(float(i % 97), float(i // 97)) for i in range(5000)]
+        tris = [(0, i, i + 1) for i in range(1, 4999)]
+        standard = serialize_triangulation(verts, tris)
+
+        assert len(to_compact(standard)) < 0.6 * len(standard)
+        assert len(to_compact(standard, quantize=True)) < 0.4 * len(standard)
+
+    def test_compact_truncated_raises(self):
+        """Teste qu'un binaire compact tronque leve ValueError.
+
+        Raison: Meme robustesse que le format standard.
+        """
+        binary = serialize_triangulation_compact([(0.0, 0.0)] * 3, [(0, 1, 2)])
+        with pytest.raises(ValueError):
+            parse_triangulation(binary[:-1])
+        with pytest.raises(ValueError):
+            parse_triangulation_compact(binary[:8])
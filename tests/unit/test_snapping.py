@@ -0,0 +1,164 @@
+"""Tests unitaires - Fusion des quasi-doublons (snap_points, SECTION_VERTEX_MAP).
+
+- Points a moins de la tolerance fusionnes, correspondance entree -> vertex
+- Tolerance nulle: doublons exacts seulement (comme la deduplication)
+- Section de correspondance: aller-retour et contenu invalide
+"""
+
+import math
+import random
+
+import pytest
+
+from triangulator_core import (
+    MIN_SNAP_TOLERANCE,
+    SECTION_VERTEX_MAP,
+    SnapToleranceError,
+    compute_triangulation,
+    parse_sections,
+    parse_vertex_map,
+    serialize_triangulation,
+    snap_points,
+    vertex_map_section,
+)
+
+
+class TestSnapPoints:
+    """Fusion par grille de hachage."""
+
+    def test_near_duplicates_are_merged(self):
+        """Teste la fusion de points a moins de la tolerance.
+
+        Raison: Les capteurs float32 produisent des quasi-doublons.
+        """
+        points = [(0.0, 0.0), (1.0, 0.0), (1e-4, -1e-4), (0.0, 1.0), (1.00005, 0.0)]
+        vertices, mapping = snap_points(points, tolerance=1e-3)
+
+        assert vertices == [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+        assert list(mapping) == [0, 1, 0, 2, 1]
+
+    def test_every_point_within_tolerance_of_its_vertex(self):
+        """Teste l'invariant de la fusion sur un nuage aleatoire dense.
+
+        Raison: Aucun point ne doit etre deplace de plus de la tolerance, et
+        deux vertices conserves restent separes de plus de la tolerance.
+        """
+        rng = random.Random(3)
+        points = [(rng.uniform(0, 1), rng.uniform(0, 1)) for _ in range(3000)]
+        tolerance = 0.02
+        vertices, mapping = snap_points(points, tolerance)
+
+        assert len(mapping) == len(points)
+        for (x, y), v in zip(points, mapping, strict=True):
+            assert math.dist((x, y), vertices[v]) <= tolerance
+        cells = {}
+        for i, (x, y) in enumerate(vertices):
+            cells.setdefault((int(x / tolerance), int(y / tolerance)), []).append(i)
+        for (cx, cy), members in cells.items():
+            for i in members:
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        for j in cells.get((cx + dx, cy + dy), ()):
+                            if i < j:
+                                assert math.dist(vertices[i], vertices[j]) > tolerance
+
+    def test_nearest_vertex_wins(self):
+        """Teste qu'un point rejoint le vertex le plus proche.
+
+        Raison: Fusion deterministe et independante de la grille.
+        """
+        points = [(0.0, 0.0), (0.15, 0.0), (0.1, 0.0)]
+        vertices, mapping = snap_points(points, tolerance=0.1)
+
+        assert len(vertices) == 2
+        assert list(mapping) == [0, 1, 1]
+
+    def test_zero_tolerance_merges_exact_duplicates_only(self, duplicate_points):
+        """Teste tolerance 0 -> meme resultat que la deduplication exacte.
+
+        Raison: Sans fusion, le comportement historique est conserve.
+        """
+        points = [(p["x"], p["y"]) for p in duplicate_points]
+        vertices, mapping = snap_points(points + [(0.0, 1e-300)])
+        fan_vertices, _ = compute_triangulation(points + [(0.0, 1e-300)])
+
+        assert vertices == fan_vertices
+        assert list(mapping) == [0, 1, 2, 1, 3]
+
+    @pytest.mark.parametrize("tolerance", [-1.0, math.inf, math.nan, 1e-310])
+    def test_invalid_tolerance_raises(self, tolerance):
+        """Teste le refus d'une tolerance negative, non finie ou sous-normale.
+
+        Raison: La tolerance vient de la requete HTTP.
+        """
+        with pytest.raises(ValueError):
+            snap_points([(0.0, 0.0)], tolerance)
+
+    def test_smallest_tolerance_is_usable(self):
+        """Teste MIN_SNAP_TOLERANCE sur les coordonnees float32 extremes.
+
+        Raison: Aucun indice de grille infini pour une tolerance acceptee.
+        """
+        big = 3.4028234663852886e38
+        points = [(big, -big), (-big, big), (0.0, 0.0), (big, -big)]
+
+        vertices, mapping = snap_points(points, MIN_SNAP_TOLERANCE)
+
+        assert len(vertices) == 3
+        assert list(mapping) == [0, 1, 2, 0]
+
+    def test_too_coarse_tolerance_raises(self):
+        """Teste une fusion qui laisse moins de vertices que requis.
+
+        Raison: Distinguer l'erreur du client d'un PointSet invalide.
+        """
+        points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+        assert len(snap_points(points, 10.0)[0]) == 1
+        with pytest.raises(SnapToleranceError, match="trop grande"):
+            snap_points(points, 10.0, min_vertices=3)
+        with pytest.raises(SnapToleranceError):
+            compute_triangulation(points, tolerance=10.0)
+
+        # PointSet deja trop petit: erreur ordinaire, pas due a la tolerance
+        with pytest.raises(ValueError) as raised:
+            compute_triangulation(points[:2] * 2, tolerance=10.0)
+        assert not isinstance(raised.value, SnapToleranceError)
+
+    def test_compute_triangulation_with_tolerance(self):
+        """Teste que la tolerance evite un triangle aiguille.
+
+        Raison: Un quasi-doublon cree des triangles degeneres.
+        """
+        points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1e-7, 1e-7)]
+        plain, _ = compute_triangulation(points, algorithm="sweep")
+        snapped, tris = compute_triangulation(points, "sweep", tolerance=1e-6)
+
+        assert len(plain) == 4
+        assert snapped == [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+        assert len(tris) == 1
+
+
+class TestVertexMapSection:
+    """Section SECTION_VERTEX_MAP apres les triangles."""
+
+    def test_round_trip(self):
+        """Teste section -> parse_sections -> parse_vertex_map.
+
+        Raison: Le client relit la correspondance depuis le binaire.
+        """
+        vertices, mapping = snap_points(
+            [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (0.0, 1.0)]
+        )
+        binary = serialize_triangulation(vertices, [(0, 1, 2)])
+        binary += vertex_map_section(mapping)
+
+        payload = parse_sections(binary)[SECTION_VERTEX_MAP]
+        assert list(parse_vertex_map(payload)) == [0, 1, 2, 2]
+
+    def test_invalid_payload_raises(self):
+        """Teste qu'un contenu de longueur incoherente est refuse.
+
+        Raison: Detecter un binaire corrompu.
+        """
+        with pytest.raises(ValueError):
+            parse_vertex_map(b"\x02\x00\x00\x00\x00\x00\x00\x00")
@@ -0,0 +1,238 @@
+"""Tests unitaires - Snapshot des stores en memoire (snapshot).
+
+- Ecriture puis relecture via mmap, binaires inchanges
+- Volume borne: les entrees les plus recentes sont conservees
+- Snapshot invalide ignore, store complete par le snapshot
+"""
+
+import os
+import struct
+import time
+
+import pytest
+
+from pointset_store import MemoryStore, ShardedMemoryStore
+from snapshot import (
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_VERSION,
+    Snapshot,
+    SnapshotStore,
+    SnapshotWriter,
+    load_snapshot,
+    write_snapshot,
+)
+from triangulator_core import serialize_pointset
+
+POINTSET = serialize_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+
+@pytest.fixture(params=[MemoryStore, ShardedMemoryStore])
+def store(request):
+    """Store en memoire de chaque implementation, avec deux entrees."""
+    store = request.param()
+    store.put_pointset("p1", POINTSET)
+    store.put_result("p1.compact", b"result")
+    return store
+
+
+class TestWriteAndLoad:
+    """Aller-retour fichier."""
+
+    def test_round_trip(self, store, tmp_path):
+        """Teste que PointSets et resultats sont relus a l'identique.
+
+        Raison: Un worker redemarre sert les memes binaires.
+        """
+        path = str(tmp_path / "store.snap")
+
+        assert write_snapshot(store.items(), path) == 2
+
+        snapshot = Snapshot(path)
+        assert bytes(snapshot.get("pointset", "p1")) == POINTSET
+        assert bytes(snapshot.get("result", "p1.compact")) == b"result"
+        assert snapshot.get("pointset", "unknown") is None
+        assert len(snapshot) == 2
+
+    def test_entries_are_views_on_the_mapping(self, store, tmp_path):
+        """Teste que les binaires sont des vues sur le mmap (pas de copie).
+
+        Raison: La restauration ne lit que l'index.
+        """
+        path = str(tmp_path / "store.snap")
+        write_snapshot(store.items(), path)
+
+        assert isinstance(Snapshot(path).get("pointset", "p1"), memoryview)
+
+    def test_max_bytes_keeps_most_recent(self, tmp_path):
+        """Teste que le budget omet les entrees les plus anciennes.
+
+        Raison: Le snapshot ne doit pas grossir sans limite.
+        """
+        path = str(tmp_path / "store.snap")
+        items = [("result", f"r{i}", b"x" * 10, None) for i in range(5)]
+
+        assert write_snapshot(items, path, max_bytes=25) == 2
+
+        snapshot = Snapshot(path)
+        assert ("result", "r4") in snapshot and ("result", "r3") in snapshot
+        assert ("result", "r2") not in snapshot
+
+    def test_items_do_not_touch_lru(self, tmp_path):
+        """Teste que items() ne rafraichit pas l'ordre LRU.
+
+        Raison: Un snapshot periodique ne doit pas fausser l'eviction.
+        """
+        store = MemoryStore(max_bytes=25)
+        store.put_result("old", b"x" * 10)
+        store.put_result("new", b"x" * 10)
+        store.items()
+        store.put_result("newest", b"x" * 10)
+
+        assert store.get_result("old") is None
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b"NOPE" + b"\0" * 12,
+            # 5 entrees annoncees, index vide
+            SNAPSHOT_MAGIC + b"\x01\0\0\0\x05\0\0\0\0\0\0\0",
+        ],
+        ids=["empty", "bad_magic", "truncated_index"],
+    )
+    def test_invalid_snapshot_is_ignored(self, tmp_path, content):
+        """Teste qu'un fichier invalide n'empeche pas le demarrage.
+
+        Raison: Un snapshot corrompu ne doit pas bloquer un deploiement.
+        """
+        path = tmp_path / "store.snap"
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError):
+            Snapshot(str(path))
+        assert load_snapshot(str(path)) is None
+        assert load_snapshot(str(tmp_path / "missing.snap")) is None
+
+
+class TestSnapshotStore:
+    """Store en memoire complete par un snapshot."""
+
+    def test_reads_fall_back_to_snapshot(self, store, tmp_path):
+        """Teste qu'une entree absente du store est lue dans le snapshot.
+
+        Raison: Resultats chauds disponibles des le redemarrage.
+        """
+        path = str(tmp_path / "store.snap")
+        write_snapshot(store.items(), path)
+        restored = SnapshotStore(MemoryStore(), Snapshot(path))
+
+        assert "p1" in restored
+        assert bytes(restored.get_pointset("p1")) == POINTSET
+        assert bytes(restored.get_result("p1.compact")) == b"result"
+        assert len(restored) == 1
+
+    def test_new_entries_shadow_snapshot(self, store, tmp_path):
+        """Teste qu'une ecriture recente masque l'entree du snapshot.
+
+        Raison: Le snapshot suivant doit contenir la valeur la plus recente.
+        """
+        path = str(tmp_path / "store.snap")
+        write_snapshot(store.items(), path)
+        restored = SnapshotStore(MemoryStore(), Snapshot(path))
+        restored.put_result("p1.compact", b"fresh")
+
+        assert restored.get_result("p1.compact") == b"fresh"
+        items = {(kind, key): bytes(data) for kind, key, data, _ in restored.items()}
+        assert items[("result", "p1.compact")] == b"fresh"
+        assert items[("pointset", "p1")] == POINTSET
+
+    def test_writer_rewrites_restored_entries(self, store, tmp_path):
+        """Teste qu'un snapshot ecrit depuis un store restaure garde tout.
+
+        Raison: Les entrees restaurees survivent aux redemarrages successifs.
+        """
+        path = str(tmp_path / "store.snap")
+        write_snapshot(store.items(), path)
+        restored = SnapshotStore(MemoryStore(), Snapshot(path))
+        restored.put_pointset("p2", POINTSET)
+
+        writer = SnapshotWriter(lambda: restored, path, interval=0)
+        writer.start()
+        writer.stop()
+
+        snapshot = Snapshot(path)
+        assert ("pointset", "p1") in snapshot and ("pointset", "p2") in snapshot
+
+
+class TestSnapshotExpiry:
+    """Duree de vie des entrees restaurees."""
+
+    def test_expired_entries_are_not_restored(self, tmp_path):
+        """Teste un redemarrage apres la duree de vie des entrees.
+
+        Raison: Un ID expire donne 404, meme apres un deploiement.
+        """
+        path = str(tmp_path / "store.snap")
+        store = MemoryStore(ttl_seconds=10)
+        store.put_pointset("a", POINTSET)
+        write_snapshot(store.items(), path)
+
+        later = Snapshot(path, clock=lambda: time.time() + 3600)
+        restored = SnapshotStore(MemoryStore(ttl_seconds=10), later)
+
+        assert restored.get_pointset("a") is None
+        assert "a" not in restored and len(restored) == 0
+        assert restored.items() == []
+        writer = SnapshotWriter(lambda: restored, path, interval=0)
+        assert writer.write() == 0
+
+    def test_remaining_lifetime_is_kept(self, tmp_path):
+        """Teste que la duree de vie restante continue apres restauration.
+
+        Raison: Un redemarrage ne prolonge pas la vie d'une entree.
+        """
+        path = str(tmp_path / "store.snap")
+        store = MemoryStore(ttl_seconds=60)
+        store.put_result("r", b"result")
+        write_snapshot(store.items(), path)
+
+        snapshot = Snapshot(path, clock=lambda: time.time() + 30)
+        assert bytes(snapshot.get("result", "r")) == b"result"
+        (_, _, _, expires_in), = snapshot.items()
+        assert 25 < expires_in <= 30
+        write_snapshot(snapshot.items(), path)
+
+        rewritten = Snapshot(path, clock=lambda: time.time() + 31)
+        assert ("result", "r") not in rewritten
+        assert rewritten.get("result", "r") is None
+
+    def test_entries_without_lifetime_take_store_ttl(self, tmp_path):
+        """Teste la duree de vie du store appliquee depuis la date du snapshot.
+
+        Raison: Une duree de vie configuree apres coup s'applique aussi.
+        """
+        path = str(tmp_path / "store.snap")
+        write_snapshot([("pointset", "a", POINTSET, None)], path)
+
+        assert ("pointset", "a") in Snapshot(path, clock=lambda: time.time() + 1e6)
+        later = Snapshot(path, ttl_seconds=10, clock=lambda: time.time() + 11)
+        assert ("pointset", "a") not in later
+
+    def test_version_1_snapshot_is_readable(self, tmp_path):
+        """Teste la relecture d'un snapshot sans dates (version 1).
+
+        Raison: Le premier deploiement garde les snapshots existants.
+        """
+        path = tmp_path / "store.snap"
+        key = b"a"
+        index = struct.pack("<BH", 0, len(key)) + key
+        index += struct.pack("<QQ", 16, len(POINTSET))
+        path.write_bytes(
+            struct.pack("<4sBxxxII", SNAPSHOT_MAGIC, 1, 1, len(index))
+            + POINTSET + index
+        )
+        os.utime(path, (time.time() - 100, time.time() - 100))
+
+        assert SNAPSHOT_VERSION == 2
+        assert bytes(Snapshot(str(path)).get("pointset", "a")) == POINTSET
+        assert Snapshot(str(path), ttl_seconds=10).get("pointset", "a") is None
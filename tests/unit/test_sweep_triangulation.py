@@ -0,0 +1,248 @@
+"""Tests unitaires - Triangulation par balayage (algorithm="sweep") et "auto".
+
+Validite verifiee en arithmetique exacte (fractions) pour tout ordre:
+- triangles non degeneres et orientes dans le sens direct (CCW)
+- chaque arete interieure partagee par exactement deux triangles
+- aire totale egale a celle de l'enveloppe convexe (pas de chevauchement)
+- tous les vertices utilises
+"""
+
+import math
+import random
+import struct
+from collections import Counter
+from fractions import Fraction
+
+import pytest
+
+import triangulator_core
+from triangulator_core import ALGORITHMS, choose_algorithm, compute_triangulation
+
+
+def _orient(a, b, c) -> Fraction:
+    """Double de l'aire signee de (a, b, c), exacte."""
+    (ax, ay), (bx, by), (cx, cy) = (tuple(map(Fraction, p)) for p in (a, b, c))
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def _hull_area2(points) -> Fraction:
+    """Double de l'aire de l'enveloppe convexe (chaine monotone, exacte)."""
+    pts = sorted(set(points))
+
+    def chain(seq):
+        out = []
+        for p in seq:
+            while len(out) >= 2 and _orient(out[-2], out[-1], p) <= 0:
+                out.pop()
+            out.append(p)
+        return out[:-1]
+
+    hull = chain(pts) + chain(reversed(pts))
+    return sum(
+        (_orient(hull[0], hull[i], hull[i + 1]) for i in range(1, len(hull) - 1)),
+        Fraction(0),
+    )
+
+
+def _problems(verts, tris) -> list[str]:
+    """Lister les defauts de validite d'une triangulation (vide si valide)."""
+    problems = []
+    area2 = Fraction(0)
+    for a, b, c in tris:
+        o = _orient(verts[a], verts[b], verts[c])
+        if o <= 0:
+            problems.append(f"triangle {(a, b, c)} non CCW ou plat")
+        area2 += o
+    directed = Counter(
+        edge for a, b, c in tris for edge in ((a, b), (b, c), (c, a))
+    )
+    if any(count > 1 for count in directed.values()):
+        problems.append("arete orientee utilisee deux fois (chevauchement)")
+    if area2 != _hull_area2(verts):
+        problems.append("aire differente de celle de l'enveloppe convexe")
+    if {i for tri in tris for i in tri} != set(range(len(verts))):
+        problems.append("vertex non utilise")
+    return problems
+
+
+def _random_points(n: int, seed: int) -> list[tuple[float, float]]:
+    """Points aleatoires arrondis en float32 (comme le format PointSet)."""
+    rng = random.Random(seed)
+    coords = [rng.uniform(-100.0, 100.0) for _ in range(2 * n)]
+    values = struct.unpack(f"<{2 * n}f", struct.pack(f"<{2 * n}f", *coords))
+    return list(zip(values[0::2], values[1::2], strict=True))
+
+
+class TestSweepTriangulation:
+    """Triangulation valide quel que soit l'ordre des points."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_points_any_order(self, seed):
+        """Teste des nuages aleatoires dans un ordre quelconque.
+
+        Raison: L'eventail depuis le premier point n'est pas valide ici.
+        """
+        points = _random_points(300, seed)
+        verts, tris = compute_triangulation(points, algorithm="sweep")
+
+        assert _problems(verts, tris) == []
+
+    def test_fan_is_invalid_for_arbitrary_order(self):
+        """Teste que le validateur rejette l'eventail sur un ordre quelconque.
+
+        Raison: S'assurer que les verifications detectent un chevauchement.
+        """
+        verts, tris = compute_triangulation(_random_points(50, 0), algorithm="fan")
+        assert _problems(verts, tris) != []
+
+    def test_grid_with_collinear_points(self):
+        """Teste une grille reguliere (alignements et points cocycliques).
+
+        Raison: Aucun triangle plat ni sommet au milieu d'une arete.
+        """
+        points = [(float(x), float(y)) for x in range(12) for y in range(9)]
+        random.Random(1).shuffle(points)
+        verts, tris = compute_triangulation(points, algorithm="sweep")
+
+        assert _problems(verts, tris) == []
+        # Euler: 2n - h - 2 triangles, h points sur le bord (38 ici)
+        assert len(tris) == 2 * len(verts) - 38 - 2
+
+    def test_convex_position(self):
+        """Teste des points tous sur l'enveloppe (cercle, ordre melange).
+
+        Raison: Cas ou chaque point appartient au bord.
+        """
+        points = [
+            (math.cos(2 * math.pi * k / 40), math.sin(2 * math.pi * k / 40))
+            for k in range(40)
+        ]
+        random.Random(2).shuffle(points)
+        verts, tris = compute_triangulation(points, algorithm="sweep")
+
+        assert _problems(verts, tris) == []
+        assert len(tris) == len(verts) - 2
+
+    def test_vertical_columns_and_duplicates(self):
+        """Teste des points de meme abscisse et des doublons.
+
+        Raison: Le tri (x, y) doit departager les abscisses egales.
+        """
+        points = [(0.0, 0.0), (0.0, 1.0), (0.0, 2.0), (1.0, 0.5), (0.0, 1.0)]
+        points += [(2.0, float(y)) for y in range(4)]
+        verts, tris = compute_triangulation(points, algorithm="sweep")
+
+        assert len(verts) == 8
+        assert _problems(verts, tris) == []
+
+    def test_vertices_keep_input_order(self, sample_10_points):
+        """Teste que les vertices sont ceux de l'eventail (ordre d'entree).
+
+        Raison: Seuls les triangles dependent de l'algorithme.
+        """
+        fan_verts, _ = compute_triangulation(sample_10_points)
+        verts, tris = compute_triangulation(sample_10_points, algorithm="sweep")
+
+        assert verts == fan_verts
+        assert _problems(verts, tris) == []
+
+    def test_collinear_points_give_no_triangle(self, collinear_points):
+        """Teste le cas colineaire -> 0 triangle, comme l'eventail.
+
+        Raison: Meme contrat pour les cas degeneres.
+        """
+        _, tris = compute_triangulation(collinear_points, algorithm="sweep")
+        assert tris == []
+
+    def test_unknown_algorithm_raises(self, sample_3_points):
+        """Teste qu'un algorithme inconnu leve ValueError.
+
+        Raison: Le parametre vient de la requete HTTP.
+        """
+        assert "sweep" in ALGORITHMS
+        with pytest.raises(ValueError, match="Algorithme"):
+            compute_triangulation(sample_3_points, algorithm="delaunay")
+
+
+class TestAutoAlgorithm:
+    """Choix du moteur selon la forme des points (mode "auto")."""
+
+    @staticmethod
+    def _circle(n: int) -> list[tuple[float, float]]:
+        """Points d'un cercle (n), dans l'ordre direct."""
+        return [
+            (math.cos(2 * math.pi * k / n), math.sin(2 * math.pi * k / n))
+            for k in range(n)
+        ]
+
+    def test_convex_polygon_in_order_uses_fan(self):
+        """Teste qu'un polygone convexe ordonne est triangule en eventail.
+
+        Raison: L'eventail est valide dans ce cas, et le moins couteux.
+        """
+        points = self._circle(60)
+        assert choose_algorithm(points) == "fan"
+        assert choose_algorithm(points[::-1]) == "fan"
+
+        verts, tris = compute_triangulation(points, algorithm="auto")
+        assert tris == compute_triangulation(points, algorithm="fan")[1]
+        assert _problems(verts, tris) == []
+
+    def test_clockwise_polygon_gives_ccw_triangles(self):
+        """Teste qu'un polygone en sens indirect donne des triangles CCW.
+
+        Raison: Le mode auto a la meme orientation quel que soit le moteur.
+        """
+        verts, tris = compute_triangulation(self._circle(30)[::-1], "auto")
+        assert _problems(verts, tris) == []
+
+    def test_orientation_is_computed_once(self, monkeypatch):
+        """Teste que le mode auto ne parcourt le polygone qu'une fois.
+
+        Raison: Le sens trouve par la selection sert a orienter l'eventail.
+        """
+        calls = []
+        convex_order = triangulator_core._convex_order
+
+        def counting(points):
+            calls.append(len(points))
+            return convex_order(points)
+
+        monkeypatch.setattr(triangulator_core, "_convex_order", counting)
+        verts, tris = compute_triangulation(self._circle(30)[::-1], "auto")
+
+        assert calls == [30]
+        assert _problems(verts, tris) == []
+
+    @pytest.mark.parametrize(
+        "points",
+        [
+            _random_points(200, 9),
+            # Pentagramme: virages de meme signe, mais deux tours
+            [
+                (math.cos(4 * math.pi * k / 5), math.sin(4 * math.pi * k / 5))
+                for k in range(5)
+            ],
+            # Polygone convexe avec un point aligne sur un cote
+            [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)],
+        ],
+        ids=["random", "pentagram", "collinear-side"],
+    )
+    def test_other_shapes_use_sweep(self, points):
+        """Teste qu'un nuage quelconque passe par le balayage, valide.
+
+        Raison: L'eventail y produirait des chevauchements.
+        """
+        assert choose_algorithm(points) == "sweep"
+        verts, tris = compute_triangulation(points, algorithm="auto")
+        assert _problems(verts, tris) == []
+
+    def test_single_triangle(self):
+        """Teste le cas minimal (3 points) en sens indirect.
+
+        Raison: Pas de tri pour un seul triangle, orientation corrigee.
+        """
+        verts, tris = compute_triangulation(
+            [(0.0, 0.0), (0.0, 1.0), (1.0, 0.0)], algorithm="auto"
+        )
+        assert _problems(verts, tris) == []
@@ -0,0 +1,129 @@
+"""Tests unitaires - Delta entre deux triangulations.
+
+- Reconstruction exacte de la cible (ajouts, suppressions, tout change)
+- Taille du delta proportionnelle a la modification
+- Refus d'une autre base ou d'un delta corrompu
+"""
+
+import random
+
+import pytest
+
+from triangulator_core import (
+    DELTA_MAGIC,
+    apply_triangulation_delta,
+    compute_triangulation,
+    parse_triangulation,
+    serialize_triangulation,
+    to_compact,
+    triangulation_delta,
+)
+
+
+def _binary(points):
+    """Binaire Triangles standard d'une liste de points."""
+    return serialize_triangulation(*compute_triangulation(points))
+
+
+def _points(n, seed=0):
+    """N points aleatoires reproductibles."""
+    rng = random.Random(seed)
+    return [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)]
+
+
+class TestDeltaRoundTrip:
+    """apply(base, delta(base, cible)) == cible."""
+
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            lambda p: p,
+            lambda p: p[:20] + [(50.5, 50.5)] + p[20:],
+            lambda p: p[:10] + p[11:],
+            lambda p: p[5:] + [(1.5, 2.5), (3.5, 4.5)],
+            lambda p: _points(30, seed=9),
+        ],
+        ids=["identical", "insert", "remove", "shift_and_append", "unrelated"],
+    )
+    def test_apply_rebuilds_target(self, edit):
+        """Teste la reconstruction exacte pour differentes modifications.
+
+        Raison: Le client doit obtenir exactement la triangulation cible.
+        """
+        points = _points(40)
+        base, target = _binary(points), _binary(edit(points))
+
+        delta = triangulation_delta(base, target)
+
+        assert delta[:4] == DELTA_MAGIC
+        assert apply_triangulation_delta(base, delta) == parse_triangulation(target)
+
+    def test_apply_on_compact_base(self):
+        """Teste l'application sur une base detenue au format compact.
+
+        Raison: Le format compact conserve l'ordre des vertices et triangles.
+        """
+        points = _points(40)
+        base, target = _binary(points), _binary(points[:-1])
+
+        delta = triangulation_delta(base, target)
+
+        rebuilt = apply_triangulation_delta(to_compact(base), delta)
+        assert rebuilt == parse_triangulation(target)
+
+    def test_collinear_target_without_triangles(self):
+        """Teste une cible sans triangle (points colineaires).
+
+        Raison: Les cas degeneres restent representables.
+        """
+        base = _binary([(0, 0), (1, 0), (0, 1)])
+        target = _binary([(0, 0), (1, 0), (2, 0)])
+
+        delta = triangulation_delta(base, target)
+
+        assert apply_triangulation_delta(base, delta) == parse_triangulation(target)
+
+
+class TestDeltaSize:
+    """Taille du delta."""
+
+    def test_small_edit_gives_tiny_delta(self):
+        """Teste qu'un point insere dans 10000 donne un delta < 1 Ko.
+
+        Raison: Objectif de bande passante des editions iteratives.
+        """
+        points = _points(10_000)
+        base = _binary(points)
+        target = _binary(points[:5000] + [(50.5, 50.5)] + points[5000:])
+
+        delta = triangulation_delta(base, target)
+
+        assert len(delta) < 1024 < len(target) // 100
+
+
+class TestDeltaErrors:
+    """Deltas refuses."""
+
+    def test_other_base_raises(self):
+        """Teste qu'un delta applique a une autre base leve ValueError.
+
+        Raison: Ne jamais reconstruire silencieusement un resultat faux.
+        """
+        points = _points(40)
+        delta = triangulation_delta(_binary(points), _binary(points[1:]))
+
+        with pytest.raises(ValueError):
+            apply_triangulation_delta(_binary(points[:30]), delta)
+
+    @pytest.mark.parametrize("cut", [3, 20, -1])
+    def test_truncated_delta_raises(self, cut):
+        """Teste qu'un delta tronque leve ValueError.
+
+        Raison: Detecter un transfert incomplet.
+        """
+        points = _points(40)
+        base = _binary(points)
+        delta = triangulation_delta(base, _binary(points[:20] + [(7.5, 7.5)]))
+
+        with pytest.raises(ValueError):
+            apply_triangulation_delta(base, delta[:cut])
@@ -0,0 +1,144 @@
+"""Tests unitaires - Outils statistiques du benchmark (triangulator_bench).
+
+- Ajustement de l'exposant de complexite
+- Test de Mann-Whitney
+- Detection des regressions et reference locale
+"""
+
+import gc
+import json
+
+import pytest
+
+import triangulator_bench as bench
+
+
+def _result(sizes, samples):
+    """Construire un resultat au format run_suite."""
+    medians = [sorted(s)[len(s) // 2] for s in samples]
+    return {
+        "sizes": sizes,
+        "samples": samples,
+        "median": medians,
+        "exponent": bench.fit_exponent(sizes, medians),
+    }
+
+
+class TestBenchTools:
+    """Statistiques du benchmark."""
+
+    def test_fit_exponent_linear_and_quadratic(self):
+        """Teste l'exposant ajuste sur des series n et n^2.
+
+        Raison: L'exposant distingue O(n) de O(n^2).
+        """
+        sizes = [1_000, 10_000, 100_000]
+        linear = [n * 1e-6 for n in sizes]
+        quadratic = [n * n * 1e-9 for n in sizes]
+        assert bench.fit_exponent(sizes, linear) == pytest.approx(1.0)
+        assert bench.fit_exponent(sizes, quadratic) == pytest.approx(2.0)
+
+    def test_fit_exponent_needs_two_sizes(self):
+        """Teste qu'une seule taille leve ValueError.
+
+        Raison: Une pente demande au moins deux points.
+        """
+        with pytest.raises(ValueError):
+            bench.fit_exponent([1000], [0.1])
+
+    def test_mann_whitney_separated_and_identical(self):
+        """Teste la p-valeur pour des echantillons separes puis identiques.
+
+        Raison: Ne signaler que les differences significatives.
+        """
+        slow = [2.0, 2.1, 2.2, 2.3, 2.4]
+        fast = [1.0, 1.1, 1.2, 1.3, 1.4]
+        assert bench.mann_whitney_p(slow, fast) < 0.01
+        assert bench.mann_whitney_p(fast, fast) > 0.4
+
+    def test_find_regressions(self):
+        """Teste la detection d'un ralentissement et d'un exposant excessif.
+
+        Raison: Le suite doit echouer sur une regression reelle seulement.
+        """
+        sizes = [1_000, 10_000]
+        base = {"serialize": _result(sizes, [[1.0, 1.1, 1.0, 1.05, 0.95]] * 2)}
+        same = {"serialize": _result(sizes, [[1.0, 1.02, 0.98, 1.05, 1.0]] * 2)}
+        slow = {"serialize": _result(sizes, [[2.0, 2.1, 2.0, 2.05, 1.95]] * 2)}
+        quad = {"serialize": _result(sizes, [[0.01] * 5, [1.0] * 5])}
+        # Une seule taille ralentie: bruit de la machine, pas une regression
+        noisy = {
+            "serialize": _result(
+                sizes, [[3.0, 3.1, 3.0, 3.05, 2.95], [1.0, 1.02, 0.98, 1.05, 1.0]]
+            )
+        }
+
+        assert bench.find_regressions(same, base) == []
+        assert bench.find_regressions(noisy, base) == []
+        assert len(bench.find_regressions(slow, base)) == 1
+        assert "exposant" in bench.find_regressions(quad)[0]
+
+    def test_baseline_is_machine_local(self, tmp_path, monkeypatch):
+        """Teste qu'une reference d'une autre machine est ignoree.
+
+        Raison: Les durees ne sont comparables que sur la meme machine.
+        """
+        path = str(tmp_path / "baseline.json")
+        results = {"parse": _result([10, 100], [[1.0], [10.0]])}
+        bench.save_baseline(results, path)
+        assert bench.load_baseline(path) == results
+
+        monkeypatch.setattr(bench, "machine_id", lambda: {"node": "other"})
+        assert bench.load_baseline(path) is None
+
+    def test_baseline_from_other_format_is_missing(self, tmp_path):
+        """Teste qu'une reference d'une autre version ou d'autres etapes est ignoree.
+
+        Raison: Elle doit etre enregistree a nouveau, pas comparee.
+        """
+        path = tmp_path / "baseline.json"
+        results = {"parse": _result([10, 100], [[1.0], [10.0]])}
+        bench.save_baseline(results, str(path))
+        data = json.loads(path.read_text())
+
+        for field, value in (
+            ("version", bench.BASELINE_VERSION - 1),
+            ("stages", ["compute", "serialize", "parse"]),
+        ):
+            path.write_text(json.dumps({**data, field: value}))
+            assert bench.load_baseline(str(path)) is None
+        del data["version"]
+        path.write_text(json.dumps(data))
+        assert bench.load_baseline(str(path)) is None
+        path.write_text("{")
+        assert bench.load_baseline(str(path)) is None
+
+    def test_baseline_without_sweep_and_batch_is_missing(self, tmp_path):
+        """Teste qu'une reference anterieure aux etapes sweep et batch est ignoree.
+
+        Raison: Ces etapes n'y sont pas mesurees, la reference est a refaire.
+        """
+        path = tmp_path / "baseline.json"
+        results = {"parse": _result([10, 100], [[1.0], [10.0]])}
+        path.write_text(json.dumps({"machine": bench.machine_id(), "results": results}))
+
+        assert bench.load_baseline(str(path)) is None
+
+    def test_measure_warms_up_and_batches_short_calls(self, monkeypatch):
+        """Teste la chauffe, le regroupement des appels courts et le GC coupe.
+
+        Raison: Un appel de moins d'une milliseconde est domine par le bruit.
+        """
+        calls = []
+
+        def runner(stage, n):
+            return lambda: calls.append(gc.isenabled())
+
+        monkeypatch.setattr(bench, "_stage_runner", runner)
+        monkeypatch.setattr(bench, "MIN_SAMPLE_SECONDS", 0.001)
+        samples = bench.measure("parse", 10, repeats=3)
+
+        assert len(samples) == 3
+        assert len(calls) > 1 + 3
+        assert not any(calls)
+        assert gc.isenabled()
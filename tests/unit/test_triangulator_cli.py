@@ -0,0 +1,81 @@
+"""Tests unitaires - Triangulation en lot (triangulator_cli).
+
+- Resolution des entrees (fichiers, repertoires, globs)
+- Fichiers Triangles produits et erreurs remontees
+- Aucun import de Flask
+"""
+
+import os
+import subprocess
+import sys
+
+from triangulator_cli import expand_inputs, main
+from triangulator_core import parse_triangulation, serialize_pointset
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TRIANGLE = [(0.0, 0.0), (1.0, 0.0), (0.5, 1.0)]
+
+
+class TestTriangulatorCli:
+    """Ligne de commande de triangulation en lot."""
+
+    def test_expand_inputs_directory_and_glob(self, tmp_path):
+        """Teste la resolution d'un repertoire et d'un glob sans doublon.
+
+        Raison: Les jobs batch passent des repertoires ou des motifs.
+        """
+        for name in ("a.bin", "b.bin", "c.txt"):
+            (tmp_path / name).write_bytes(b"")
+
+        files = expand_inputs([str(tmp_path), str(tmp_path / "a*.bin")])
+
+        assert [os.path.basename(f) for f in files] == ["a.bin", "b.bin"]
+
+    def test_main_writes_triangles_files(self, tmp_path, capsys):
+        """Teste que chaque PointSet produit un fichier Triangles parsable.
+
+        Raison: Verifier le chemin complet sans passer par l'API.
+        """
+        src = tmp_path / "in"
+        src.mkdir()
+        (src / "one.bin").write_bytes(serialize_pointset(TRIANGLE))
+        (src / "two.bin").write_bytes(serialize_pointset(TRIANGLE + [(2.0, 2.0)]))
+        out = tmp_path / "out"
+
+        code = main([str(src), "-o", str(out), "-j", "2"])
+
+        assert code == 0
+        verts, tris = parse_triangulation((out / "two.triangles.bin").read_bytes())
+        assert (len(verts), len(tris)) == (4, 2)
+        assert "2/2 fichiers" in capsys.readouterr().out
+
+    def test_main_reports_invalid_file(self, tmp_path, capsys):
+        """Teste qu'un fichier invalide est signale et donne un code 1.
+
+        Raison: Un lot ne doit pas echouer silencieusement.
+        """
+        (tmp_path / "bad.bin").write_bytes(b"\x01")
+
+        code = main([str(tmp_path / "bad.bin"), "-o", str(tmp_path / "out")])
+
+        assert code == 1
+        assert "ECHEC" in capsys.readouterr().err
+
+    def test_no_input_returns_2(self, tmp_path):
+        """Teste une entree sans fichier -> code 2.
+
+        Raison: Distinguer "rien a faire" d'un echec de triangulation.
+        """
+        assert main([str(tmp_path / "none*.bin"), "-o", str(tmp_path)]) == 2
+
+    def test_does_not_import_flask(self):
+        """Teste que le module CLI n'importe pas Flask.
+
+        Raison: Eviter le cout de demarrage de la pile web en batch.
+        """
+        code = "import sys, triangulator_cli; print('flask' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+            check=True,
+        )
+        assert out.stdout.strip() == "False"
@@ -0,0 +1,91 @@
+"""Tests unitaires - Triangulation hors memoire (triangulator_stream).
+
+- Sortie identique a la triangulation en memoire
+- Doublons repartis sur plusieurs buckets
+- Cas degeneres (colineaires, < 3 points, binaire invalide)
+"""
+
+import random
+import struct
+
+import pytest
+
+from triangulator_core import (
+    compute_triangulation,
+    parse_triangulation,
+    serialize_pointset,
+    serialize_triangulation,
+)
+from triangulator_stream import triangulate_file
+
+
+def _write_pointset(path, points):
+    """Ecrire un PointSet binaire dans path."""
+    path.write_bytes(serialize_pointset(points))
+    return str(path)
+
+
+def _expected(points):
+    """Binaire Triangles attendu (chemin en memoire)."""
+    # Meme arrondi float32 que le format binaire
+    pts = [struct.unpack("<ff", struct.pack("<ff", x, y)) for x, y in points]
+    return serialize_triangulation(*compute_triangulation(pts))
+
+
+class TestTriangulateFile:
+    """Triangulation fichier -> fichier."""
+
+    @pytest.mark.parametrize("bucket_points", [1_000_000, 7, 1])
+    def test_matches_in_memory_result(self, tmp_path, bucket_points):
+        """Teste que la sortie est identique a serialize_triangulation.
+
+        Raison: Le mode hors memoire ne doit pas changer le resultat.
+        """
+        rng = random.Random(42)
+        points = [(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(200)]
+        # Doublons disperses, y compris 0.0 / -0.0
+        points += [points[3], points[150], points[3], (0.0, 0.0), (-0.0, 0.0)]
+        src = _write_pointset(tmp_path / "in.bin", points)
+        dst = str(tmp_path / "out.bin")
+
+        n_verts, n_tris = triangulate_file(src, dst, bucket_points=bucket_points)
+
+        data = (tmp_path / "out.bin").read_bytes()
+        assert data == _expected(points)
+        verts, tris = parse_triangulation(data)
+        assert (len(verts), len(tris)) == (n_verts, n_tris) == (201, 199)
+
+    def test_collinear_points_give_no_triangles(self, tmp_path):
+        """Teste des points colineaires -> 0 triangle, vertices ecrits.
+
+        Raison: Meme comportement degenere que compute_triangulation.
+        """
+        points = [(float(i), float(i)) for i in range(10)]
+        src = _write_pointset(tmp_path / "in.bin", points)
+        dst = str(tmp_path / "out.bin")
+
+        assert triangulate_file(src, dst, bucket_points=3) == (10, 0)
+        assert (tmp_path / "out.bin").read_bytes() == _expected(points)
+
+    def test_less_than_three_unique_points_raises(self, tmp_path):
+        """Teste moins de 3 points uniques -> ValueError, pas de sortie.
+
+        Raison: Erreur identique au calcul en memoire.
+        """
+        src = _write_pointset(tmp_path / "in.bin", [(1.0, 1.0)] * 5)
+        dst = tmp_path / "out.bin"
+
+        with pytest.raises(ValueError, match="3 points uniques"):
+            triangulate_file(src, str(dst), bucket_points=2)
+        assert not dst.exists()
+
+    def test_invalid_length_raises(self, tmp_path):
+        """Teste un PointSet tronque -> ValueError.
+
+        Raison: Refuser un fichier corrompu avant tout calcul.
+        """
+        src = tmp_path / "in.bin"
+        src.write_bytes(struct.pack("<I", 4) + struct.pack("<ff", 0.0, 0.0))
+
+        with pytest.raises(ValueError, match="Longueur"):
+            triangulate_file(str(src), str(tmp_path / "out.bin"))
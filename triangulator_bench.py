@@ -0,0 +1,356 @@
+"""Benchmark d'echelle de triangulator_core (compute, sweep, serialize, ...).
+
+Mesure chaque etape pour N = 1e3 .. 1e6 points, ajuste l'exposant de
+complexite empirique (pente en log-log) et compare a une reference
+enregistree sur la machine locale.
+
+Chaque echantillon est la duree moyenne d'un appel, apres un appel de
+chauffe, ramasse-miettes desactive, sur assez d'appels pour durer au
+moins MIN_SAMPLE_SECONDS: les petites tailles ne sont pas mesurees sur
+un seul appel de moins d'une milliseconde.
+
+Une regression est signalee quand, pour une etape:
+- la moyenne geometrique, sur les tailles, du rapport entre meilleurs
+  echantillons (courant / reference) depasse 1 + `tolerance`, et
+- le ralentissement est significatif a chaque taille (test de
+  Mann-Whitney unilateral)
+ou quand l'exposant ajuste depasse `max_exponent` (ex: O(n^2) accidentel).
+Une taille isolee plus lente n'est que du bruit de la machine: une
+regression reelle ralentit l'etape a toutes les tailles.
+
+La reference n'est comparee que sur la meme machine, avec la meme
+version de format (cost_model.BASELINE_VERSION) et les memes etapes (STAGES);
+sinon elle est consideree absente et enregistree a nouveau.
+
+La reference enregistree contient aussi le modele de cout du mode
+"auto" (cost_model.py), calibre sur ces mesures et sur la latence d'un
+pool de processus.
+
+Usage:
+    python triangulator_bench.py            # mesurer et comparer
+    python triangulator_bench.py --record   # enregistrer la reference
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+from cost_model import (
+    BASELINE_VERSION,
+    DEFAULT_BASELINE,
+    calibrate,
+    machine_id,
+    measure_pool_overhead,
+)
+from triangulator_core import (
+    compute_triangulation,
+    compute_triangulation_many,
+    pack_pointsets,
+    parse_triangulation,
+    serialize_triangulation,
+    serialize_triangulation_many,
+)
+
+# Ajouter ou retirer une etape: incrementer cost_model.BASELINE_VERSION
+STAGES = ("compute", "sweep", "serialize", "parse", "batch")
+# Taille des PointSets de l'etape batch (n points au total)
+BATCH_SET_SIZE = 50
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+# Duree minimale d'un echantillon (appels groupes en dessous)
+MIN_SAMPLE_SECONDS = 0.01
+
+
+def _random_points(n: int, seed: int = 0) -> list[tuple[float, float]]:
+    """Generer n points aleatoires reproductibles."""
+    rng = random.Random(seed)
+    return [(rng.uniform(-100.0, 100.0), rng.uniform(-100.0, 100.0)) for _ in range(n)]
+
+
+def _stage_runner(stage: str, n: int):
+    """Build the inputs of a stage and return the function to time.
+
+    La preparation (generation, etapes amont) n'est pas mesuree.
+    """
+    points = _random_points(n)
+    if stage == "batch":
+        sets = [points[i : i + BATCH_SET_SIZE] for i in range(0, n, BATCH_SET_SIZE)]
+        if len(sets) > 1 and len(sets[-1]) < 3:
+            sets[-2] += sets.pop()
+        offsets, coords = pack_pointsets(sets)
+        return lambda: serialize_triangulation_many(
+            compute_triangulation_many(offsets, coords)
+        )
+    if stage == "compute":
+        return lambda: compute_triangulation(points)
+    if stage == "sweep":
+        return lambda: compute_triangulation(points, algorithm="sweep")
+    vertices, triangles = compute_triangulation(points)
+    if stage == "serialize":
+        return lambda: serialize_triangulation(vertices, triangles)
+    binary = serialize_triangulation(vertices, triangles)
+    if stage == "parse":
+        return lambda: parse_triangulation(binary)
+    raise ValueError(f"Etape inconnue: {stage}")
+
+
+def measure(stage: str, n: int, repeats: int = 5) -> list[float]:
+    """Chronometrer une etape repeats fois pour n points.
+
+    Un premier appel (chauffe) fixe le nombre d'appels par echantillon:
+    assez pour durer au moins MIN_SAMPLE_SECONDS. Le ramasse-miettes est
+    desactive pendant la mesure.
+
+    Returns:
+        Durees moyennes d'un appel, en secondes
+
+    """
+    run = _stage_runner(stage, n)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        run()
+        warmup = time.perf_counter() - start
+        number = max(1, math.ceil(MIN_SAMPLE_SECONDS / max(warmup, 1e-9)))
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(number):
+                run()
+            samples.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+
+def fit_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """Pente de la regression lineaire de log(temps) sur log(n).
+
+    Args:
+        sizes: Tailles mesurees (au moins 2)
+        seconds: Durees correspondantes (> 0)
+
+    Returns:
+        Exposant k tel que temps ~ n^k
+
+    Raises:
+        ValueError: Si moins de 2 mesures
+
+    """
+    if len(sizes) < 2:
+        raise ValueError("Au moins 2 tailles sont requises pour ajuster l'exposant")
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys, strict=True))
+    return sxy / sxx
+
+
+def mann_whitney_p(slower: list[float], faster: list[float]) -> float:
+    """P-valeur unilaterale "slower est plus lent que faster" (Mann-Whitney U).
+
+    Approximation normale avec correction de continuite, suffisante pour
+    5 a 10 echantillons par groupe.
+
+    Returns:
+        P-valeur dans [0, 1]
+
+    """
+    n1, n2 = len(slower), len(faster)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    # U = nombre de paires ou "faster" est plus lent (egalites: 1/2)
+    u = 0.0
+    for a in slower:
+        for b in faster:
+            if b > a:
+                u += 1.0
+            elif b == a:
+                u += 0.5
+    mean = n1 * n2 / 2.0
+    sd = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12.0)
+    z = (u + 0.5 - mean) / sd
+    return 0.5 * math.erfc(-z / math.sqrt(2.0))
+
+
+def run_suite(
+    sizes: tuple = DEFAULT_SIZES, repeats: int = 5, stages: tuple = STAGES
+) -> dict:
+    """Mesurer toutes les etapes pour toutes les tailles.
+
+    Returns:
+        Dict {stage: {"sizes", "samples", "median", "exponent"}}
+
+    """
+    results = {}
+    for stage in stages:
+        samples = [measure(stage, n, repeats) for n in sizes]
+        medians = [statistics.median(s) for s in samples]
+        results[stage] = {
+            "sizes": list(sizes),
+            "samples": samples,
+            "median": medians,
+            "exponent": fit_exponent(list(sizes), medians),
+        }
+    return results
+
+
+def save_baseline(
+    results: dict, path: str = DEFAULT_BASELINE, cost_model: dict | None = None
+) -> None:
+    """Enregistrer les mesures (et le modele de cout) comme reference locale."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    data = {
+        "version": BASELINE_VERSION,
+        "stages": list(STAGES),
+        "machine": machine_id(),
+        "results": results,
+    }
+    if cost_model is not None:
+        data["cost_model"] = cost_model
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def calibrate_cost_model(results: dict) -> dict:
+    """Calibrer le modele de cout du mode auto (mesures et pool local)."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return calibrate(results, measure_pool_overhead(pool))
+
+
+def load_baseline(path: str = DEFAULT_BASELINE) -> dict | None:
+    """Charger la reference si elle est comparable aux mesures courantes.
+
+    Une reference d'une autre machine, d'une autre version de format ou
+    d'un autre ensemble d'etapes est consideree absente.
+
+    Returns:
+        Resultats de reference, ou None
+
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if (
+        data.get("version") != BASELINE_VERSION
+        or data.get("stages") != list(STAGES)
+        or data.get("machine") != machine_id()
+    ):
+        return None
+    return data["results"]
+
+
+def find_regressions(
+    current: dict,
+    baseline: dict | None = None,
+    tolerance: float = 0.5,
+    alpha: float = 0.01,
+    max_exponent: float = 1.3,
+) -> list[str]:
+    """Lister les regressions de current par rapport a baseline.
+
+    Args:
+        current: Resultats de run_suite
+        baseline: Resultats de reference (None: exposants seulement)
+        tolerance: Ralentissement relatif minimal de l'etape (moyenne
+            geometrique sur les tailles)
+        alpha: Seuil de significativite du test de Mann-Whitney
+        max_exponent: Exposant de complexite maximal accepte
+
+    Returns:
+        Messages decrivant chaque regression (liste vide si aucune)
+
+    """
+    problems = []
+    for stage, res in current.items():
+        if res["exponent"] > max_exponent:
+            problems.append(
+                f"{stage}: exposant {res['exponent']:.2f} > {max_exponent}"
+            )
+        if not baseline or stage not in baseline:
+            continue
+        ref = baseline[stage]
+        ref_by_size = dict(zip(ref["sizes"], ref["samples"], strict=True))
+        ratios, p_values = [], []
+        for n, samples in zip(res["sizes"], res["samples"], strict=True):
+            ref_samples = ref_by_size.get(n)
+            if not ref_samples:
+                continue
+            # Meilleur echantillon: le moins sensible au bruit de la machine
+            ratios.append(min(samples) / min(ref_samples))
+            p_values.append(mann_whitney_p(samples, ref_samples))
+        if not ratios:
+            continue
+        ratio = math.exp(statistics.fmean(math.log(r) for r in ratios))
+        if ratio > 1.0 + tolerance and max(p_values) < alpha:
+            problems.append(
+                f"{stage}: x{ratio:.2f} plus lent sur {len(ratios)} tailles "
+                f"(p<={max(p_values):.4f})"
+            )
+    return problems
+
+
+def sizes_from_env() -> tuple:
+    """Tailles du balayage (TRIANGULATOR_BENCH_SIZES="1000,10000,...")."""
+    raw = os.environ.get("TRIANGULATOR_BENCH_SIZES")
+    if not raw:
+        return DEFAULT_SIZES
+    return tuple(int(float(v)) for v in raw.split(","))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entree: mesurer, afficher, comparer ou enregistrer.
+
+    Returns:
+        0 sans regression, 1 sinon
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--record", action="store_true", help="enregistrer la reference"
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--baseline",
+        default=os.environ.get("TRIANGULATOR_BENCH_BASELINE", DEFAULT_BASELINE),
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suite(sizes_from_env(), args.repeats)
+    for stage, res in results.items():
+        cells = ", ".join(
+            f"n={n}: {m * 1000:.1f}ms"
+            for n, m in zip(res["sizes"], res["median"], strict=True)
+        )
+        print(f"{stage:<10} k={res['exponent']:.2f}  {cells}")
+
+    if args.record:
+        coefficients = calibrate_cost_model(results)
+        save_baseline(results, args.baseline, coefficients)
+        print(f"Reference enregistree: {args.baseline}")
+        print("Modele de cout: " + ", ".join(
+            f"{name}={value:.3g}" for name, value in coefficients.items()
+        ))
+        return 0
+    problems = find_regressions(results, load_baseline(args.baseline))
+    for problem in problems:
+        print(f"REGRESSION {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""Triangulation en lot de fichiers PointSet, en ligne de commande.
+
+N'importe que triangulator_core (et triangulator_stream): pas de Flask,
+pas de serveur. Les fichiers sont repartis sur un pool de processus.
+
+Usage:
+    python triangulator_cli.py ENTREE [ENTREE ...] -o SORTIE [-j N]
+
+ENTREE peut etre un fichier, un repertoire (tous les *.bin) ou un motif
+glob. Chaque PointSet produit SORTIE/<nom>.triangles.bin au format
+Triangles. Un resume (fichiers, points, debit) est affiche a la fin.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from triangulator_core import (
+    compute_triangulation,
+    parse_pointset,
+    serialize_triangulation,
+)
+from triangulator_stream import triangulate_file
+
+OUTPUT_SUFFIX = ".triangles.bin"
+
+
+def expand_inputs(inputs: list[str]) -> list[str]:
+    """Resoudre fichiers, repertoires et motifs glob en liste de fichiers.
+
+    Args:
+        inputs: Chemins ou motifs donnes en ligne de commande
+
+    Returns:
+        Liste triee et sans doublon des fichiers a traiter
+
+    """
+    files = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            files.update(glob.glob(os.path.join(item, "*.bin")))
+        elif os.path.isfile(item):
+            files.add(item)
+        else:
+            files.update(p for p in glob.glob(item) if os.path.isfile(p))
+    return sorted(files)
+
+
+def output_path(src: str, output_dir: str) -> str:
+    """Chemin du fichier Triangles produit pour un PointSet."""
+    name = os.path.basename(src)
+    if name.endswith(".bin"):
+        name = name[: -len(".bin")]
+    return os.path.join(output_dir, name + OUTPUT_SUFFIX)
+
+
+def triangulate_one(src: str, dst: str, out_of_core: bool = False) -> dict:
+    """Trianguler un fichier PointSet vers un fichier Triangles.
+
+    Execute dans un processus du pool: ne leve jamais d'exception, l'erreur
+    est retournee dans le resultat.
+
+    Args:
+        src: Fichier PointSet
+        dst: Fichier Triangles a ecrire
+        out_of_core: Utiliser triangulate_file (memoire bornee)
+
+    Returns:
+        Dict {src, points, triangles, seconds, error}
+
+    """
+    start = time.perf_counter()
+    result = {"src": src, "points": 0, "triangles": 0, "error": None}
+    try:
+        if out_of_core:
+            n_points, n_tris = triangulate_file(src, dst)
+        else:
+            with open(src, "rb") as f:
+                points = parse_pointset(f.read())
+            vertices, triangles = compute_triangulation(points)
+            with open(dst, "wb") as f:
+                f.write(serialize_triangulation(vertices, triangles))
+            n_points, n_tris = len(points), len(triangles)
+        result["points"] = n_points
+        result["triangles"] = n_tris
+    except (OSError, ValueError) as e:
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def run(
+    files: list[str], output_dir: str, jobs: int = 1, out_of_core: bool = False
+) -> list[dict]:
+    """Trianguler une liste de fichiers, en parallele si jobs > 1.
+
+    Args:
+        files: Fichiers PointSet
+        output_dir: Repertoire de sortie (cree si absent)
+        jobs: Nombre de processus
+        out_of_core: Mode hors memoire pour chaque fichier
+
+    Returns:
+        Liste des resultats de triangulate_one, dans l'ordre de files
+
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    dsts = [output_path(src, output_dir) for src in files]
+    if jobs <= 1 or len(files) <= 1:
+        return [
+            triangulate_one(src, dst, out_of_core)
+            for src, dst in zip(files, dsts, strict=True)
+        ]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(
+            pool.map(triangulate_one, files, dsts, [out_of_core] * len(files))
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entree de la ligne de commande.
+
+    Args:
+        argv: Arguments (defaut: sys.argv[1:])
+
+    Returns:
+        Code de sortie: 0 si tout a reussi, 1 sinon, 2 si aucune entree
+
+    """
+    parser = argparse.ArgumentParser(
+        description="Triangulation en lot de fichiers PointSet binaires."
+    )
+    parser.add_argument("inputs", nargs="+", help="fichiers, repertoires ou globs")
+    parser.add_argument("-o", "--output", required=True, help="repertoire de sortie")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="nombre de processus (defaut: nombre de coeurs)",
+    )
+    parser.add_argument(
+        "--out-of-core", action="store_true",
+        help="memoire bornee pour les tres gros PointSets",
+    )
+    args = parser.parse_args(argv)
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        print("Aucun fichier PointSet trouve", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    results = run(files, args.output, args.jobs, args.out_of_core)
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if r["error"]]
+    for r in failed:
+        print(f"ECHEC {r['src']}: {r['error']}", file=sys.stderr)
+    n_points = sum(r["points"] for r in results)
+    ok = len(results) - len(failed)
+    rate = elapsed if elapsed > 0 else float("inf")
+    print(
+        f"{ok}/{len(results)} fichiers, {n_points} points en {elapsed:.3f}s "
+        f"({ok / rate:.1f} fichiers/s, {n_points / rate:.0f} points/s, "
+        f"{args.jobs} processus)"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,194 @@
 """Module de triangulation pur (sans dependances API).
 
 Fournit les fonctions de base pour:
-- Calculer une triangulation simple (fan triangulation)
+- Parser / serialiser le format binaire PointSet
+- Calculer une triangulation simple (fan triangulation), aussi par lots,
+  ou valide pour tout ordre des points (balayage, O(n log n))
 - Serialiser en format binaire
 - Parser le format binaire
-- Gerer les cas degeneres (points colineaires, doublons)
+- Sous-echantillonner un PointSet pour un apercu (niveaux de detail)
+- Encoder / decoder le format compact (indices etroits, delta, quantification)
+- Ajouter / lire des sections optionnelles apres les triangles (adjacence,
+  correspondance points d'entree -> vertices)
+- Calculer / appliquer un delta entre deux triangulations
+- Gerer les cas degeneres (points colineaires, doublons, quasi-doublons
+  fusionnes a une tolerance pres)
 
 Utilise par les tests unitaires et par l'application Flask.
 """
 
+import math
 import struct
+import sys
+from array import array
+from itertools import accumulate, chain
+
+# Version de la sortie de compute_triangulation / serialize_triangulation:
+# a incrementer des qu'un meme PointSet peut produire un binaire different
+# (les ETag des resultats en dependent)
+ALGORITHM_VERSION = "fan-1"
+
+# Algorithmes de compute_triangulation (le premier est celui par defaut)
+ALGORITHMS = ("fan", "sweep", "auto")
+
+# Nombre de tuples packes par appel a struct.pack (memoire temporaire bornee)
+_PACK_CHUNK = 4096
+
+
+def _pack_into(out: bytearray, code: str, rows: list, cast) -> None:
+    """Ajouter des tuples de taille fixe a out, en little-endian.
+
+    Packe par blocs plutot qu'un struct.pack par tuple: la concatenation
+    repetee de bytes etait quadratique en nombre de tuples.
+
+    Args:
+        out: Buffer de sortie (modifie sur place)
+        code: Code struct d'une valeur ("f" ou "I")
+        rows: Tuples de meme longueur (points ou triangles)
+        cast: Conversion appliquee a chaque valeur (float ou int)
+
+    """
+    for start in range(0, len(rows), _PACK_CHUNK):
+        chunk = rows[start : start + _PACK_CHUNK]
+        values = [cast(v) for row in chunk for v in row]
+        out += struct.pack(f"<{len(values)}{code}", *values)
+
+
+def parse_pointset(data: bytes) -> list[tuple[float, float]]:
+    """Parser le format binaire d'un PointSet.
+
+    Format:
+    - 4 bytes (uint32 LE): N = nombre de points
+    - N x 8 bytes: (float32 x, float32 y) pour chaque point
+
+    Args:
+        data: Bytes du PointSet (bytes, memoryview ou mmap)
+
+    Returns:
+        Liste de tuples (x, y)
+
+    Raises:
+        ValueError: Si format invalide
+
+    """
+    if len(data) < 4:
+        raise ValueError("Binaire trop court: nombre de points manquant")
+    offset = 0
+    n_points = struct.unpack_from("<I", data, offset)[0]
+    offset += 4
+    attendu = n_points * 8
+    if len(data) != offset + attendu:
+        raise ValueError("Longueur binaire invalide pour les points")
+    points = []
+    for _ in range(n_points):
+        x, y = struct.unpack_from("<ff", data, offset)
+        points.append((float(x), float(y)))
+        offset += 8
+    return points
+
+
+def serialize_pointset(points: list[tuple[float, float]]) -> bytes:
+    """Serialize a list of points to the PointSet binary format.
+
+    Args:
+        points: Liste de tuples (x, y)
+
+    Returns:
+        Bytes du PointSet
+
+    """
+    out = bytearray(struct.pack("<I", len(points)))
+    _pack_into(out, "f", points, float)
+    return bytes(out)
+
+
+# Niveaux de detail proposes (budgets de vertices, puissances de 4)
+LOD_LEVELS = tuple(4**k for k in range(3, 11))
+
+# Candidats lus par vertex du budget lors du sous-echantillonnage
+LOD_OVERSAMPLE = 8
+
+
+def select_lod_level(requested: int) -> int:
+    """Plus grand niveau de detail ne depassant pas le budget demande.
+
+    Args:
+        requested: Nombre maximal de vertices souhaite
+
+    Returns:
+        Niveau de LOD_LEVELS
+
+    Raises:
+        ValueError: Si le budget est inferieur au plus petit niveau
+
+    """
+    levels = [level for level in LOD_LEVELS if level <= requested]
+    if not levels:
+        raise ValueError(f"Niveau de detail minimal: {LOD_LEVELS[0]} vertices")
+    return levels[-1]
+
+
+def decimate_pointset(
+    data, budget: int, oversample: int = LOD_OVERSAMPLE
+) -> list[tuple[float, float]]:
+    """Sous-echantillonner un PointSet binaire par stratification spatiale.
+
+    Les candidats sont pris a pas constant dans le binaire (au plus
+    ~2 x budget x oversample, vue a pas sur le binaire: seules les
+    coordonnees echantillonnees sont lues), puis une grille sur leur
+    boite englobante garde un point par cellule occupee. La grille est
+    affinee tant que moins de la moitie du budget est occupee (nuages
+    concentres). Le travail Python depend du budget, pas de la taille du
+    PointSet.
+
+    Args:
+        data: Bytes du PointSet (bytes, memoryview ou mmap)
+        budget: Nombre maximal de points retenus
+        oversample: Candidats lus par point du budget
+
+    Returns:
+        Liste d'au plus budget tuples (x, y); tous les points si N <= budget
+
+    Raises:
+        ValueError: Si format invalide
+
+    """
+    if len(data) < 4:
+        raise ValueError("Binaire trop court: nombre de points manquant")
+    n_points = struct.unpack_from("<I", data, 0)[0]
+    if len(data) != 4 + n_points * 8:
+        raise ValueError("Longueur binaire invalide pour les points")
+    if n_points <= budget:
+        return parse_pointset(data)
+    stride = max(1, n_points // (budget * oversample))
+    xs = _strided_from_le("f", data, 4, 2 * n_points, 2 * stride)
+    ys = _strided_from_le("f", data, 8, 2 * n_points - 1, 2 * stride)
+
+    grid = max(1, math.isqrt(budget))
+    kept = _one_per_cell(xs, ys, grid)
+    for _ in range(8):
+        if len(kept) >= budget // 2 or len(kept) == len(xs):
+            break
+        finer = _one_per_cell(xs, ys, grid * 3 // 2 + 1)
+        if len(finer) > budget:
+            break
+        grid, kept = grid * 3 // 2 + 1, finer
+    return kept
+
+
+def _one_per_cell(xs, ys, grid: int) -> list[tuple[float, float]]:
+    """Premier point de chaque cellule occupee d'une grille grid x grid."""
+    xmin, ymin = min(xs), min(ys)
+    xmax, ymax = max(xs), max(ys)
+    sx = grid / (xmax - xmin) if xmax > xmin else 0.0
+    sy = grid / (ymax - ymin) if ymax > ymin else 0.0
+    last = grid - 1
+    cells: dict = {}
+    for x, y in zip(xs, ys, strict=True):
+        cell = (min(last, int((x - xmin) * sx)), min(last, int((y - ymin) * sy)))
+        if cell not in cells:
+            cells[cell] = (x, y)
+    return list(cells.values())
 
 
 def _dedupe_points(points: list[tuple[float, float]]) -> list[tuple[float, float]]:
@@ -32,6 +211,114 @@ def _dedupe_points(points: list[tuple[float, float]]) -> list[tuple[float, float
     return out
 
 
+# Plus grande coordonnee finie du format PointSet (float32)
+_FLOAT32_MAX = struct.unpack("<f", b"\xff\xff\x7f\x7f")[0]
+
+# Plus petite tolerance de fusion non nulle: en dessous, coordonnee float32
+# / tolerance depasse la plage des float (indices de grille infinis)
+MIN_SNAP_TOLERANCE = 2 * _FLOAT32_MAX / sys.float_info.max
+
+
+class SnapToleranceError(ValueError):
+    """Tolerance de fusion qui laisse trop peu de vertices a trianguler."""
+
+
+def snap_points(
+    points: list[tuple[float, float]],
+    tolerance: float = 0.0,
+    min_vertices: int = 0,
+) -> tuple[list[tuple[float, float]], array]:
+    """Fusionner les points distants d'au plus tolerance, en O(n) attendu.
+
+    Chaque point, dans l'ordre d'entree, rejoint le vertex retenu le plus
+    proche a distance <= tolerance, ou devient un nouveau vertex (ses
+    coordonnees sont gardees telles quelles). Les vertices retenus sont
+    ranges dans une grille de pas tolerance: seules les 9 cellules
+    voisines sont examinees, et deux vertices retenus etant distants de
+    plus de tolerance, chaque cellule en contient au plus quelques-uns.
+    La fusion n'est pas transitive: deux points a 1.5 x tolerance l'un de
+    l'autre restent distincts, meme avec un intermediaire.
+
+    Args:
+        points: Liste de tuples (x, y), coordonnees float32 (format PointSet)
+        tolerance: Distance de fusion (0 = doublons exacts seulement, sinon
+            au moins MIN_SNAP_TOLERANCE)
+        min_vertices: Nombre de vertices requis ensuite (triangulation: 3)
+
+    Returns:
+        Tuple (vertices, mapping): mapping[i] est l'indice dans vertices
+        du point d'entree i (array uint32)
+
+    Raises:
+        ValueError: Si la tolerance est negative, non finie ou trop petite
+        SnapToleranceError: Si la fusion laisse moins de min_vertices
+            vertices alors que les points distincts sont assez nombreux
+
+    """
+    if not (tolerance >= 0 and math.isfinite(tolerance)):
+        raise ValueError(f"Tolerance de fusion invalide: {tolerance}")
+    if 0 < tolerance < MIN_SNAP_TOLERANCE:
+        raise ValueError(
+            f"Tolerance de fusion trop petite (0 ou >= {MIN_SNAP_TOLERANCE:.3g}):"
+            f" {tolerance}"
+        )
+    if tolerance == 0:
+        return _exact_snap(points)
+    vertices, mapping = _grid_snap(points, tolerance)
+    if len(vertices) < min_vertices <= len(_exact_snap(points)[0]):
+        raise SnapToleranceError(
+            f"Tolerance de fusion trop grande: {len(vertices)} vertex restant(s),"
+            f" {min_vertices} requis"
+        )
+    return vertices, mapping
+
+
+def _exact_snap(
+    points: list[tuple[float, float]],
+) -> tuple[list[tuple[float, float]], array]:
+    """Fusionner les doublons exacts (voir snap_points)."""
+    vertices: list[tuple[float, float]] = []
+    mapping = array("I")
+    seen: dict = {}
+    for x, y in points:
+        key = (float(x), float(y))
+        index = seen.get(key)
+        if index is None:
+            index = seen[key] = len(vertices)
+            vertices.append(key)
+        mapping.append(index)
+    return vertices, mapping
+
+
+def _grid_snap(
+    points: list[tuple[float, float]], tolerance: float
+) -> tuple[list[tuple[float, float]], array]:
+    """Fusionner a tolerance > 0 par grille de hachage (voir snap_points)."""
+    vertices: list[tuple[float, float]] = []
+    mapping = array("I")
+    limit = tolerance * tolerance
+    inv = 1.0 / tolerance
+    cells: dict = {}
+    for x, y in points:
+        x, y = float(x), float(y)
+        cx, cy = math.floor(x * inv), math.floor(y * inv)
+        best, best_d2 = -1, limit
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for index in cells.get((gx, gy), ()):
+                    vx, vy = vertices[index]
+                    d2 = (vx - x) * (vx - x) + (vy - y) * (vy - y)
+                    # Ex aequo: le plus ancien vertex (resultat deterministe)
+                    if d2 < best_d2 or (d2 == best_d2 and (best < 0 or index < best)):
+                        best, best_d2 = index, d2
+        if best < 0:
+            best = len(vertices)
+            vertices.append((x, y))
+            cells.setdefault((cx, cy), []).append(best)
+        mapping.append(best)
+    return vertices, mapping
+
+
 def _is_collinear(points: list[tuple[float, float]], eps: float = 1e-12) -> bool:
     """Check if all points are aligned (collinear).
 
@@ -59,29 +346,156 @@ def _is_collinear(points: list[tuple[float, float]], eps: float = 1e-12) -> bool
     return True
 
 
+def _sweep_triangles(
+    points: list[tuple[float, float]],
+) -> list[tuple[int, int, int]]:
+    """Trianguler l'enveloppe convexe par balayage (x croissant, puis y).
+
+    Les chaines inferieure et superieure de l'enveloppe des points deja
+    balayes sont tenues comme dans l'algorithme de la chaine monotone.
+    Chaque nouveau point voit les aretes qu'il retire d'une chaine: un
+    triangle par arete retiree. Les points alignes sur une chaine y
+    restent (pas de triangle plat ni de sommet sur une arete). Tous les
+    triangles sont orientes dans le sens direct (CCW).
+
+    Args:
+        points: Points uniques, non tous colineaires
+
+    Returns:
+        Liste de triangles (i, j, k), indices dans points
+
+    """
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    order = sorted(range(len(points)), key=points.__getitem__)
+    lower = order[:2]
+    upper = order[:2]
+    tris = []
+    for i in order[2:]:
+        px, py = xs[i], ys[i]
+        while len(lower) >= 2:
+            a, b = lower[-2], lower[-1]
+            ax, ay = xs[a], ys[a]
+            if (xs[b] - ax) * (py - ay) - (ys[b] - ay) * (px - ax) >= 0:
+                break
+            tris.append((a, i, b))
+            lower.pop()
+        lower.append(i)
+        while len(upper) >= 2:
+            a, b = upper[-2], upper[-1]
+            ax, ay = xs[a], ys[a]
+            if (xs[b] - ax) * (py - ay) - (ys[b] - ay) * (px - ax) <= 0:
+                break
+            tris.append((a, b, i))
+            upper.pop()
+        upper.append(i)
+    return tris
+
+
+def _convex_order(points: list[tuple[float, float]]) -> int:
+    """Sens de parcours si les points forment un polygone convexe, dans l'ordre.
+
+    Une passe, sans tri: tous les virages stricts et de meme signe, et au
+    plus deux changements de sens en x comme en y (un seul tour). Sort au
+    premier virage contraire, donc tres tot sur un nuage quelconque.
+
+    Returns:
+        1 (sens direct), -1 (sens indirect), ou 0 si non convexe
+        (ou si trois points consecutifs sont alignes)
+
+    """
+    n = len(points)
+    sign = 0
+    flips_x = flips_y = 0
+    last_dx = last_dy = 0.0
+    for i in range(n):
+        ax, ay = points[i - 2]
+        bx, by = points[i - 1]
+        cx, cy = points[i]
+        cross = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        if cross == 0 or (sign and (cross > 0) != (sign > 0)):
+            return 0
+        sign = 1 if cross > 0 else -1
+        dx, dy = cx - bx, cy - by
+        if dx:
+            flips_x += last_dx * dx < 0
+            last_dx = dx
+        if dy:
+            flips_y += last_dy * dy < 0
+            last_dy = dy
+    # k tours: 2k changements sur le cycle, au moins 2k - 1 sans le dernier
+    return sign if flips_x <= 2 and flips_y <= 2 else 0
+
+
+def choose_algorithm(points: list[tuple[float, float]]) -> str:
+    """Algorithme choisi par le mode "auto" pour des points uniques.
+
+    L'eventail n'est valide que si les points suivent un polygone convexe
+    (dans un sens ou l'autre): il est alors le moins couteux (O(n), sans
+    tri). Sinon, balayage (valide pour tout ordre, O(n log n)).
+
+    Returns:
+        "fan" ou "sweep"
+
+    """
+    return _select_algorithm(points)[0]
+
+
+def _select_algorithm(points: list[tuple[float, float]]) -> tuple[str, int]:
+    """Algorithme du mode "auto" et sens de parcours (voir _convex_order).
+
+    Returns:
+        ("fan" ou "sweep", 1, -1 ou 0)
+
+    """
+    order = _convex_order(points) if len(points) >= 3 else 0
+    if len(points) <= 3 or order:
+        return "fan", order
+    return "sweep", order
+
+
 def compute_triangulation(
     points: list[dict],
+    algorithm: str = "fan",
+    tolerance: float = 0.0,
 ) -> tuple[list[tuple[float, float]], list[tuple[int, int, int]]]:
     """Compute simple triangulation for a set of points.
 
-    Algorithme: Fan triangulation (simple et deterministe)
-    - Dedupliquer les points identiques
+    Algorithmes (ALGORITHMS):
+    - "fan": triangles en eventail depuis le premier point (0, i, i+1),
+      en O(n); valide seulement si les points suivent un polygone etoile
+      depuis le premier (ordre fourni par le client)
+    - "sweep": triangulation de l'enveloppe convexe par balayage, valide
+      pour tout ordre des points, en O(n log n) (tri), triangles CCW
+    - "auto": eventail si les points forment un polygone convexe dans
+      l'ordre (valide et le moins couteux), balayage sinon (voir
+      choose_algorithm); triangles CCW dans les deux cas
+
+    Dans les deux cas:
+    - Dedupliquer les points identiques (ou distants d'au plus
+      tolerance, voir snap_points)
     - Si < 3 points uniques -> ValueError
     - Si points colineaires -> 0 triangle
-    - Sinon: triangles en eventail depuis le premier point (0, i, i+1)
 
     Args:
         points: Liste de dicts {"x": float, "y": float} ou tuples (x, y)
+        algorithm: Nom de l'algorithme (voir ALGORITHMS)
+        tolerance: Distance de fusion des quasi-doublons (0 = aucune)
 
     Returns:
         Tuple (vertices, triangles) ou:
-        - vertices: liste de (x, y)
+        - vertices: liste de (x, y), dans l'ordre d'entree sans doublons
         - triangles: liste de (i, j, k) indices dans vertices
 
     Raises:
-        ValueError: Si moins de 3 points uniques
+        ValueError: Si moins de 3 points uniques, algorithme inconnu ou
+            tolerance invalide
+        SnapToleranceError: Si la tolerance laisse moins de 3 vertices
 
     """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algorithme de triangulation inconnu: {algorithm}")
+
     # Convertir en tuples (x, y)
     pts = []
     for p in points:
@@ -90,8 +504,11 @@ def compute_triangulation(
         else:
             pts.append((float(p[0]), float(p[1])))
 
-    # Dedupliquer
-    verts = _dedupe_points(pts)
+    # Dedupliquer (et fusionner les quasi-doublons)
+    if tolerance:
+        verts = snap_points(pts, tolerance, min_vertices=3)[0]
+    else:
+        verts = _dedupe_points(pts)
     if len(verts) < 3:
         raise ValueError("Au moins 3 points uniques sont requis pour la triangulation")
 
@@ -99,6 +516,14 @@ def compute_triangulation(
     if _is_collinear(verts):
         return verts, []
 
+    if algorithm == "auto":
+        algorithm, order = _select_algorithm(verts)
+        if algorithm == "fan" and order < 0:
+            # Polygone parcouru en sens indirect: triangles retournes (CCW)
+            return verts, [(0, i + 1, i) for i in range(1, len(verts) - 1)]
+    if algorithm == "sweep":
+        return verts, _sweep_triangles(verts)
+
     # Fan triangulation: (0, i, i+1) pour i de 1 a n-2
     n = len(verts)
     tris = []
@@ -107,6 +532,108 @@ def compute_triangulation(
     return verts, tris
 
 
+def pack_pointsets(pointsets: list) -> tuple[array, array]:
+    """Empaqueter des PointSets en tableau irregulier (offsets, coords).
+
+    Args:
+        pointsets: Liste de listes de tuples (x, y)
+
+    Returns:
+        Tuple (offsets, coords): le PointSet s occupe les points
+        offsets[s] .. offsets[s + 1] - 1, coords = x0, y0, x1, y1, ...
+
+    """
+    offsets = array("Q", accumulate((len(p) for p in pointsets), initial=0))
+    coords = array("d", chain.from_iterable(chain.from_iterable(pointsets)))
+    return offsets, coords
+
+
+def _fan_indices(n_vertices: int) -> array:
+    """Build the flat fan indices (0, i, i+1) for n_vertices vertices."""
+    return array(
+        "I", chain.from_iterable((0, i, i + 1) for i in range(1, n_vertices - 1))
+    )
+
+
+def compute_triangulation_many(
+    offsets, coords, eps: float = 1e-12
+) -> tuple[array, array, array, array]:
+    """Compute the triangulations of many PointSets in one call.
+
+    Meme resultat que compute_triangulation appele sur chaque PointSet,
+    sans conversion en dicts ni listes intermediaires: deduplication par
+    dict.fromkeys, indices d'eventail copies depuis un gabarit (tranches
+    d'array), sorties empaquetees.
+
+    Args:
+        offsets: Bornes des PointSets (len = nombre de PointSets + 1)
+        coords: Coordonnees a plat x0, y0, x1, y1, ... (liste ou array)
+        eps: Tolerance du test de colinearite
+
+    Returns:
+        Tuple (vertex_offsets, vertices, triangle_offsets, triangles):
+        le resultat s a les vertices vertex_offsets[s] .. [s + 1] - 1
+        (vertices: array float32 x, y a plat) et les triangles
+        triangle_offsets[s] .. [s + 1] - 1 (triangles: array uint32 a
+        plat, indices locaux au PointSet)
+
+    Raises:
+        ValueError: Si un PointSet a moins de 3 points uniques
+
+    """
+    vertex_offsets = array("Q", [0])
+    triangle_offsets = array("Q", [0])
+    vertices = array("f")
+    triangles = array("I")
+    fan = array("I")
+    for s in range(len(offsets) - 1):
+        start, end = 2 * offsets[s], 2 * offsets[s + 1]
+        unique = list(dict.fromkeys(zip(
+            coords[start:end:2], coords[start + 1 : end : 2], strict=True
+        )))
+        if len(unique) < 3:
+            raise ValueError(
+                f"PointSet {s}: au moins 3 points uniques sont requis "
+                "pour la triangulation"
+            )
+        vertices.extend(chain.from_iterable(unique))
+        vertex_offsets.append(len(vertices) // 2)
+        if not _is_collinear(unique, eps):
+            needed = 3 * (len(unique) - 2)
+            if len(fan) < needed:
+                fan = _fan_indices(max(len(unique), 2 * len(fan) // 3 + 2))
+            triangles.extend(fan[:needed])
+        triangle_offsets.append(len(triangles) // 3)
+    return vertex_offsets, vertices, triangle_offsets, triangles
+
+
+def serialize_triangulation_many(packed: tuple) -> list[bytes]:
+    """Serialize each result of compute_triangulation_many to Triangles.
+
+    Les blocs vertices et triangles sont copies tels quels depuis les
+    arrays (aucun struct.pack par valeur).
+
+    Args:
+        packed: Resultat de compute_triangulation_many
+
+    Returns:
+        Un binaire Triangles par PointSet
+
+    """
+    vertex_offsets, vertices, triangle_offsets, triangles = packed
+    out = []
+    for s in range(len(vertex_offsets) - 1):
+        v0, v1 = vertex_offsets[s], vertex_offsets[s + 1]
+        t0, t1 = triangle_offsets[s], triangle_offsets[s + 1]
+        out.append(b"".join((
+            struct.pack("<I", v1 - v0),
+            _to_le(vertices[2 * v0 : 2 * v1]),
+            struct.pack("<I", t1 - t0),
+            _to_le(triangles[3 * t0 : 3 * t1]),
+        )))
+    return out
+
+
 def serialize_triangulation(
     vertices: list[tuple[float, float]],
     triangles: list[tuple[int, int, int]],
@@ -127,13 +654,44 @@ def serialize_triangulation(
         Bytes du format binaire
 
     """
-    out = struct.pack("<I", len(vertices))
-    for x, y in vertices:
-        out += struct.pack("<ff", float(x), float(y))
+    out = bytearray(struct.pack("<I", len(vertices)))
+    _pack_into(out, "f", vertices, float)
     out += struct.pack("<I", len(triangles))
-    for a, b, c in triangles:
-        out += struct.pack("<III", int(a), int(b), int(c))
-    return out
+    _pack_into(out, "I", triangles, int)
+    return bytes(out)
+
+
+def triangulate_binary(
+    data, algorithm: str = "fan", tolerance: float | None = None
+) -> bytes:
+    """Trianguler un PointSet binaire de bout en bout (parse, calcul, binaire).
+
+    Fonction de module, sans etat: executable dans un processus de pool
+    (arguments et resultat en bytes).
+
+    Args:
+        data: Bytes du PointSet
+        algorithm: Algorithme de triangulation (voir ALGORITHMS)
+        tolerance: Distance de fusion des quasi-doublons; si donnee, la
+            section SECTION_VERTEX_MAP est ajoutee (None = aucune fusion)
+
+    Returns:
+        Bytes au format Triangles
+
+    Raises:
+        ValueError: Si format invalide ou moins de 3 points uniques
+        SnapToleranceError: Si la tolerance laisse moins de 3 vertices
+
+    """
+    points = parse_pointset(data)
+    mapping = None
+    if tolerance is not None:
+        points, mapping = snap_points(points, tolerance, min_vertices=3)
+    vertices, triangles = compute_triangulation(points, algorithm)
+    binary = serialize_triangulation(vertices, triangles)
+    if mapping is not None:
+        binary += vertex_map_section(mapping)
+    return binary
 
 
 def parse_triangulation(
@@ -142,6 +700,9 @@ def parse_triangulation(
     """Parser le format binaire en (vertices, triangles).
 
     Verifie la coherence des longueurs et leve ValueError si invalide.
+    Le format compact (prefixe COMPACT_MAGIC) est reconnu et decode par
+    parse_triangulation_compact. Les sections optionnelles qui suivent les
+    triangles sont validees puis ignorees (voir parse_sections).
 
     Args:
         binary: Bytes au format attendu
@@ -153,6 +714,8 @@ def parse_triangulation(
         ValueError: Si le format est invalide ou corrompu
 
     """
+    if bytes(binary[:4]) == COMPACT_MAGIC:
+        return parse_triangulation_compact(binary)
     if len(binary) < 4:
         raise ValueError("Binaire trop court: nombre de vertices manquant")
     off = 0
@@ -171,8 +734,9 @@ def parse_triangulation(
     n_tris = struct.unpack_from("<I", binary, off)[0]
     off += 4
     expected_tris_bytes = n_tris * 12
-    if len(binary) != off + expected_tris_bytes:
+    if len(binary) < off + expected_tris_bytes:
         raise ValueError("Longueur binaire invalide pour les triangles")
+    _split_sections(binary, off + expected_tris_bytes)
     tris = []
     for _i in range(n_tris):
         a, b, c = struct.unpack_from("<III", binary, off)
@@ -181,8 +745,639 @@ def parse_triangulation(
     return verts, tris
 
 
+# Format compact: en-tete de 12 octets
+# - 4 bytes: COMPACT_MAGIC
+# - uint8 version, uint8 flags, uint8 largeur d'indice (1, 2 ou 4), uint8 0
+# - uint32 LE: N = nombre de vertices
+# puis, si FLAG_QUANTIZED, la boite englobante (4 x float32 xmin ymin xmax ymax)
+# et N x (uint16 qx, uint16 qy); sinon N x (float32 x, float32 y)
+# puis uint32 T et 3T indices de la largeur annoncee (differences zigzag
+# avec l'indice de meme rang du triangle precedent si FLAG_DELTA)
+COMPACT_MAGIC = b"TRIC"
+COMPACT_VERSION = 1
+FLAG_QUANTIZED = 0x01
+FLAG_DELTA = 0x02
+_COMPACT_HEADER = struct.Struct("<4sBBBxI")
+_INDEX_CODES = {1: "B", 2: "H", 4: "I"}
+_QUANT_MAX = 0xFFFF
+
+
+def _to_le(values: array) -> bytes:
+    """Bytes little-endian d'un array (independant de la machine)."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(code: str, data, count: int, offset: int) -> array:
+    """Lire count valeurs little-endian de type code a partir de offset."""
+    values = array(code)
+    values.frombytes(data[offset : offset + count * values.itemsize])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _strided_from_le(code: str, data, offset: int, count: int, step: int) -> array:
+    """Lire une valeur sur step parmi count, sans copier les autres."""
+    itemsize = array(code).itemsize
+    end = offset + count * itemsize
+    with memoryview(data) as view, view.cast("B")[offset:end].cast(code) as typed:
+        values = array(code, typed[::step])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _index_width(max_value: int) -> int:
+    """Plus petite largeur (octets) capable de coder max_value."""
+    for width in (1, 2, 4):
+        if max_value < 1 << (8 * width):
+            return width
+    raise ValueError("Indice trop grand pour le format compact")
+
+
+def _zigzag_deltas(flat: list[int]) -> list[int]:
+    """Differences avec l'indice de meme rang du triangle precedent (zigzag)."""
+    out = flat[:3]
+    for k in range(3, len(flat)):
+        d = flat[k] - flat[k - 3]
+        out.append(d << 1 if d >= 0 else (-d << 1) - 1)
+    return out
+
+
+def _undo_zigzag_deltas(values: array) -> list[int]:
+    """Inverse de _zigzag_deltas (cumul par rang 0, 1 et 2)."""
+    if values.itemsize <= 2:
+        # Table de decodage zigzag: map en C plutot qu'une boucle Python
+        table = [(z >> 1) ^ -(z & 1) for z in range(1 << (8 * values.itemsize))]
+        unzigzag = table.__getitem__
+    else:
+        def unzigzag(z: int) -> int:
+            return (z >> 1) ^ -(z & 1)
+    lanes = []
+    for rank in range(3):
+        lane = values[rank::3]
+        if not lane:
+            lanes.append([])
+            continue
+        steps = map(unzigzag, lane[1:])
+        lanes.append(list(accumulate(steps, initial=lane[0])))
+    flat = [0] * len(values)
+    for rank in range(3):
+        flat[rank::3] = lanes[rank]
+    return flat
+
+
+def serialize_triangulation_compact(
+    vertices: list[tuple[float, float]],
+    triangles: list[tuple[int, int, int]],
+    quantize: bool = False,
+    delta: bool | None = None,
+) -> bytes:
+    """Serialize a triangulation to the compact binary format.
+
+    Les indices utilisent la plus petite largeur suffisante (uint8, uint16
+    ou uint32). Avec quantize, les coordonnees sont codees en uint16 dans
+    la boite englobante declaree (perte <= etendue / 65535 par axe).
+
+    Args:
+        vertices: Liste de (x, y)
+        triangles: Liste de (i, j, k) indices
+        quantize: Quantifier les coordonnees sur 16 bits
+        delta: Coder les indices en differences; None = seulement si les
+            indices deviennent plus etroits
+
+    Returns:
+        Bytes du format compact
+
+    """
+    flat = [int(v) for tri in triangles for v in tri]
+    width = _index_width(max(flat, default=0))
+    if delta is not False and flat:
+        deltas = _zigzag_deltas(flat)
+        delta_width = _index_width(max(deltas))
+        if delta or delta_width < width:
+            flat, width, delta = deltas, delta_width, True
+    flags = (FLAG_QUANTIZED if quantize else 0) | (FLAG_DELTA if delta else 0)
+
+    out = bytearray(_COMPACT_HEADER.pack(
+        COMPACT_MAGIC, COMPACT_VERSION, flags, width, len(vertices)
+    ))
+    coords = array("f", [float(v) for p in vertices for v in p])
+    if quantize:
+        xs, ys = coords[0::2], coords[1::2]
+        box = (min(xs, default=0.0), min(ys, default=0.0),
+               max(xs, default=0.0), max(ys, default=0.0))
+        out += struct.pack("<4f", *box)
+        sx = _QUANT_MAX / (box[2] - box[0]) if box[2] > box[0] else 0.0
+        sy = _QUANT_MAX / (box[3] - box[1]) if box[3] > box[1] else 0.0
+        quantized = array("H", [0]) * len(coords)
+        quantized[0::2] = array("H", [round((x - box[0]) * sx) for x in xs])
+        quantized[1::2] = array("H", [round((y - box[1]) * sy) for y in ys])
+        out += _to_le(quantized)
+    else:
+        out += _to_le(coords)
+    out += struct.pack("<I", len(triangles))
+    out += _to_le(array(_INDEX_CODES[width], flat))
+    return bytes(out)
+
+
+def parse_triangulation_compact(
+    binary: bytes,
+) -> tuple[list[tuple[float, float]], list[tuple[int, int, int]]]:
+    """Parser le format compact en (vertices, triangles).
+
+    Args:
+        binary: Bytes au format compact
+
+    Returns:
+        Tuple (vertices, triangles); coordonnees dequantifiees si besoin
+
+    Raises:
+        ValueError: Si le format est invalide ou corrompu
+
+    """
+    if len(binary) < _COMPACT_HEADER.size:
+        raise ValueError("Binaire compact trop court: en-tete manquant")
+    magic, version, flags, width, n_verts = _COMPACT_HEADER.unpack_from(binary, 0)
+    if magic != COMPACT_MAGIC or version != COMPACT_VERSION:
+        raise ValueError("En-tete de format compact invalide")
+    if width not in _INDEX_CODES:
+        raise ValueError(f"Largeur d'indice invalide: {width}")
+    off = _COMPACT_HEADER.size
+    quantized = bool(flags & FLAG_QUANTIZED)
+    verts_bytes = (16 + n_verts * 4) if quantized else n_verts * 8
+    if len(binary) < off + verts_bytes + 4:
+        raise ValueError(
+            "Binaire trop court: donnees vertices ou nombre de triangles manquant"
+        )
+    if quantized:
+        xmin, ymin, xmax, ymax = struct.unpack_from("<4f", binary, off)
+        q = _from_le("H", binary, 2 * n_verts, off + 16)
+        sx, sy = (xmax - xmin) / _QUANT_MAX, (ymax - ymin) / _QUANT_MAX
+        xs = [xmin + v * sx for v in q[0::2]]
+        ys = [ymin + v * sy for v in q[1::2]]
+    else:
+        coords = _from_le("f", binary, 2 * n_verts, off)
+        xs, ys = coords[0::2], coords[1::2]
+    verts = list(zip(xs, ys, strict=True))
+    off += verts_bytes
+    n_tris = struct.unpack_from("<I", binary, off)[0]
+    off += 4
+    if len(binary) < off + 3 * n_tris * width:
+        raise ValueError("Longueur binaire invalide pour les triangles")
+    _split_sections(binary, off + 3 * n_tris * width)
+    flat = _from_le(_INDEX_CODES[width], binary, 3 * n_tris, off)
+    if flags & FLAG_DELTA:
+        flat = _undo_zigzag_deltas(flat)
+    tris = list(zip(flat[0::3], flat[1::3], flat[2::3], strict=True))
+    return verts, tris
+
+
+def to_compact(binary: bytes, quantize: bool = False) -> bytes:
+    """Convertir un binaire Triangles standard au format compact.
+
+    Les sections optionnelles sont recopiees telles quelles.
+
+    Args:
+        binary: Bytes au format Triangles (bytes, memoryview ou mmap)
+        quantize: Quantifier les coordonnees sur 16 bits
+
+    Returns:
+        Bytes du format compact
+
+    Raises:
+        ValueError: Si le binaire source est invalide
+
+    """
+    vertices, triangles = parse_triangulation(binary)
+    compact = serialize_triangulation_compact(vertices, triangles, quantize=quantize)
+    return compact + bytes(binary[_payload_end(binary) :])
+
+
+# Sections optionnelles apres les triangles (formats standard et compact):
+# - 4 bytes: etiquette ASCII
+# - uint32 LE: L = taille du contenu
+# - L bytes: contenu
+_SECTION_HEADER = struct.Struct("<4sI")
+
+# Correspondance: uint32 N, N x uint32 (vertex de chaque point d'entree,
+# dans l'ordre du PointSet; voir snap_points)
+SECTION_VERTEX_MAP = b"VMAP"
+
+# Adjacence: uint32 T, 3T x int32 voisins (triangle de l'autre cote de
+# l'arete (v_k, v_k+1), -1 en bord), uint32 E, E x (uint32 a, uint32 b), a < b
+SECTION_ADJACENCY = b"ADJC"
+
+
+def _payload_end(binary) -> int:
+    """Offset de fin des triangles (debut des sections optionnelles)."""
+    if bytes(binary[:4]) == COMPACT_MAGIC:
+        _, _, flags, width, n_verts = _COMPACT_HEADER.unpack_from(binary, 0)
+        off = _COMPACT_HEADER.size
+        off += (16 + n_verts * 4) if flags & FLAG_QUANTIZED else n_verts * 8
+        return off + 4 + 3 * width * struct.unpack_from("<I", binary, off)[0]
+    off = 4 + 8 * struct.unpack_from("<I", binary, 0)[0]
+    return off + 4 + 12 * struct.unpack_from("<I", binary, off)[0]
+
+
+def _split_sections(binary, off: int) -> dict[bytes, bytes]:
+    """Decouper les sections a partir de off.
+
+    Raises:
+        ValueError: Si une section est tronquee ou si des octets trainent
+
+    """
+    sections = {}
+    while off < len(binary):
+        if len(binary) < off + _SECTION_HEADER.size:
+            raise ValueError("Longueur binaire invalide pour les triangles")
+        tag, size = _SECTION_HEADER.unpack_from(binary, off)
+        off += _SECTION_HEADER.size
+        if len(binary) < off + size:
+            raise ValueError(f"Section {tag!r} tronquee")
+        sections[tag] = bytes(binary[off : off + size])
+        off += size
+    return sections
+
+
+def parse_sections(binary) -> dict[bytes, bytes]:
+    """Sections optionnelles d'un binaire Triangles (standard ou compact).
+
+    Args:
+        binary: Bytes au format Triangles
+
+    Returns:
+        Dict {etiquette: contenu}, vide si aucune section
+
+    Raises:
+        ValueError: Si le format est invalide ou corrompu
+
+    """
+    if len(binary) < 4:
+        raise ValueError("Binaire trop court: nombre de vertices manquant")
+    return _split_sections(binary, _payload_end(binary))
+
+
+def compute_adjacency(flat) -> tuple[array, array]:
+    """Voisins par triangle et liste des aretes uniques, en une passe.
+
+    Args:
+        flat: Indices des triangles a plat (i0, j0, k0, i1, ...)
+
+    Returns:
+        Tuple (neighbors, edges): neighbors[3t + k] est le triangle de
+        l'autre cote de l'arete (v_k, v_k+1) de t (-1 en bord); edges
+        contient les aretes (a, b), a < b, a plat, dans l'ordre de
+        premiere apparition
+
+    """
+    neighbors = array("i", [-1]) * len(flat)
+    edges = array("I")
+    owner: dict = {}
+    stride = max(flat, default=0) + 1
+    for slot in range(len(flat)):
+        t, k = divmod(slot, 3)
+        u = flat[slot]
+        v = flat[slot + 1] if k < 2 else flat[slot - 2]
+        a, b = (u, v) if u < v else (v, u)
+        key = a * stride + b
+        other = owner.get(key)
+        if other is None:
+            owner[key] = slot
+            edges.append(a)
+            edges.append(b)
+        elif other >= 0:
+            # Arete partagee: lier les deux triangles
+            neighbors[slot] = other // 3
+            neighbors[other] = t
+            owner[key] = -1
+    return neighbors, edges
+
+
+def adjacency_section(binary) -> bytes:
+    """Section d'adjacence d'un binaire Triangles standard.
+
+    Les indices sont lus d'un bloc (array), sans tuples intermediaires.
+
+    Args:
+        binary: Bytes au format Triangles standard
+
+    Returns:
+        Section SECTION_ADJACENCY prete a etre ajoutee au binaire
+
+    """
+    off = 4 + 8 * struct.unpack_from("<I", binary, 0)[0]
+    n_tris = struct.unpack_from("<I", binary, off)[0]
+    neighbors, edges = compute_adjacency(_from_le("I", binary, 3 * n_tris, off + 4))
+    payload = b"".join((
+        struct.pack("<I", n_tris),
+        _to_le(neighbors),
+        struct.pack("<I", len(edges) // 2),
+        _to_le(edges),
+    ))
+    return _SECTION_HEADER.pack(SECTION_ADJACENCY, len(payload)) + payload
+
+
+def parse_adjacency(
+    payload: bytes,
+) -> tuple[list[tuple[int, int, int]], list[tuple[int, int]]]:
+    """Parser le contenu d'une section SECTION_ADJACENCY.
+
+    Args:
+        payload: Contenu de la section (voir parse_sections)
+
+    Returns:
+        Tuple (voisins par triangle, aretes (a, b))
+
+    Raises:
+        ValueError: Si le contenu est incoherent
+
+    """
+    if len(payload) < 8:
+        raise ValueError("Section d'adjacence invalide")
+    n_tris = struct.unpack_from("<I", payload, 0)[0]
+    off = 4 + 12 * n_tris
+    if len(payload) < off + 4:
+        raise ValueError("Section d'adjacence invalide")
+    n_edges = struct.unpack_from("<I", payload, off)[0]
+    if len(payload) != off + 4 + 8 * n_edges:
+        raise ValueError("Section d'adjacence invalide")
+    neighbors = _from_le("i", payload, 3 * n_tris, 4)
+    edges = _from_le("I", payload, 2 * n_edges, off + 4)
+    return (
+        list(zip(neighbors[0::3], neighbors[1::3], neighbors[2::3], strict=True)),
+        list(zip(edges[0::2], edges[1::2], strict=True)),
+    )
+
+
+def vertex_map_section(mapping) -> bytes:
+    """Section de correspondance points d'entree -> vertices.
+
+    Args:
+        mapping: Indice du vertex de chaque point d'entree (voir snap_points)
+
+    Returns:
+        Section SECTION_VERTEX_MAP prete a etre ajoutee au binaire
+
+    """
+    indices = mapping if isinstance(mapping, array) else array("I", mapping)
+    payload = struct.pack("<I", len(indices)) + _to_le(indices)
+    return _SECTION_HEADER.pack(SECTION_VERTEX_MAP, len(payload)) + payload
+
+
+def parse_vertex_map(payload: bytes) -> array:
+    """Parser le contenu d'une section SECTION_VERTEX_MAP.
+
+    Args:
+        payload: Contenu de la section (voir parse_sections)
+
+    Returns:
+        Array uint32: indice du vertex de chaque point d'entree
+
+    Raises:
+        ValueError: Si le contenu est incoherent
+
+    """
+    if len(payload) < 4:
+        raise ValueError("Section de correspondance invalide")
+    n_points = struct.unpack_from("<I", payload, 0)[0]
+    if len(payload) != 4 + 4 * n_points:
+        raise ValueError("Section de correspondance invalide")
+    return _from_le("I", payload, n_points, 4)
+
+
+# Delta entre deux binaires Triangles (base detenue par le client -> cible):
+# en-tete de 24 octets
+# - 4 bytes: DELTA_MAGIC, uint8 version, uint8 flags (0), 2 x uint8 0
+# - 4 x uint32 LE: vertices et triangles de la base, puis de la cible
+# puis, pour les vertices puis pour les triangles:
+# - uint32 R, R x (uint32 debut, uint32 longueur): segments de la cible,
+#   copies de la base a partir de debut, ou pris dans les ajouts si
+#   debut = DELTA_ADDED
+# - uint32 A, puis A vertices (float32 x, y) ou A triangles (3 x uint32,
+#   indices dans la cible)
+# Un triangle copie est renumerote par la correspondance des vertices.
+# Les elements de la base absents des segments sont supprimes.
+DELTA_MAGIC = b"TRID"
+DELTA_VERSION = 1
+DELTA_ADDED = 0xFFFFFFFF
+_DELTA_HEADER = struct.Struct("<4sBBxxIIII")
+
+
+def _copy_runs(sources) -> array:
+    """Segments (debut, longueur) d'une suite d'indices sources.
+
+    Les indices consecutifs forment un segment copie; les DELTA_ADDED
+    consecutifs, un segment d'ajouts.
+    """
+    runs = array("I")
+    for src in sources:
+        if runs and (
+            src == runs[-2] == DELTA_ADDED
+            or (runs[-2] != DELTA_ADDED and runs[-2] + runs[-1] == src)
+        ):
+            runs[-1] += 1
+        else:
+            runs.append(src)
+            runs.append(1)
+    return runs
+
+
+def _vertex_map(runs: array, n_base: int) -> array:
+    """Map each base vertex to its target index (-1 if removed)."""
+    vmap = array("i", [-1]) * n_base
+    target = 0
+    for start, length in zip(runs[0::2], runs[1::2], strict=True):
+        if start != DELTA_ADDED:
+            vmap[start : start + length] = array("i", range(target, target + length))
+        target += length
+    return vmap
+
+
+def triangulation_delta(base, target) -> bytes:
+    """Compute the delta that turns the base triangulation into target.
+
+    Les vertices sont apparies par coordonnees, les triangles par indices
+    apres renumerotation: apres une petite modification du PointSet, le
+    delta se reduit a quelques segments copies et aux seuls ajouts.
+
+    Args:
+        base: Bytes au format Triangles detenus par le client
+        target: Bytes au format Triangles a transmettre
+
+    Returns:
+        Bytes du delta (voir DELTA_MAGIC)
+
+    Raises:
+        ValueError: Si un des binaires est invalide
+
+    """
+    base_verts, base_tris = parse_triangulation(base)
+    verts, tris = parse_triangulation(target)
+
+    index = {v: i for i, v in enumerate(base_verts)}
+    vertex_runs = _copy_runs(index.get(v, DELTA_ADDED) for v in verts)
+    added_verts = array(
+        "f", chain.from_iterable(v for v in verts if v not in index)
+    )
+
+    vmap = _vertex_map(vertex_runs, len(base_verts))
+    copies: dict = {}
+    for s, (a, b, c) in enumerate(base_tris):
+        mapped = (vmap[a], vmap[b], vmap[c])
+        if -1 not in mapped:
+            copies.setdefault(mapped, s)
+    triangle_runs = _copy_runs(copies.get(t, DELTA_ADDED) for t in tris)
+    added_tris = array(
+        "I", chain.from_iterable(t for t in tris if t not in copies)
+    )
+
+    return b"".join((
+        _DELTA_HEADER.pack(
+            DELTA_MAGIC, DELTA_VERSION, 0,
+            len(base_verts), len(base_tris), len(verts), len(tris),
+        ),
+        struct.pack("<I", len(vertex_runs) // 2),
+        _to_le(vertex_runs),
+        struct.pack("<I", len(added_verts) // 2),
+        _to_le(added_verts),
+        struct.pack("<I", len(triangle_runs) // 2),
+        _to_le(triangle_runs),
+        struct.pack("<I", len(added_tris) // 3),
+        _to_le(added_tris),
+    ))
+
+
+def _read_block(delta, off: int, code: str, stride: int) -> tuple[array, int]:
+    """Lire un bloc "uint32 compte + compte x stride valeurs" du delta.
+
+    Raises:
+        ValueError: Si le bloc est tronque
+
+    """
+    if len(delta) < off + 4:
+        raise ValueError("Delta tronque")
+    count = struct.unpack_from("<I", delta, off)[0] * stride
+    values = _from_le(code, delta, count, off + 4)
+    if len(values) != count:
+        raise ValueError("Delta tronque")
+    return values, off + 4 + count * values.itemsize
+
+
+def apply_triangulation_delta(
+    base, delta
+) -> tuple[list[tuple[float, float]], list[tuple[int, int, int]]]:
+    """Reconstruire la triangulation cible a partir de la base et du delta.
+
+    Args:
+        base: Bytes au format Triangles (standard ou compact) de la base
+        delta: Bytes produits par triangulation_delta
+
+    Returns:
+        Tuple (vertices, triangles) de la cible, comme parse_triangulation
+
+    Raises:
+        ValueError: Si le delta est invalide ou calcule pour une autre base
+
+    """
+    if len(delta) < _DELTA_HEADER.size or bytes(delta[:4]) != DELTA_MAGIC:
+        raise ValueError("Delta invalide: en-tete manquant")
+    magic, version, _, n_base_verts, n_base_tris, n_verts, n_tris = (
+        _DELTA_HEADER.unpack_from(delta, 0)
+    )
+    if version != DELTA_VERSION:
+        raise ValueError(f"Version de delta non supportee: {version}")
+    base_verts, base_tris = parse_triangulation(base)
+    if (len(base_verts), len(base_tris)) != (n_base_verts, n_base_tris):
+        raise ValueError("Delta calcule pour une autre triangulation de base")
+
+    off = _DELTA_HEADER.size
+    vertex_runs, off = _read_block(delta, off, "I", 2)
+    added_verts, off = _read_block(delta, off, "f", 2)
+    triangle_runs, off = _read_block(delta, off, "I", 2)
+    added_tris, off = _read_block(delta, off, "I", 3)
+    if off != len(delta):
+        raise ValueError("Octets en trop apres le delta")
+
+    verts = _apply_runs(
+        vertex_runs, base_verts,
+        list(zip(added_verts[0::2], added_verts[1::2], strict=True)),
+    )
+    vmap = _vertex_map(vertex_runs, n_base_verts)
+    copied = []
+    for a, b, c in base_tris:
+        mapped = (vmap[a], vmap[b], vmap[c])
+        copied.append(None if -1 in mapped else mapped)
+    tris = _apply_runs(
+        triangle_runs, copied,
+        list(zip(added_tris[0::3], added_tris[1::3], added_tris[2::3], strict=True)),
+    )
+    if len(verts) != n_verts or len(tris) != n_tris or None in tris:
+        raise ValueError("Delta incoherent avec la triangulation de base")
+    if any(i >= n_verts for t in tris for i in t):
+        raise ValueError("Indice de triangle hors des vertices")
+    return verts, tris
+
+
+def _apply_runs(runs: array, source: list, added: list) -> list:
+    """Concatener les segments copies de source et les ajouts, dans l'ordre.
+
+    Raises:
+        ValueError: Si un segment sort de source ou des ajouts
+
+    """
+    out = []
+    taken = 0
+    for start, length in zip(runs[0::2], runs[1::2], strict=True):
+        if start == DELTA_ADDED:
+            segment = added[taken : taken + length]
+            taken += length
+        else:
+            segment = source[start : start + length]
+        if len(segment) != length:
+            raise ValueError("Segment de delta hors limites")
+        out += segment
+    if taken != len(added):
+        raise ValueError("Ajouts de delta non utilises")
+    return out
+
+
 __all__ = [
+    "ALGORITHMS",
+    "ALGORITHM_VERSION",
+    "COMPACT_MAGIC",
+    "DELTA_MAGIC",
+    "LOD_LEVELS",
+    "LOD_OVERSAMPLE",
+    "MIN_SNAP_TOLERANCE",
+    "SECTION_ADJACENCY",
+    "SECTION_VERTEX_MAP",
+    "SnapToleranceError",
+    "adjacency_section",
+    "compute_adjacency",
+    "parse_adjacency",
+    "parse_vertex_map",
+    "vertex_map_section",
+    "parse_sections",
+    "decimate_pointset",
+    "select_lod_level",
+    "parse_pointset",
+    "serialize_pointset",
+    "choose_algorithm",
     "compute_triangulation",
+    "snap_points",
+    "triangulate_binary",
+    "compute_triangulation_many",
+    "pack_pointsets",
     "serialize_triangulation",
+    "serialize_triangulation_many",
+    "serialize_triangulation_compact",
     "parse_triangulation",
+    "parse_triangulation_compact",
+    "to_compact",
+    "triangulation_delta",
+    "apply_triangulation_delta",
 ]
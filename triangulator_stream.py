@@ -0,0 +1,195 @@
+"""Triangulation hors memoire (out-of-core) de tres gros PointSets.
+
+Le PointSet est lu via mmap depuis un fichier au format binaire du contrat
+et le resultat est ecrit au fil de l'eau dans un fichier au format
+Triangles. La sortie est identique octet pour octet a
+serialize_triangulation(*compute_triangulation(points)).
+
+Memoire utilisee:
+- 1 bit par point d'entree (marquage des doublons)
+- un bucket a la fois pour la deduplication
+
+Etapes:
+1. Repartir les points dans des buckets temporaires selon le hash de leurs
+   coordonnees (deux points identiques tombent dans le meme bucket)
+2. Dedupliquer chaque bucket independamment en gardant la premiere
+   occurrence (plus petit index)
+3. Relire le PointSet dans l'ordre et ecrire les vertices conserves, en
+   testant la colinearite en flux
+4. Ecrire les triangles en eventail (0, i, i+1) par blocs
+"""
+
+import array
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+# Nombre de points traites par bloc lors des passes sequentielles
+_CHUNK_POINTS = 65536
+
+_RECORD = struct.Struct("<Iff")
+
+
+def _iter_chunks(data: mmap.mmap, n_points: int):
+    """Parcourir les points par blocs: (index du premier point, bytes du bloc)."""
+    for start in range(0, n_points, _CHUNK_POINTS):
+        stop = min(n_points, start + _CHUNK_POINTS)
+        yield start, data[4 + start * 8 : 4 + stop * 8]
+
+
+def _mark_duplicates(
+    data: mmap.mmap, n_points: int, bucket_points: int, tmp_dir: str | None
+) -> tuple[bytearray, int]:
+    """Marquer les doublons dans un bitmap (bit a 1 = point a ignorer).
+
+    Returns:
+        Tuple (bitmap, nombre de doublons)
+
+    """
+    dup = bytearray((n_points + 7) // 8)
+    n_buckets = max(1, -(-n_points // bucket_points))
+    if n_buckets == 1:
+        # Un seul bucket: pas besoin de fichiers temporaires
+        seen = set()
+        n_dup = 0
+        for start, chunk in _iter_chunks(data, n_points):
+            for offset, key in enumerate(struct.iter_unpack("<ff", chunk)):
+                if key in seen:
+                    i = start + offset
+                    dup[i >> 3] |= 1 << (i & 7)
+                    n_dup += 1
+                else:
+                    seen.add(key)
+        return dup, n_dup
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work:
+        files = [
+            open(os.path.join(work, f"bucket_{b}.bin"), "wb")  # noqa: SIM115
+            for b in range(n_buckets)
+        ]
+        try:
+            for start, chunk in _iter_chunks(data, n_points):
+                for offset, key in enumerate(struct.iter_unpack("<ff", chunk)):
+                    files[hash(key) % n_buckets].write(
+                        _RECORD.pack(start + offset, key[0], key[1])
+                    )
+        finally:
+            for f in files:
+                f.close()
+
+        n_dup = 0
+        for b in range(n_buckets):
+            path = os.path.join(work, f"bucket_{b}.bin")
+            with open(path, "rb") as f:
+                records = f.read()
+            os.unlink(path)
+            # Les index sont croissants dans un bucket: la premiere
+            # occurrence rencontree est celle a conserver
+            seen = set()
+            for i, x, y in _RECORD.iter_unpack(records):
+                if (x, y) in seen:
+                    dup[i >> 3] |= 1 << (i & 7)
+                    n_dup += 1
+                else:
+                    seen.add((x, y))
+    return dup, n_dup
+
+
+def _write_triangles(out, n_vertices: int) -> None:
+    """Ecrire les triangles en eventail (0, i, i+1) par blocs."""
+    for start in range(1, n_vertices - 1, _CHUNK_POINTS):
+        stop = min(n_vertices - 1, start + _CHUNK_POINTS)
+        block = array.array("I")
+        for i in range(start, stop):
+            block.extend((0, i, i + 1))
+        if sys.byteorder == "big":
+            block.byteswap()
+        out.write(block.tobytes())
+
+
+def triangulate_file(
+    pointset_path: str,
+    output_path: str,
+    bucket_points: int = 1_000_000,
+    tmp_dir: str | None = None,
+    eps: float = 1e-12,
+) -> tuple[int, int]:
+    """Trianguler un fichier PointSet vers un fichier Triangles, hors memoire.
+
+    Args:
+        pointset_path: Fichier au format binaire PointSet
+        output_path: Fichier de sortie au format Triangles
+        bucket_points: Nombre de points vises par bucket de deduplication
+        tmp_dir: Repertoire des fichiers temporaires (defaut: systeme)
+        eps: Tolerance numerique du test de colinearite
+
+    Returns:
+        Tuple (nombre de vertices, nombre de triangles) ecrits
+
+    Raises:
+        ValueError: Si le fichier est invalide ou s'il y a moins de
+            3 points uniques
+
+    """
+    if bucket_points < 1:
+        raise ValueError("bucket_points doit etre strictement positif")
+    with open(pointset_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < 4:
+            raise ValueError("Binaire trop court: nombre de points manquant")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        n_points = struct.unpack_from("<I", data, 0)[0]
+        if size != 4 + n_points * 8:
+            raise ValueError("Longueur binaire invalide pour les points")
+
+        dup, n_dup = _mark_duplicates(data, n_points, bucket_points, tmp_dir)
+        n_vertices = n_points - n_dup
+        if n_vertices < 3:
+            raise ValueError(
+                "Au moins 3 points uniques sont requis pour la triangulation"
+            )
+
+        out_dir = os.path.dirname(os.path.abspath(output_path))
+        fd, tmp_out = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(struct.pack("<I", n_vertices))
+                # Colinearite en flux: meme calcul que _is_collinear
+                first: list = []
+                collinear = True
+                for start, chunk in _iter_chunks(data, n_points):
+                    kept = bytearray()
+                    for offset, (x, y) in enumerate(struct.iter_unpack("<ff", chunk)):
+                        i = start + offset
+                        if dup[i >> 3] & (1 << (i & 7)):
+                            continue
+                        kept += chunk[offset * 8 : offset * 8 + 8]
+                        if len(first) < 2:
+                            first.append((x, y))
+                        elif collinear:
+                            (x0, y0), (x1, y1) = first
+                            area2 = (x1 - x0) * (y - y0) - (y1 - y0) * (x - x0)
+                            if abs(area2) > eps:
+                                collinear = False
+                    out.write(kept)
+
+                n_triangles = 0 if collinear else n_vertices - 2
+                out.write(struct.pack("<I", n_triangles))
+                if n_triangles:
+                    _write_triangles(out, n_vertices)
+            os.replace(tmp_out, output_path)
+        except BaseException:
+            if os.path.exists(tmp_out):
+                os.unlink(tmp_out)
+            raise
+    finally:
+        data.close()
+    return n_vertices, n_triangles
+
+
+__all__ = [
+    "triangulate_file",
+]